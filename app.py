@@ -1,18 +1,26 @@
 
 import streamlit as st
-import json
-import urllib.request
-import urllib.parse
-import re
-import hashlib
-import hmac
-import base64
-import time
 import pandas as pd
 import os
+import time
+from datetime import datetime, timezone
+from functools import partial
 from typing import Optional, Dict, List
 from dotenv import load_dotenv
 
+import cache
+import config
+import metrics
+import naver_api
+import normalize
+import profiling
+import rank_history
+import rank_scan
+import rate_limit
+import result_store
+import table_render
+import tracing
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -25,6 +33,9 @@ CUSTOMER_ID = os.getenv("NAVER_CUSTOMER_ID", "your_customer_id_here")
 API_KEY = os.getenv("NAVER_API_KEY", "your_api_key_here")
 SECRET_KEY = os.getenv("NAVER_SECRET_KEY", "your_secret_key_here")
 
+# 연관 키워드 표 한 페이지에 표시할 행 수
+KEYWORD_PAGE_SIZE = 500
+
 # 페이지 설정
 st.set_page_config(
     page_title="네이버 마케팅 도구",
@@ -116,157 +127,393 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def generate_signature(timestamp, method, uri, secret_key):
-    """네이버 광고 API 서명 생성"""
-    message = f"{timestamp}.{method}.{uri}"
-    signature = hmac.new(
-        secret_key.encode('utf-8'),
-        message.encode('utf-8'),
-        hashlib.sha256
-    ).digest()
-    return base64.b64encode(signature).decode('utf-8')
-
-
-def get_related_keywords(keyword: str) -> List[Dict]:
+def get_related_keywords(keyword: str, use_cache: bool = True) -> List[Dict]:
     """
     네이버 검색광고 API를 사용하여 연관 키워드 조회
     
     Args:
         keyword: 검색할 키워드
+        use_cache: False이면 저장된 통계를 건너뛰고 API를 다시 호출
     
     Returns:
         연관 키워드 리스트
     """
     try:
-        timestamp = str(int(time.time() * 1000))
-        method = "GET"
-        uri = f"/keywordstool"
-        
-        # 서명 생성
-        signature = generate_signature(timestamp, method, uri, SECRET_KEY)
-        
-        # API 요청
-        url = f"https://api.naver.com/keywordstool?hintKeywords={urllib.parse.quote(keyword)}&showDetail=1"
-        
-        request = urllib.request.Request(url)
-        request.add_header("X-Timestamp", timestamp)
-        request.add_header("X-API-KEY", API_KEY)
-        request.add_header("X-Customer", CUSTOMER_ID)
-        request.add_header("X-Signature", signature)
-        
-        with urllib.request.urlopen(request) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return data.get('keywordList', [])
+        data = naver_api.get_keywordstool(keyword, api_key=API_KEY, secret_key=SECRET_KEY,
+                                          customer_id=CUSTOMER_ID, use_cache=use_cache)
+        return data.get('keywordList', [])
             
     except Exception as e:
         st.error(f"연관 키워드 조회 실패: {str(e)}")
         # 대체 방법: 네이버 쇼핑 검색 결과에서 추출
-        return get_keywords_from_search(keyword)
+        return get_keywords_from_search(keyword, use_cache=use_cache)
 
 
-def get_keywords_from_search(keyword: str) -> List[Dict]:
+def get_keywords_from_search(keyword: str, use_cache: bool = True) -> List[Dict]:
     """
     네이버 쇼핑 검색 결과에서 연관 키워드 추출 (대체 방법)
     
+    이전 분석에서 연관 키워드로 받은 적 있는 단어는 저장된 월간 통계를 함께 표시합니다.
+    
     Args:
         keyword: 검색할 키워드
+        use_cache: False이면 캐시된 검색 결과를 건너뛰고 API를 다시 호출
     
     Returns:
         연관 키워드 리스트
     """
     try:
-        encText = urllib.parse.quote(keyword)
-        url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100"
+        result = naver_api.search_shop(keyword, display=100, client_id=CLIENT_ID, client_secret=CLIENT_SECRET,
+                                       use_cache=use_cache)
         
-        request = urllib.request.Request(url)
-        request.add_header("X-Naver-Client-Id", CLIENT_ID)
-        request.add_header("X-Naver-Client-Secret", CLIENT_SECRET)
+        # 상품명에서 키워드 추출
+        words = normalize.response_to_frame(result)["title"].str.split().explode().dropna()
+        keywords = set(words[words.str.len() >= 2])
         
-        with urllib.request.urlopen(request) as response:
-            result = json.loads(response.read())
-            
-            # 상품명에서 키워드 추출
-            keywords = set()
-            for item in result.get("items", []):
-                title = re.sub(r"<.*?>", "", item["title"])
-                words = title.split()
-                for word in words:
-                    if len(word) >= 2 and word not in keywords:
-                        keywords.add(word)
-            
-            # 딕셔너리 형태로 변환
-            return [{"relKeyword": kw, "monthlyPcQcCnt": "-", "monthlyMobileQcCnt": "-"} 
-                    for kw in sorted(list(keywords))[:50]]
+        # 딕셔너리 형태로 변환 (저장된 통계가 없으면 "-")
+        words = sorted(list(keywords))[:50]
+        known = cache.get_cached_keyword_stats(words)
+        return [dict(known[kw], relKeyword=kw) if kw in known
+                else {"relKeyword": kw, "monthlyPcQcCnt": "-", "monthlyMobileQcCnt": "-"}
+                for kw in words]
                     
     except Exception as e:
         st.error(f"키워드 추출 실패: {str(e)}")
         return []
 
 
-def get_top_ranked_product_by_mall(keyword: str, mall_name: str, progress_bar, status_text) -> Optional[Dict]:
+class UpdateThrottle:
+    """
+    화면 갱신 간격 제한
+
+    페이지마다 진행률을 보내면 웹소켓 메시지가 몰리므로, 마지막 갱신 후
+    interval초가 지났거나 강제(상품 발견, 검색 종료)한 경우에만 갱신합니다.
+    """
+    
+    def __init__(self, interval: float = config.RANK_UI_UPDATE_INTERVAL):
+        self.interval = interval
+        self._last = None
+    
+    def ready(self, force: bool = False) -> bool:
+        """지금 화면을 갱신해야 하면 True (첫 호출은 항상 True)"""
+        now = time.monotonic()
+        if force or self._last is None or now - self._last >= self.interval:
+            self._last = now
+            return True
+        return False
+
+
+def scan_fraction(progress: Optional[rank_scan.ScanProgress]) -> float:
+    """검색 진행률 (0~1, 종료된 검색은 1)"""
+    if progress is None:
+        return 0.0
+    if progress.finished:
+        return 1.0
+    return progress.pages_done / max(progress.pages_planned, 1)
+
+
+def overall_status_text(done: int, total: int, latest: Dict[str, rank_scan.ScanProgress]) -> str:
+    """여러 키워드 검색의 전체 진행 상황 (완료 키워드, 확인·건너뛴 페이지 수)"""
+    pages_done = sum(progress.pages_done for progress in latest.values())
+    pages_skipped = sum(progress.pages_skipped for progress in latest.values())
+    text = f"⏳ 전체 진행: {done}/{total} 키워드 · {pages_done}페이지 확인"
+    if pages_skipped:
+        text += f" · {pages_skipped}페이지 건너뜀"
+    return text
+
+
+def get_top_ranked_product_by_mall(keyword: str, mall_name: str, progress_bar, status_text,
+                                   concurrent: bool = False) -> Optional[rank_scan.ProductRecord]:
     """
     네이버 쇼핑에서 특정 키워드와 판매처명으로 최상위 순위 상품을 검색
     
+    페이지를 처리할 때마다 진행률을 갱신하되(간격 제한), 상품을 찾으면 남은 페이지를
+    기다리지 않고 바로 반환합니다.
+    
     Args:
         keyword: 검색 키워드
         mall_name: 판매처명
         progress_bar: Streamlit 진행률 바
         status_text: Streamlit 상태 텍스트
+        concurrent: True이면 10개 페이지를 병렬로 조회
     
     Returns:
-        최상위 순위 상품 정보 딕셔너리 또는 None
+        최상위 순위 상품(rank_scan.ProductRecord) 또는 None (API 오류는 예외로 전달)
     """
-    encText = urllib.parse.quote(keyword)
-    seen_titles = set()
-    best_product = None
+    throttle = UpdateThrottle()
+    progress = None
     
+    for progress in rank_scan.scan_best_product(keyword, mall_name, concurrent=concurrent,
+                                                prefetch=config.RANK_SCAN_PREFETCH):
+        if throttle.ready(force=progress.finished):
+            progress_bar.progress(scan_fraction(progress))
+            status_text.text(f"🔍 '{keyword}' 검색 중... ({progress.pages_done}/{progress.pages_planned} 페이지)")
+    
+    progress_bar.progress(1.0)
+    return progress.best
+
+
+def rank_change_text(previous: Dict, keyword: str, mall_name: str, rank: Optional[int]) -> str:
+    """직전 기록 대비 순위 변화 표시 문자열 (직전 기록이 없으면 빈 문자열)"""
+    key = (keyword, mall_name)
+    return rank_history.format_rank_change(previous.get(key), rank, has_previous=key in previous)
+
+
+def save_rank_history(records: List[Dict]):
+    """이번 순위 확인 결과를 기록 저장소에 한 번에 추가"""
     try:
-        for page_num, start in enumerate(range(1, 1001, 100), 1):
-            progress = page_num / 10
-            progress_bar.progress(progress)
-            status_text.text(f"🔍 '{keyword}' 검색 중... ({page_num}/10 페이지)")
-            
-            url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start={start}"
-            request = urllib.request.Request(url)
-            request.add_header("X-Naver-Client-Id", CLIENT_ID)
-            request.add_header("X-Naver-Client-Secret", CLIENT_SECRET)
-            
-            response = urllib.request.urlopen(request)
-            result = json.loads(response.read())
+        rank_history.append(records)
+    except Exception as e:
+        st.warning(f"⚠️ 순위 기록 저장 실패: {str(e)}")
+
+
+@metrics.timed("render.rank_result")
+def render_rank_result(keyword: str, result: Optional[rank_scan.ProductRecord], change: str = ""):
+    """키워드별 순위 확인 결과 박스 표시"""
+    change_html = f" <span>({change})</span>" if change else ""
+    if result:
+        price_text = f"{result.price:,}" if result.price is not None else "-"
+        with st.container():
+            st.markdown(f"""
+            <div class="result-box success-result">
+                <h4>✅ {keyword}</h4>
+                <p><strong>순위:</strong> {result.rank}위{change_html}</p>
+                <p><strong>상품명:</strong> {result.title}</p>
+                <p><strong>가격:</strong> {price_text}원</p>
+                <p><strong>판매처:</strong> {result.mall_name}</p>
+                <p><strong>링크:</strong> <a href="{result.link}" target="_blank">상품 보기</a></p>
+            </div>
+            """, unsafe_allow_html=True)
+    else:
+        with st.container():
+            st.markdown(f"""
+            <div class="result-box error-result">
+                <h4>❌ {keyword}</h4>
+                <p style="color: #ff4444;">검색 결과 없음{change_html}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+
+def check_ranks_sequential(keywords: List[str], mall_name: str, fast_scan: bool,
+                           overall_progress, overall_status, previous: Dict,
+                           history: List[Dict]) -> Dict[str, Optional[rank_scan.ProductRecord]]:
+    """키워드를 하나씩 차례대로 검색하며 결과 표시 (성공한 검색은 history에 기록 항목 추가)"""
+    results = {}
+    checked_at = datetime.now(timezone.utc)
+    
+    for idx, keyword in enumerate(keywords, 1):
+        overall_status.text(f"⏳ 전체 진행: {idx}/{len(keywords)} 키워드")
+        
+        keyword_progress = st.progress(0)
+        keyword_status = st.empty()
+        
+        try:
+            result = get_top_ranked_product_by_mall(keyword, mall_name, keyword_progress, keyword_status,
+                                                    concurrent=fast_scan)
+            history.append(rank_history.make_record(checked_at, keyword, mall_name, result))
+            change = rank_change_text(previous, keyword, mall_name, result.rank if result else None)
+        except Exception as e:
+            st.error(f"❌ 검색 중 오류 발생: {str(e)}")
+            result = None
+            change = ""
+        
+        results[keyword] = result
+        render_rank_result(keyword, result, change)
+        
+        keyword_status.empty()
+        keyword_progress.empty()
+        overall_progress.progress(idx / len(keywords))
+    
+    return results
+
+
+def check_ranks_parallel(keywords: List[str], mall_name: str, fast_scan: bool,
+                         overall_progress, overall_status, previous: Dict,
+                         history: List[Dict]) -> Dict[str, Optional[rank_scan.ProductRecord]]:
+    """
+    여러 키워드를 동시에 검색하고, 찾는 즉시 결과 표시
+    
+    작업 스레드에서는 Streamlit 요소를 건드리지 않고 검색만 수행하며,
+    페이지별 중간 결과를 받아 화면 갱신은 모두 호출 스레드에서 처리합니다.
+    """
+    found = {}
+    latest = {}
+    done = 0
+    checked_at = datetime.now(timezone.utc)
+    throttle = UpdateThrottle()
+    workers = max(1, min(config.RANK_KEYWORD_WORKERS, len(keywords)))
+    overall_status.text(f"⏳ 전체 진행: 0/{len(keywords)} 키워드")
+    
+    scans = {
+        keyword: partial(rank_scan.scan_best_product, keyword, mall_name, fast_scan,
+                         prefetch=config.RANK_SCAN_PREFETCH)
+        for keyword in keywords
+    }
+    
+    for keyword, progress, error in rank_scan.stream_scans(scans, workers):
+        finished = error is not None or progress.finished
+        if progress is not None:
+            latest[keyword] = progress
+        
+        if finished:
+            done += 1
+            if error is not None:
+                st.error(f"❌ '{keyword}' 검색 중 오류 발생: {str(error)}")
+                result = None
+                change = ""
+            else:
+                result = progress.best
+                history.append(rank_history.make_record(checked_at, keyword, mall_name, result))
+                change = rank_change_text(previous, keyword, mall_name, result.rank if result else None)
             
-            for idx, item in enumerate(result.get("items", []), start=1):
-                if item.get("mallName") and mall_name in item["mallName"]:
-                    title_clean = re.sub(r"<.*?>", "", item["title"])
-                    
-                    if title_clean in seen_titles:
-                        continue
-                    
-                    seen_titles.add(title_clean)
-                    rank = start + idx - 1
-                    
-                    product = {
-                        "rank": rank,
-                        "title": title_clean,
-                        "price": item["lprice"],
-                        "link": item["link"],
-                        "mallName": item["mallName"]
-                    }
-                    
-                    if not best_product or rank < best_product["rank"]:
-                        best_product = product
+            found[keyword] = result
+            render_rank_result(keyword, result, change)
+        
+        if throttle.ready(force=finished):
+            overall_status.text(overall_status_text(done, len(keywords), latest))
+            overall_progress.progress(
+                sum(1.0 if keyword in found else scan_fraction(latest.get(keyword)) for keyword in keywords)
+                / len(keywords)
+            )
+    
+    # 입력 순서대로 결과 딕셔너리 구성
+    return {keyword: found[keyword] for keyword in keywords}
+
+
+@metrics.timed("rank.matrix")
+def build_rank_matrix(keywords: List[str], mall_names: List[str],
+                      found: Dict[str, Dict[str, Optional[rank_scan.ProductRecord]]]) -> pd.DataFrame:
+    """키워드 × 판매처 순위 행렬 (아직 찾지 못했거나 1000위 안에 없으면 <NA>)"""
+    return pd.DataFrame(
+        [[product.rank if product else None
+          for product in (found.get(keyword, {}).get(m) for m in mall_names)]
+         for keyword in keywords],
+        index=pd.Index(keywords, name="키워드"),
+        columns=mall_names,
+        dtype="Int64"
+    )
+
+
+def check_mall_matrix(keywords: List[str], mall_names: List[str], fast_scan: bool,
+                      overall_progress, overall_status, history: List[Dict]) -> pd.DataFrame:
+    """
+    키워드별 검색 결과를 한 번씩만 조회하여 여러 판매처의 순위를 계산
+    
+    검색이 끝나기 전에도 지금까지 찾은 순위를 표로 표시합니다(간격 제한).
+    
+    Returns:
+        키워드 × 판매처 순위 행렬 (1000위 안에 없으면 None)
+    """
+    found = {}
+    found_counts = {}
+    latest = {}
+    failed = set()
+    done = 0
+    checked_at = datetime.now(timezone.utc)
+    throttle = UpdateThrottle()
+    workers = max(1, min(config.RANK_KEYWORD_WORKERS, len(keywords)))
+    overall_status.text(f"⏳ 전체 진행: 0/{len(keywords)} 키워드")
+    partial_table = st.empty()
+    
+    scans = {
+        keyword: partial(rank_scan.scan_best_products_by_mall, keyword, mall_names, fast_scan,
+                         prefetch=config.RANK_SCAN_PREFETCH)
+        for keyword in keywords
+    }
+    
+    for keyword, progress, error in rank_scan.stream_scans(scans, workers):
+        finished = error is not None or progress.finished
+        if progress is not None:
+            latest[keyword] = progress
+            found[keyword] = progress.best
         
-        progress_bar.progress(1.0)
-        return best_product
+        if finished:
+            done += 1
+            if error is not None:
+                st.error(f"❌ '{keyword}' 검색 중 오류 발생: {str(error)}")
+                found[keyword] = {mall_name: None for mall_name in mall_names}
+                failed.add(keyword)
+            else:
+                history.extend(rank_history.make_record(checked_at, keyword, mall_name, product)
+                               for mall_name, product in found[keyword].items())
         
-    except Exception as e:
-        st.error(f"❌ 검색 중 오류 발생: {str(e)}")
-        return None
+        # 새로 찾은 판매처가 있거나 키워드가 끝나면 간격과 관계없이 바로 표시
+        found_count = sum(1 for product in found[keyword].values() if product) if keyword in found else 0
+        newly_found = found_count > found_counts.get(keyword, 0)
+        found_counts[keyword] = found_count
+        
+        if throttle.ready(force=finished or newly_found):
+            overall_status.text(overall_status_text(done, len(keywords), latest))
+            # 오류로 끝난 키워드도 완료로 계산해야 전체 진행률이 1에 도달
+            overall_progress.progress(
+                sum(1.0 if keyword in failed else scan_fraction(latest.get(keyword)) for keyword in keywords)
+                / len(keywords)
+            )
+            partial_table.dataframe(build_rank_matrix(keywords, mall_names, found), use_container_width=True)
+    
+    partial_table.empty()
+    return build_rank_matrix(keywords, mall_names, found)
 
 
+@metrics.timed("render.rank_matrix")
+def render_mall_matrix(matrix: pd.DataFrame, keywords_input: str, previous: Dict):
+    """키워드 × 판매처 순위 행렬(직전 기록 대비 변화 포함)과 CSV 다운로드 표시"""
+    def cell_text(keyword, mall_name, rank):
+        rank = None if pd.isna(rank) else int(rank)
+        change = rank_change_text(previous, keyword, mall_name, rank)
+        text = f"{rank}위" if rank is not None else "-"
+        return f"{text} {change}" if change else text
+    
+    st.dataframe(
+        pd.DataFrame(
+            # 라벨 대신 위치로 순회 (같은 키워드가 두 행이어도 셀 하나씩 처리)
+            [[cell_text(keyword, mall_name, rank) for mall_name, rank in zip(matrix.columns, ranks)]
+             for keyword, *ranks in matrix.itertuples(name=None)],
+            index=matrix.index,
+            columns=matrix.columns
+        ),
+        use_container_width=True
+    )
+    
+    st.markdown("### 📈 판매처별 요약")
+    summary_cols = st.columns(min(len(matrix.columns), 5))
+    for idx, mall_name in enumerate(matrix.columns):
+        ranks = matrix[mall_name].dropna()
+        with summary_cols[idx % len(summary_cols)]:
+            st.metric(
+                mall_name,
+                f"{len(ranks)}/{len(matrix)} 키워드",
+                f"최고 {int(ranks.min())}위" if len(ranks) else "순위 없음",
+                delta_color="off"
+            )
+    
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        csv_data = matrix.reset_index().to_csv(index=False, encoding='utf-8-sig')
+        st.download_button(
+            label="📥 CSV 다운로드",
+            data=csv_data,
+            file_name=f"{keywords_input.split(',')[0].strip()}_판매처별순위.csv",
+            mime="text/csv",
+            use_container_width=True,
+            key="rank_matrix_download"
+        )
+
+
+@metrics.timed("tab.rank")
 def rank_checker_tab():
     """순위 확인 탭"""
     st.markdown("### 📝 검색 정보 입력")
     
+    rank_mode = st.radio(
+        "검색 방식",
+        ["단일 판매처", "여러 판매처 비교"],
+        horizontal=True,
+        help="여러 판매처 비교는 키워드별 검색 결과를 한 번만 조회하여 모든 판매처의 순위를 함께 계산합니다.",
+        key="rank_mode"
+    )
+    multi_mall = rank_mode == "여러 판매처 비교"
+    
     col1, col2 = st.columns([2, 1])
     
     with col1:
@@ -280,13 +527,24 @@ def rank_checker_tab():
     
     with col2:
         mall_name = st.text_input(
-            "판매처명",
-            placeholder="예: OO스토어",
+            "판매처명 (최대 10개, 쉼표로 구분)" if multi_mall else "판매처명",
+            placeholder="예: OO스토어, XX마켓" if multi_mall else "예: OO스토어",
             help="순위를 확인할 판매처 이름을 입력하세요.",
             key="rank_mall"
         )
         
-        st.markdown("<br>", unsafe_allow_html=True)
+        fast_scan = st.checkbox(
+            "⚡ 빠른 검색 (페이지 동시 조회)",
+            value=True,
+            help="첫 페이지 이후 남은 페이지(최대 1000위)를 동시에 조회하여 키워드당 대기 시간을 줄입니다.",
+            key="rank_fast_scan"
+        )
+        parallel_keywords = st.checkbox(
+            "🚀 키워드 동시 검색",
+            value=True,
+            help="여러 키워드를 동시에 검색하고 상품을 찾는 즉시 결과를 표시합니다.",
+            key="rank_parallel_keywords"
+        )
         search_button = st.button("🔍 순위 확인", use_container_width=True, key="rank_search")
     
     if search_button:
@@ -294,7 +552,8 @@ def rank_checker_tab():
             st.error("⚠️ 검색어와 판매처명을 모두 입력해주세요.")
             return
         
-        keywords = [k.strip() for k in keywords_input.split(",") if k.strip()]
+        # 같은 키워드를 두 번 입력해도 한 번만 조회 (판매처명과 같은 방식)
+        keywords = list(dict.fromkeys(k.strip() for k in keywords_input.split(",") if k.strip()))
         
         if not keywords:
             st.error("⚠️ 올바른 검색어를 입력해주세요.")
@@ -304,50 +563,49 @@ def rank_checker_tab():
             st.error("⚠️ 검색어는 최대 10개까지만 입력 가능합니다.")
             return
         
+        # 키워드당 최대 10페이지를 조회하므로 남은 일일 한도 미리 확인
+        remaining = rate_limit.remaining_quota("search", CLIENT_ID)
+        if remaining is not None and remaining < len(keywords) * 10:
+            st.warning(f"⚠️ 오늘 남은 검색 API 호출 수({remaining:,}회)가 부족하여 일부 키워드는 조회되지 않을 수 있습니다.")
+        
+        if multi_mall:
+            mall_names = list(dict.fromkeys(m.strip() for m in mall_name.split(",") if m.strip()))
+            
+            if not mall_names:
+                st.error("⚠️ 올바른 판매처명을 입력해주세요.")
+                return
+            
+            if len(mall_names) > 10:
+                st.error("⚠️ 판매처명은 최대 10개까지만 입력 가능합니다.")
+                return
+        
         st.markdown("---")
         st.markdown("### 📊 검색 결과")
         
-        results = {}
         overall_progress = st.progress(0)
         overall_status = st.empty()
         
-        for idx, keyword in enumerate(keywords, 1):
-            overall_status.text(f"⏳ 전체 진행: {idx}/{len(keywords)} 키워드")
-            
-            keyword_progress = st.progress(0)
-            keyword_status = st.empty()
-            
-            result = get_top_ranked_product_by_mall(keyword, mall_name, keyword_progress, keyword_status)
-            
-            if result:
-                results[keyword] = result
-                
-                with st.container():
-                    st.markdown(f"""
-                    <div class="result-box success-result">
-                        <h4>✅ {keyword}</h4>
-                        <p><strong>순위:</strong> {result['rank']}위</p>
-                        <p><strong>상품명:</strong> {result['title']}</p>
-                        <p><strong>가격:</strong> {int(result['price']):,}원</p>
-                        <p><strong>판매처:</strong> {result['mallName']}</p>
-                        <p><strong>링크:</strong> <a href="{result['link']}" target="_blank">상품 보기</a></p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                results[keyword] = None
-                
-                with st.container():
-                    st.markdown(f"""
-                    <div class="result-box error-result">
-                        <h4>❌ {keyword}</h4>
-                        <p style="color: #ff4444;">검색 결과 없음</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            keyword_status.empty()
-            keyword_progress.empty()
-            overall_progress.progress(idx / len(keywords))
+        # 순위 변화 표시는 기록 전체가 아닌 (키워드, 판매처)별 최신 순위 요약에서 조회
+        history = []
         
+        if multi_mall:
+            previous = rank_history.last_rank_lookup([(k, m) for k in keywords for m in mall_names])
+            matrix = check_mall_matrix(keywords, mall_names, fast_scan, overall_progress, overall_status,
+                                       history)
+            save_rank_history(history)
+            overall_status.text("✅ 모든 검색 완료!")
+            render_mall_matrix(matrix, keywords_input, previous)
+            return
+        
+        previous = rank_history.last_rank_lookup([(k, mall_name) for k in keywords])
+        if parallel_keywords and len(keywords) > 1:
+            results = check_ranks_parallel(keywords, mall_name, fast_scan, overall_progress, overall_status,
+                                           previous, history)
+        else:
+            results = check_ranks_sequential(keywords, mall_name, fast_scan, overall_progress, overall_status,
+                                             previous, history)
+        
+        save_rank_history(history)
         overall_status.text("✅ 모든 검색 완료!")
         
         st.markdown("---")
@@ -362,8 +620,324 @@ def rank_checker_tab():
             st.metric("발견된 상품", found_count)
         with col3:
             st.metric("미발견 상품", len(keywords) - found_count)
+        
+        remaining = rate_limit.remaining_quota("search", CLIENT_ID)
+        if remaining is not None:
+            st.caption(f"📡 오늘 남은 검색 API 호출 수: {remaining:,} / {rate_limit.LIMITERS['search'].daily_quota:,}회")
+
+
+def load_stored_result(name: str, query: Optional[str], fetch, refresh_key: str) -> Optional[Dict]:
+    """
+    탭 결과를 세션 결과 저장소에서 가져오고 조회 시각과 새로고침 버튼 표시
+
+    Args:
+        name: 결과 저장소 이름 (탭별)
+        query: 조회 버튼을 누른 경우 조회어, 아니면 None (마지막 결과 사용)
+        fetch: fetch(조회어, use_cache)로 API를 호출하고 저장된 결과를 반환하는 함수 (실패 시 None)
+        refresh_key: 새로고침 버튼 위젯 키
+
+    Returns:
+        {"query", "frame", "fetched_at"} 또는 None (표시할 결과 없음)
+    """
+    if query:
+        # 이미 조회한 조회어는 저장된 결과를 사용하고, 처음 조회하는 경우에만 API 호출
+        entry = result_store.get(name, query) or fetch(query)
+    else:
+        entry = result_store.current(name)
+    
+    if entry is None:
+        return None
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns([4, 1])
+    with col2:
+        refresh = st.button("🔄 새로고침", key=refresh_key, use_container_width=True,
+                            help="API에서 최신 결과를 다시 가져옵니다.")
+    
+    if refresh:
+        # API 캐시도 건너뛰고 다시 가져오며, 실패하면 기존 결과 유지
+        entry = fetch(entry["query"], use_cache=False) or entry
+    
+    with col1:
+        fetched_at = entry["fetched_at"].astimezone()
+        st.caption(f"🕒 '{entry['query']}' 조회 결과 · {result_store.age_text(entry['fetched_at'])} "
+                   f"({fetched_at:%H:%M:%S} 조회) · 필터·정렬은 저장된 결과에서 처리됩니다.")
+    
+    return entry
+
+
+def keyword_stats_csv(df: pd.DataFrame) -> str:
+    """키워드 통계 전체를 CSV로 변환 (숫자는 서식 없이, 10 미만 검색수는 "< 10")"""
+    export = pd.DataFrame({
+        '순번': df['rank'],
+        '연관키워드': df['keyword'],
+        'PC 월간검색수': df['pc_search'].astype(object).mask(df['pc_search_below_10'], normalize.BELOW_10_TEXT),
+        '모바일 월간검색수': df['mobile_search'].astype(object).mask(df['mobile_search_below_10'],
+                                                                normalize.BELOW_10_TEXT),
+        'PC 월평균클릭수': df['pc_click'],
+        '모바일 월평균클릭수': df['mobile_click'],
+        'PC 월평균클릭률': df['pc_ctr'],
+        '모바일 월평균클릭률': df['mobile_ctr'],
+        '경쟁정도': df['comp_idx'],
+        '월평균노출광고수': df['avg_ads'],
+    })
+    return export.to_csv(index=False, encoding='utf-8-sig')
+
+
+def fetch_keyword_results(keyword: str, use_cache: bool = True) -> Optional[Dict]:
+    """연관 키워드 통계를 조회하여 세션 결과 저장소에 저장 (결과가 없으면 None)"""
+    with st.spinner(f"'{keyword}' 키워드 분석 중..."):
+        related_keywords = get_related_keywords(keyword, use_cache=use_cache)
+    
+    if not related_keywords:
+        st.warning("⚠️ 연관 키워드를 찾을 수 없습니다.")
+        return None
+    
+    # 숫자 컬럼은 정렬·합계용으로 타입 유지, 표시 문자열은 보이는 행만 생성
+    return result_store.put("keywords", keyword, normalize.keyword_list_to_frame(related_keywords))
+
+
+@metrics.timed("render.keywords")
+def render_keyword_results(entry: Dict):
+    """저장된 연관 키워드 결과에 필터·정렬·페이지를 적용하여 표시 (API를 호출하지 않음)"""
+    df = entry["frame"]
+    keyword_input = entry["query"]
+    
+    st.success(f"✅ {len(df)}개의 연관 키워드를 찾았습니다!")
+    
+    # 필터 및 정렬 옵션
+    col1, col2, col3 = st.columns([1, 1, 2])
+    
+    with col1:
+        sort_option = st.selectbox(
+            "📊 정렬 기준",
+            ["순번", "연관키워드", "PC 월간검색수", "모바일 월간검색수", "전체 검색량"],
+            key="sort_option"
+        )
+    
+    with col2:
+        sort_order = st.selectbox(
+            "📈 정렬 방향",
+            ["내림차순 ↓", "오름차순 ↑"],
+            key="sort_order"
+        )
+    
+    with col3:
+        search_filter = st.text_input(
+            "🔍 키워드 필터링",
+            placeholder="특정 키워드 검색...",
+            key="keyword_filter"
+        )
+    
+    # 필터링
+    if search_filter:
+        df = df[df['keyword'].str.contains(search_filter, case=False, na=False, regex=False)]
+    
+    # 정렬 ("< 10"은 0, 값이 없으면 맨 뒤)
+    ascending = (sort_order == "오름차순 ↑")
+    sort_columns = {
+        "PC 월간검색수": 'pc_search',
+        "모바일 월간검색수": 'mobile_search',
+        "전체 검색량": 'total_search',
+        "연관키워드": 'keyword',
+        "순번": 'rank',
+    }
+    df = df.sort_values(sort_columns[sort_option], ascending=ascending, kind="stable")
+    
+    # 통계 정보
+    st.markdown("### 📈 통계 요약")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("전체 키워드", len(df))
+    
+    with col2:
+        total_pc = int(df['pc_search'].sum())
+        st.metric("총 PC 검색량", f"{total_pc:,}" if total_pc > 0 else "-")
+    
+    with col3:
+        total_mobile = int(df['mobile_search'].sum())
+        st.metric("총 모바일 검색량", f"{total_mobile:,}" if total_mobile > 0 else "-")
+    
+    with col4:
+        total_all = int(df['total_search'].sum())
+        st.metric("총 검색량", f"{total_all:,}" if total_all > 0 else "-")
+    
+    # 테이블 표시
+    st.markdown("### 📋 연관 키워드 목록")
+    
+    # 행이 많으면 페이지로 나누고, 표시용 문자열은 현재 페이지에만 적용
+    page = 1
+    page_count = max(1, -(-len(df) // KEYWORD_PAGE_SIZE))
+    if page_count > 1:
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            # 필터로 페이지 수가 바뀌면 1페이지부터 다시 표시
+            page = st.number_input("📄 페이지", min_value=1, max_value=page_count, value=1, step=1,
+                                   key=f"keyword_page_{page_count}")
+        with col2:
+            st.markdown("<br>", unsafe_allow_html=True)
+            first = (page - 1) * KEYWORD_PAGE_SIZE
+            st.caption(f"전체 {len(df):,}개 중 {first + 1:,}~{min(first + KEYWORD_PAGE_SIZE, len(df)):,}번째 "
+                       f"({page}/{page_count} 페이지) · CSV에는 전체가 포함됩니다.")
+    
+    start = (page - 1) * KEYWORD_PAGE_SIZE
+    display_df = normalize.format_keyword_stats(df.iloc[start:start + KEYWORD_PAGE_SIZE]).reset_index(drop=True)
+    
+    # HTML 테이블 생성 (헤더 고정)
+    table_html = """
+    <style>
+        .keyword-table-wrapper {
+            border-radius: 8px;
+            overflow: hidden;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            margin-bottom: 1rem;
+        }
+        .keyword-table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.85rem;
+        }
+        .keyword-table thead th {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 12px 8px;
+            text-align: center;
+            font-weight: 600;
+            position: sticky;
+            top: 0;
+            z-index: 10;
+            border-right: 1px solid rgba(255,255,255,0.2);
+            font-size: 0.8rem;
+        }
+        .keyword-table thead th:last-child {
+            border-right: none;
+        }
+        .keyword-table tbody tr {
+            border-bottom: 1px solid #f0f0f0;
+            transition: background-color 0.2s;
+        }
+        .keyword-table tbody tr:hover {
+            background-color: #f0f7ff;
+        }
+        .keyword-table tbody tr:nth-child(even) {
+            background-color: #fafafa;
+        }
+        .keyword-table td {
+            padding: 10px 8px;
+            border-right: 1px solid #f0f0f0;
+        }
+        .keyword-table td:last-child {
+            border-right: none;
+        }
+        .table-container {
+            max-height: 500px;
+            overflow-y: auto;
+            overflow-x: auto;
+        }
+        .table-container::-webkit-scrollbar {
+            width: 8px;
+            height: 8px;
+        }
+        .table-container::-webkit-scrollbar-track {
+            background: #f1f1f1;
+        }
+        .table-container::-webkit-scrollbar-thumb {
+            background: #888;
+            border-radius: 4px;
+        }
+        .table-container::-webkit-scrollbar-thumb:hover {
+            background: #555;
+        }
+        .num-col {
+            text-align: center;
+            color: #666;
+            font-weight: 500;
+        }
+        .keyword-col {
+            font-weight: 600;
+            color: #03C75A;
+            text-align: left;
+        }
+        .count-col {
+            text-align: right;
+            color: #333;
+        }
+        .center-col {
+            text-align: center;
+            color: #666;
+        }
+    </style>
+    <div class="keyword-table-wrapper">
+        <div class="table-container">
+            <table class="keyword-table">
+                <thead>
+                    <tr>
+                        <th rowspan="2" style="width: 5%;">순번</th>
+                        <th rowspan="2" style="width: 15%;">연관키워드</th>
+                        <th colspan="2" style="border-bottom: 1px solid rgba(255,255,255,0.3);">월간검색수</th>
+                        <th colspan="2" style="border-bottom: 1px solid rgba(255,255,255,0.3);">월평균클릭수</th>
+                        <th colspan="2" style="border-bottom: 1px solid rgba(255,255,255,0.3);">월평균클릭률</th>
+                        <th rowspan="2" style="width: 8%;">경쟁<br>정도</th>
+                        <th rowspan="2" style="width: 10%;">월평균<br>노출광고수</th>
+                    </tr>
+                    <tr>
+                        <th style="width: 10%;">💻 PC</th>
+                        <th style="width: 10%;">📱 모바일</th>
+                        <th style="width: 10%;">💻 PC</th>
+                        <th style="width: 10%;">📱 모바일</th>
+                        <th style="width: 10%;">💻 PC</th>
+                        <th style="width: 10%;">📱 모바일</th>
+                    </tr>
+                </thead>
+                <tbody>
+    """
+    
+    table_html += table_render.render_rows([
+        table_render.elements(display_df['순번'], css_class="num-col"),
+        table_render.elements(display_df['연관키워드'], css_class="keyword-col"),
+        table_render.elements(display_df['PC 월간검색수'], css_class="count-col"),
+        table_render.elements(display_df['모바일 월간검색수'], css_class="count-col"),
+        table_render.elements(display_df['PC 월평균클릭수'], css_class="count-col"),
+        table_render.elements(display_df['모바일 월평균클릭수'], css_class="count-col"),
+        table_render.elements(display_df['PC 월평균클릭률'], css_class="count-col"),
+        table_render.elements(display_df['모바일 월평균클릭률'], css_class="count-col"),
+        table_render.elements(display_df['경쟁정도'], css_class="center-col"),
+        table_render.elements(display_df['월평균노출광고수'], css_class="count-col"),
+    ])
+    
+    table_html += """
+                </tbody>
+            </table>
+        </div>
+    </div>
+    """
+    
+    st.markdown(table_html, unsafe_allow_html=True)
+    
+    # 키워드 클라우드 (선택적 표시)
+    with st.expander("🏷️ 키워드 태그 클라우드 보기"):
+        keywords_html = "".join(
+            table_render.elements(display_df['연관키워드'].head(50), tag="span",
+                                  css_class="keyword-chip").to_pylist()
+        )
+        st.markdown(f'<div style="line-height: 2.5;">{keywords_html}</div>', unsafe_allow_html=True)
+    
+    # CSV 다운로드
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        csv_data = keyword_stats_csv(df)
+        st.download_button(
+            label="📥 CSV 다운로드",
+            data=csv_data,
+            file_name=f"{keyword_input}_연관키워드.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
 
 
+@metrics.timed("tab.keywords")
 def keyword_analysis_tab():
     """키워드 분석 탭"""
     st.markdown("### 🔎 키워드 분석")
@@ -382,300 +956,285 @@ def keyword_analysis_tab():
         st.markdown("<br>", unsafe_allow_html=True)
         analyze_button = st.button("📊 분석하기", use_container_width=True, key="analysis_search")
     
-    if analyze_button:
-        if not keyword_input:
-            st.error("⚠️ 키워드를 입력해주세요.")
-            return
-        
-        st.markdown("---")
-        
-        with st.spinner(f"'{keyword_input}' 키워드 분석 중..."):
-            related_keywords = get_related_keywords(keyword_input)
-        
-        if related_keywords:
-            st.success(f"✅ {len(related_keywords)}개의 연관 키워드를 찾았습니다!")
-            
-            # 데이터프레임 생성
-            df_data = []
-            for idx, kw in enumerate(related_keywords, 1):
-                keyword_text = kw.get('relKeyword', '')
-                
-                # 월간검색수
-                pc_search = kw.get('monthlyPcQcCnt', '-')
-                mobile_search = kw.get('monthlyMobileQcCnt', '-')
-                
-                # 월평균클릭수
-                pc_click = kw.get('monthlyAvePcClkCnt', '-')
-                mobile_click = kw.get('monthlyAveMobileClkCnt', '-')
-                
-                # 월평균클릭률
-                pc_ctr = kw.get('monthlyAvePcCtr', '-')
-                mobile_ctr = kw.get('monthlyAveMobileCtr', '-')
-                
-                # 경쟁정도
-                comp_idx = kw.get('compIdx', '-')
-                
-                # 월평균노출광고수
-                avg_ads = kw.get('monthlyAveImpsCnt', '-')
-                
-                # 숫자 변환 (정렬용)
-                try:
-                    pc_search_num = int(pc_search) if str(pc_search).isdigit() else 0
-                    mobile_search_num = int(mobile_search) if str(mobile_search).isdigit() else 0
-                    total_search = pc_search_num + mobile_search_num
-                except:
-                    pc_search_num = 0
-                    mobile_search_num = 0
-                    total_search = 0
-                
-                df_data.append({
-                    '순번': idx,
-                    '연관키워드': keyword_text,
-                    'PC 월간검색수': pc_search if pc_search == '-' else f'{pc_search_num:,}',
-                    '모바일 월간검색수': mobile_search if mobile_search == '-' else f'{mobile_search_num:,}',
-                    'PC 월평균클릭수': pc_click if pc_click == '-' else (f'{int(pc_click):,}' if str(pc_click).replace('.', '').isdigit() else pc_click),
-                    '모바일 월평균클릭수': mobile_click if mobile_click == '-' else (f'{int(mobile_click):,}' if str(mobile_click).replace('.', '').isdigit() else mobile_click),
-                    'PC 월평균클릭률': pc_ctr if pc_ctr == '-' else f'{float(pc_ctr):.2f}%' if str(pc_ctr).replace('.', '').isdigit() else pc_ctr,
-                    '모바일 월평균클릭률': mobile_ctr if mobile_ctr == '-' else f'{float(mobile_ctr):.2f}%' if str(mobile_ctr).replace('.', '').isdigit() else mobile_ctr,
-                    '경쟁정도': comp_idx,
-                    '월평균노출광고수': avg_ads if avg_ads == '-' else (f'{int(avg_ads):,}' if str(avg_ads).replace('.', '').isdigit() else avg_ads),
-                    '_pc_num': pc_search_num,
-                    '_mobile_num': mobile_search_num,
-                    '_total_num': total_search
-                })
-            
-            df = pd.DataFrame(df_data)
-            
-            # 필터 및 정렬 옵션
-            col1, col2, col3 = st.columns([1, 1, 2])
-            
-            with col1:
-                sort_option = st.selectbox(
-                    "📊 정렬 기준",
-                    ["순번", "연관키워드", "PC 월간검색수", "모바일 월간검색수", "전체 검색량"],
-                    key="sort_option"
-                )
-            
-            with col2:
-                sort_order = st.selectbox(
-                    "📈 정렬 방향",
-                    ["내림차순 ↓", "오름차순 ↑"],
-                    key="sort_order"
-                )
-            
-            with col3:
-                search_filter = st.text_input(
-                    "🔍 키워드 필터링",
-                    placeholder="특정 키워드 검색...",
-                    key="keyword_filter"
-                )
-            
-            # 필터링
-            if search_filter:
-                df = df[df['연관키워드'].str.contains(search_filter, case=False, na=False)]
-            
-            # 정렬
-            ascending = (sort_order == "오름차순 ↑")
-            
-            if sort_option == "PC 월간검색수":
-                df = df.sort_values('_pc_num', ascending=ascending)
-            elif sort_option == "모바일 월간검색수":
-                df = df.sort_values('_mobile_num', ascending=ascending)
-            elif sort_option == "전체 검색량":
-                df = df.sort_values('_total_num', ascending=ascending)
-            elif sort_option == "연관키워드":
-                df = df.sort_values('연관키워드', ascending=ascending)
-            else:  # 순번
-                df = df.sort_values('순번', ascending=ascending)
-            
-            # 숨김 컬럼 제거
-            display_df = df[[
-                '순번', '연관키워드', 
-                'PC 월간검색수', '모바일 월간검색수',
-                'PC 월평균클릭수', '모바일 월평균클릭수',
-                'PC 월평균클릭률', '모바일 월평균클릭률',
-                '경쟁정도', '월평균노출광고수'
-            ]].reset_index(drop=True)
-            
-            # 통계 정보
-            st.markdown("### 📈 통계 요약")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("전체 키워드", len(display_df))
-            
-            with col2:
-                total_pc = df['_pc_num'].sum()
-                st.metric("총 PC 검색량", f"{total_pc:,}" if total_pc > 0 else "-")
-            
-            with col3:
-                total_mobile = df['_mobile_num'].sum()
-                st.metric("총 모바일 검색량", f"{total_mobile:,}" if total_mobile > 0 else "-")
-            
-            with col4:
-                total_all = df['_total_num'].sum()
-                st.metric("총 검색량", f"{total_all:,}" if total_all > 0 else "-")
-            
-            # 테이블 표시
-            st.markdown("### 📋 연관 키워드 목록")
-            
-            # HTML 테이블 생성 (헤더 고정)
-            table_html = """
-            <style>
-                .keyword-table-wrapper {
-                    border-radius: 8px;
-                    overflow: hidden;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                    margin-bottom: 1rem;
-                }
-                .keyword-table {
-                    width: 100%;
-                    border-collapse: collapse;
-                    font-size: 0.85rem;
-                }
-                .keyword-table thead th {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 12px 8px;
-                    text-align: center;
-                    font-weight: 600;
-                    position: sticky;
-                    top: 0;
-                    z-index: 10;
-                    border-right: 1px solid rgba(255,255,255,0.2);
-                    font-size: 0.8rem;
-                }
-                .keyword-table thead th:last-child {
-                    border-right: none;
-                }
-                .keyword-table tbody tr {
-                    border-bottom: 1px solid #f0f0f0;
-                    transition: background-color 0.2s;
-                }
-                .keyword-table tbody tr:hover {
-                    background-color: #f0f7ff;
-                }
-                .keyword-table tbody tr:nth-child(even) {
-                    background-color: #fafafa;
-                }
-                .keyword-table td {
-                    padding: 10px 8px;
-                    border-right: 1px solid #f0f0f0;
-                }
-                .keyword-table td:last-child {
-                    border-right: none;
-                }
-                .table-container {
-                    max-height: 500px;
-                    overflow-y: auto;
-                    overflow-x: auto;
-                }
-                .table-container::-webkit-scrollbar {
-                    width: 8px;
-                    height: 8px;
-                }
-                .table-container::-webkit-scrollbar-track {
-                    background: #f1f1f1;
-                }
-                .table-container::-webkit-scrollbar-thumb {
-                    background: #888;
-                    border-radius: 4px;
-                }
-                .table-container::-webkit-scrollbar-thumb:hover {
-                    background: #555;
-                }
-                .num-col {
-                    text-align: center;
-                    color: #666;
-                    font-weight: 500;
-                }
-                .keyword-col {
-                    font-weight: 600;
-                    color: #03C75A;
-                    text-align: left;
-                }
-                .count-col {
-                    text-align: right;
-                    color: #333;
-                }
-                .center-col {
-                    text-align: center;
-                    color: #666;
-                }
-            </style>
-            <div class="keyword-table-wrapper">
-                <div class="table-container">
-                    <table class="keyword-table">
-                        <thead>
-                            <tr>
-                                <th rowspan="2" style="width: 5%;">순번</th>
-                                <th rowspan="2" style="width: 15%;">연관키워드</th>
-                                <th colspan="2" style="border-bottom: 1px solid rgba(255,255,255,0.3);">월간검색수</th>
-                                <th colspan="2" style="border-bottom: 1px solid rgba(255,255,255,0.3);">월평균클릭수</th>
-                                <th colspan="2" style="border-bottom: 1px solid rgba(255,255,255,0.3);">월평균클릭률</th>
-                                <th rowspan="2" style="width: 8%;">경쟁<br>정도</th>
-                                <th rowspan="2" style="width: 10%;">월평균<br>노출광고수</th>
-                            </tr>
-                            <tr>
-                                <th style="width: 10%;">💻 PC</th>
-                                <th style="width: 10%;">📱 모바일</th>
-                                <th style="width: 10%;">💻 PC</th>
-                                <th style="width: 10%;">📱 모바일</th>
-                                <th style="width: 10%;">💻 PC</th>
-                                <th style="width: 10%;">📱 모바일</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-            """
-            
-            for _, row in display_df.iterrows():
-                table_html += f"""
-                            <tr>
-                                <td class="num-col">{row['순번']}</td>
-                                <td class="keyword-col">{row['연관키워드']}</td>
-                                <td class="count-col">{row['PC 월간검색수']}</td>
-                                <td class="count-col">{row['모바일 월간검색수']}</td>
-                                <td class="count-col">{row['PC 월평균클릭수']}</td>
-                                <td class="count-col">{row['모바일 월평균클릭수']}</td>
-                                <td class="count-col">{row['PC 월평균클릭률']}</td>
-                                <td class="count-col">{row['모바일 월평균클릭률']}</td>
-                                <td class="center-col">{row['경쟁정도']}</td>
-                                <td class="count-col">{row['월평균노출광고수']}</td>
-                            </tr>
-                """
+    if analyze_button and not keyword_input:
+        st.error("⚠️ 키워드를 입력해주세요.")
+        return
+    
+    # 필터·정렬·페이지를 바꿔 다시 실행되어도 저장된 결과를 그대로 사용
+    entry = load_stored_result("keywords", keyword_input if analyze_button else None,
+                               fetch_keyword_results, refresh_key="analysis_refresh")
+    if entry is not None:
+        render_keyword_results(entry)
+
+
+def fetch_shopping_results(keyword: str, use_cache: bool = True) -> Optional[Dict]:
+    """쇼핑 순위 1~100위를 조회하여 세션 결과 저장소에 저장 (실패하거나 결과가 없으면 None)"""
+    with st.spinner(f"'{keyword}' 순위 조회 중..."):
+        try:
+            # 100개 상품 조회 (API는 최대 100개까지 한 번에 조회 가능)
+            result = naver_api.search_shop(keyword, display=100, start=1, sort="sim",
+                                           client_id=CLIENT_ID, client_secret=CLIENT_SECRET,
+                                           use_cache=use_cache)
             
-            table_html += """
-                        </tbody>
-                    </table>
-                </div>
+            # 정규화 후 중복 상품 제거 (같은 상품명은 상위 순위만 유지)
+            df = normalize.shopping_frame(normalize.response_to_frame(result))
+        except Exception as e:
+            st.error(f"❌ 검색 중 오류 발생: {str(e)}")
+            return None
+    
+    if df.empty:
+        st.warning("⚠️ 검색 결과가 없습니다.")
+        return None
+    
+    return result_store.put("shopping", keyword, df)
+
+
+@metrics.timed("render.shopping")
+def render_shopping_results(entry: Dict):
+    """저장된 쇼핑 순위 결과에 필터·정렬을 적용하여 표시 (API를 호출하지 않음)"""
+    df = entry["frame"]
+    keyword_input = entry["query"]
+    
+    st.success(f"✅ 상위 {len(df)}위까지 상품을 찾았습니다!")
+    
+    # 필터 옵션
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        sort_option = st.selectbox(
+            "📊 정렬 기준",
+            ["네이버 순위", "최저가 낮은순", "최저가 높은순"],
+            key="shopping_sort"
+        )
+    
+    with col2:
+        mall_filter = st.text_input(
+            "🏪 판매처 필터",
+            placeholder="판매처명 검색...",
+            key="mall_filter"
+        )
+    
+    with col3:
+        brand_filter = st.text_input(
+            "🏷️ 브랜드 필터",
+            placeholder="브랜드명 검색...",
+            key="brand_filter"
+        )
+    
+    with col4:
+        product_filter = st.text_input(
+            "🔍 상품명 필터",
+            placeholder="상품명 검색...",
+            key="product_filter"
+        )
+    
+    # 필터링
+    filtered_df = df.copy()
+    if mall_filter:
+        filtered_df = filtered_df[filtered_df['판매처'].str.contains(mall_filter, case=False, na=False, regex=False)]
+    if brand_filter:
+        filtered_df = filtered_df[filtered_df['브랜드'].str.contains(brand_filter, case=False, na=False, regex=False)]
+    if product_filter:
+        filtered_df = filtered_df[filtered_df['상품명'].str.contains(product_filter, case=False, na=False, regex=False)]
+    
+    # 정렬
+    if sort_option == "최저가 낮은순":
+        filtered_df = filtered_df.sort_values('_price_num', ascending=True)
+        # 정렬 후 순위 재지정
+        filtered_df['순위'] = range(1, len(filtered_df) + 1)
+    elif sort_option == "최저가 높은순":
+        filtered_df = filtered_df.sort_values('_price_num', ascending=False)
+        # 정렬 후 순위 재지정
+        filtered_df['순위'] = range(1, len(filtered_df) + 1)
+    else:  # 네이버 순위
+        filtered_df = filtered_df.sort_values('_original_rank', ascending=True)
+        # 네이버 원래 순위 유지
+        filtered_df['순위'] = filtered_df['_original_rank']
+    
+    df = filtered_df.reset_index(drop=True)
+    
+    # 통계 요약
+    st.markdown("### 📈 통계 요약")
+    
+    if len(df) > 0:
+        col1, col2, col3, col4 = st.columns(4)
+    
+        with col1:
+            st.metric("조회된 상품수", f"{len(df)}개")
+    
+        with col2:
+            avg_price = df['_price_num'].mean()
+            st.metric("평균 가격", f"{int(avg_price):,}원")
+    
+        with col3:
+            min_price = df['_price_num'].min()
+            st.metric("최저 가격", f"{int(min_price):,}원")
+    
+        with col4:
+            max_price = df['_price_num'].max()
+            st.metric("최고 가격", f"{int(max_price):,}원")
+    else:
+        st.warning("⚠️ 필터 조건에 맞는 상품이 없습니다.")
+    
+    # 테이블 표시
+    if len(df) > 0:
+        st.markdown("### 📋 상품 순위 (1~100위)")
+    
+        # HTML 테이블 생성
+        table_html = """
+        <style>
+            .shopping-table-wrapper {
+                border-radius: 8px;
+                overflow: hidden;
+                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+                margin-bottom: 1rem;
+            }
+            .shopping-table {
+                width: 100%;
+                border-collapse: collapse;
+                font-size: 0.85rem;
+            }
+            .shopping-table thead th {
+                background: linear-gradient(135deg, #03C75A 0%, #02b350 100%);
+                color: white;
+                padding: 12px 8px;
+                text-align: center;
+                font-weight: 600;
+                position: sticky;
+                top: 0;
+                z-index: 10;
+                border-right: 1px solid rgba(255,255,255,0.2);
+            }
+            .shopping-table thead th:last-child {
+                border-right: none;
+            }
+            .shopping-table tbody tr {
+                border-bottom: 1px solid #f0f0f0;
+                transition: background-color 0.2s;
+            }
+            .shopping-table tbody tr:hover {
+                background-color: #e8f5e9;
+            }
+            .shopping-table tbody tr:nth-child(even) {
+                background-color: #fafafa;
+            }
+            .shopping-table td {
+                padding: 10px 8px;
+                border-right: 1px solid #f0f0f0;
+            }
+            .shopping-table td:last-child {
+                border-right: none;
+            }
+            .shopping-container {
+                max-height: 600px;
+                overflow-y: auto;
+                overflow-x: auto;
+            }
+            .shopping-container::-webkit-scrollbar {
+                width: 8px;
+                height: 8px;
+            }
+            .shopping-container::-webkit-scrollbar-track {
+                background: #f1f1f1;
+            }
+            .shopping-container::-webkit-scrollbar-thumb {
+                background: #03C75A;
+                border-radius: 4px;
+            }
+            .shopping-container::-webkit-scrollbar-thumb:hover {
+                background: #02b350;
+            }
+            .rank-col {
+                text-align: center;
+                font-weight: bold;
+                color: #666;
+            }
+            .rank-1 { color: #FFD700; font-size: 1.1rem; }
+            .rank-2 { color: #C0C0C0; font-size: 1.05rem; }
+            .rank-3 { color: #CD7F32; font-size: 1.05rem; }
+            .product-col {
+                text-align: left;
+                color: #333;
+            }
+            .price-col {
+                text-align: right;
+                font-weight: 600;
+                color: #03C75A;
+            }
+            .mall-col {
+                text-align: center;
+                color: #666;
+            }
+            .link-btn {
+                display: inline-block;
+                padding: 4px 12px;
+                background: #03C75A;
+                color: white;
+                text-decoration: none;
+                border-radius: 4px;
+                font-size: 0.8rem;
+                transition: background 0.2s;
+            }
+            .link-btn:hover {
+                background: #02b350;
+            }
+        </style>
+        <div class="shopping-table-wrapper">
+            <div class="shopping-container">
+                <table class="shopping-table">
+                    <thead>
+                        <tr>
+                            <th style="width: 6%;">순위</th>
+                            <th style="width: 35%;">상품명</th>
+                            <th style="width: 12%;">최저가</th>
+                            <th style="width: 15%;">판매처</th>
+                            <th style="width: 12%;">브랜드</th>
+                            <th style="width: 15%;">카테고리</th>
+                            <th style="width: 5%;">링크</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+        """
+    
+        # 1~3위는 메달 색상 클래스, 나머지는 기본 순위 클래스
+        rank_class = ("rank-" + df['순위'].astype(str)).where(df['순위'] <= 3, "rank-col")
+    
+        table_html += table_render.render_rows([
+            table_render.elements(df['순위'], css_class=rank_class),
+            table_render.elements(df['상품명'], css_class="product-col"),
+            table_render.elements(table_render.format_number(df['최저가'], suffix="원"),
+                                  css_class="price-col"),
+            table_render.elements(df['판매처'], css_class="mall-col"),
+            table_render.elements(df['브랜드'], css_class="mall-col"),
+            table_render.elements(df['카테고리'], css_class="mall-col", style="font-size: 0.75rem;"),
+            table_render.elements(table_render.links(df['링크'], "보기", css_class="link-btn"),
+                                  style="text-align: center;", escape=False),
+        ])
+    
+        table_html += """
+                    </tbody>
+                </table>
             </div>
-            """
-            
-            st.markdown(table_html, unsafe_allow_html=True)
-            
-            # 키워드 클라우드 (선택적 표시)
-            with st.expander("🏷️ 키워드 태그 클라우드 보기"):
-                keywords_html = "".join([
-                    f'<span class="keyword-chip">{row["연관키워드"]}</span>'
-                    for _, row in display_df.head(50).iterrows()
-                ])
-                st.markdown(f'<div style="line-height: 2.5;">{keywords_html}</div>', unsafe_allow_html=True)
-            
-            # CSV 다운로드
-            col1, col2 = st.columns([3, 1])
-            with col2:
-                csv_data = display_df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 CSV 다운로드",
-                    data=csv_data,
-                    file_name=f"{keyword_input}_연관키워드.csv",
-                    mime="text/csv",
-                    use_container_width=True
-                )
-        else:
-            st.warning("⚠️ 연관 키워드를 찾을 수 없습니다.")
+        </div>
+        """
+    
+        st.markdown(table_html, unsafe_allow_html=True)
+    
+        # CSV 다운로드
+        col1, col2 = st.columns([3, 1])
+        with col2:
+            csv_df = df[['순위', '상품명', '최저가', '판매처', '브랜드', '카테고리', '링크']]
+            csv_data = csv_df.to_csv(index=False, encoding='utf-8-sig')
+            st.download_button(
+                label="📥 CSV 다운로드",
+                data=csv_data,
+                file_name=f"{keyword_input}_쇼핑순위.csv",
+                mime="text/csv",
+                use_container_width=True
+            )
 
 
+@metrics.timed("tab.shopping")
 def shopping_rank_tab():
     """네이버 쇼핑 순위 1~100위 탭"""
     st.markdown("### 🛍️ 네이버 쇼핑 순위 조회")
@@ -694,306 +1253,15 @@ def shopping_rank_tab():
         st.markdown("<br>", unsafe_allow_html=True)
         search_button = st.button("🔍 순위 조회", use_container_width=True, key="shopping_search")
     
-    if search_button:
-        if not keyword_input:
-            st.error("⚠️ 검색 키워드를 입력해주세요.")
-            return
-        
-        st.markdown("---")
-        
-        with st.spinner(f"'{keyword_input}' 순위 조회 중..."):
-            # 1~100위 데이터 가져오기
-            encText = urllib.parse.quote(keyword_input)
-            products = []
-            
-            try:
-                # 100개 상품 조회 (API는 최대 100개까지 한 번에 조회 가능)
-                url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start=1&sort=sim"
-                request = urllib.request.Request(url)
-                request.add_header("X-Naver-Client-Id", CLIENT_ID)
-                request.add_header("X-Naver-Client-Secret", CLIENT_SECRET)
-                
-                response = urllib.request.urlopen(request)
-                result = json.loads(response.read())
-                
-                # 중복 제거를 위한 set
-                seen_titles = set()
-                
-                for item in result.get("items", []):
-                    title_clean = re.sub(r"<.*?>", "", item["title"])
-                    
-                    # 중복 상품 제거
-                    if title_clean in seen_titles:
-                        continue
-                    seen_titles.add(title_clean)
-                    
-                    products.append({
-                        '상품명': title_clean,
-                        '최저가': int(item.get("lprice", 0)),
-                        '판매처': item.get("mallName", "-"),
-                        '브랜드': item.get("brand", "-"),
-                        '카테고리': item.get("category1", "-") + " > " + item.get("category2", "-") if item.get("category2") else item.get("category1", "-"),
-                        '링크': item.get("link", ""),
-                        '_price_num': int(item.get("lprice", 0))
-                    })
-                    
-                    # 100개가 되면 중단
-                    if len(products) >= 100:
-                        break
-                
-                if products:
-                    # 데이터프레임 생성
-                    df = pd.DataFrame(products)
-                    
-                    # 원래 순위 추가 (1위부터 시작)
-                    df.insert(0, '순위', range(1, len(df) + 1))
-                    df['_original_rank'] = df['순위']  # 원래 순위 백업
-                    
-                    st.success(f"✅ 상위 {len(products)}위까지 상품을 찾았습니다!")
-                    
-                    # 필터 옵션
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        sort_option = st.selectbox(
-                            "📊 정렬 기준",
-                            ["네이버 순위", "최저가 낮은순", "최저가 높은순"],
-                            key="shopping_sort"
-                        )
-                    
-                    with col2:
-                        mall_filter = st.text_input(
-                            "🏪 판매처 필터",
-                            placeholder="판매처명 검색...",
-                            key="mall_filter"
-                        )
-                    
-                    with col3:
-                        brand_filter = st.text_input(
-                            "🏷️ 브랜드 필터",
-                            placeholder="브랜드명 검색...",
-                            key="brand_filter"
-                        )
-                    
-                    with col4:
-                        product_filter = st.text_input(
-                            "🔍 상품명 필터",
-                            placeholder="상품명 검색...",
-                            key="product_filter"
-                        )
-                    
-                    # 필터링
-                    filtered_df = df.copy()
-                    if mall_filter:
-                        filtered_df = filtered_df[filtered_df['판매처'].str.contains(mall_filter, case=False, na=False)]
-                    if brand_filter:
-                        filtered_df = filtered_df[filtered_df['브랜드'].str.contains(brand_filter, case=False, na=False)]
-                    if product_filter:
-                        filtered_df = filtered_df[filtered_df['상품명'].str.contains(product_filter, case=False, na=False)]
-                    
-                    # 정렬
-                    if sort_option == "최저가 낮은순":
-                        filtered_df = filtered_df.sort_values('_price_num', ascending=True)
-                        # 정렬 후 순위 재지정
-                        filtered_df['순위'] = range(1, len(filtered_df) + 1)
-                    elif sort_option == "최저가 높은순":
-                        filtered_df = filtered_df.sort_values('_price_num', ascending=False)
-                        # 정렬 후 순위 재지정
-                        filtered_df['순위'] = range(1, len(filtered_df) + 1)
-                    else:  # 네이버 순위
-                        filtered_df = filtered_df.sort_values('_original_rank', ascending=True)
-                        # 네이버 원래 순위 유지
-                        filtered_df['순위'] = filtered_df['_original_rank']
-                    
-                    df = filtered_df.reset_index(drop=True)
-                    
-                    # 통계 요약
-                    st.markdown("### 📈 통계 요약")
-                    
-                    if len(df) > 0:
-                        col1, col2, col3, col4 = st.columns(4)
-                        
-                        with col1:
-                            st.metric("조회된 상품수", f"{len(df)}개")
-                        
-                        with col2:
-                            avg_price = df['_price_num'].mean()
-                            st.metric("평균 가격", f"{int(avg_price):,}원")
-                        
-                        with col3:
-                            min_price = df['_price_num'].min()
-                            st.metric("최저 가격", f"{int(min_price):,}원")
-                        
-                        with col4:
-                            max_price = df['_price_num'].max()
-                            st.metric("최고 가격", f"{int(max_price):,}원")
-                    else:
-                        st.warning("⚠️ 필터 조건에 맞는 상품이 없습니다.")
-                    
-                    # 테이블 표시
-                    if len(df) > 0:
-                        st.markdown("### 📋 상품 순위 (1~100위)")
-                        
-                        # HTML 테이블 생성
-                        table_html = """
-                        <style>
-                            .shopping-table-wrapper {
-                                border-radius: 8px;
-                                overflow: hidden;
-                                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                                margin-bottom: 1rem;
-                            }
-                            .shopping-table {
-                                width: 100%;
-                                border-collapse: collapse;
-                                font-size: 0.85rem;
-                            }
-                            .shopping-table thead th {
-                                background: linear-gradient(135deg, #03C75A 0%, #02b350 100%);
-                                color: white;
-                                padding: 12px 8px;
-                                text-align: center;
-                                font-weight: 600;
-                                position: sticky;
-                                top: 0;
-                                z-index: 10;
-                                border-right: 1px solid rgba(255,255,255,0.2);
-                            }
-                            .shopping-table thead th:last-child {
-                                border-right: none;
-                            }
-                            .shopping-table tbody tr {
-                                border-bottom: 1px solid #f0f0f0;
-                                transition: background-color 0.2s;
-                            }
-                            .shopping-table tbody tr:hover {
-                                background-color: #e8f5e9;
-                            }
-                            .shopping-table tbody tr:nth-child(even) {
-                                background-color: #fafafa;
-                            }
-                            .shopping-table td {
-                                padding: 10px 8px;
-                                border-right: 1px solid #f0f0f0;
-                            }
-                            .shopping-table td:last-child {
-                                border-right: none;
-                            }
-                            .shopping-container {
-                                max-height: 600px;
-                                overflow-y: auto;
-                                overflow-x: auto;
-                            }
-                            .shopping-container::-webkit-scrollbar {
-                                width: 8px;
-                                height: 8px;
-                            }
-                            .shopping-container::-webkit-scrollbar-track {
-                                background: #f1f1f1;
-                            }
-                            .shopping-container::-webkit-scrollbar-thumb {
-                                background: #03C75A;
-                                border-radius: 4px;
-                            }
-                            .shopping-container::-webkit-scrollbar-thumb:hover {
-                                background: #02b350;
-                            }
-                            .rank-col {
-                                text-align: center;
-                                font-weight: bold;
-                                color: #666;
-                            }
-                            .rank-1 { color: #FFD700; font-size: 1.1rem; }
-                            .rank-2 { color: #C0C0C0; font-size: 1.05rem; }
-                            .rank-3 { color: #CD7F32; font-size: 1.05rem; }
-                            .product-col {
-                                text-align: left;
-                                color: #333;
-                            }
-                            .price-col {
-                                text-align: right;
-                                font-weight: 600;
-                                color: #03C75A;
-                            }
-                            .mall-col {
-                                text-align: center;
-                                color: #666;
-                            }
-                            .link-btn {
-                                display: inline-block;
-                                padding: 4px 12px;
-                                background: #03C75A;
-                                color: white;
-                                text-decoration: none;
-                                border-radius: 4px;
-                                font-size: 0.8rem;
-                                transition: background 0.2s;
-                            }
-                            .link-btn:hover {
-                                background: #02b350;
-                            }
-                        </style>
-                        <div class="shopping-table-wrapper">
-                            <div class="shopping-container">
-                                <table class="shopping-table">
-                                    <thead>
-                                        <tr>
-                                            <th style="width: 6%;">순위</th>
-                                            <th style="width: 35%;">상품명</th>
-                                            <th style="width: 12%;">최저가</th>
-                                            <th style="width: 15%;">판매처</th>
-                                            <th style="width: 12%;">브랜드</th>
-                                            <th style="width: 15%;">카테고리</th>
-                                            <th style="width: 5%;">링크</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody>
-                        """
-                        
-                        for _, row in df.iterrows():
-                            rank = row['순위']
-                            rank_class = f"rank-{rank}" if rank <= 3 else "rank-col"
-                            
-                            table_html += f"""
-                                        <tr>
-                                            <td class="{rank_class}">{rank}</td>
-                                            <td class="product-col">{row['상품명']}</td>
-                                            <td class="price-col">{row['최저가']:,}원</td>
-                                            <td class="mall-col">{row['판매처']}</td>
-                                            <td class="mall-col">{row['브랜드']}</td>
-                                            <td class="mall-col" style="font-size: 0.75rem;">{row['카테고리']}</td>
-                                            <td style="text-align: center;">
-                                                <a href="{row['링크']}" target="_blank" class="link-btn">보기</a>
-                                            </td>
-                                        </tr>
-                            """
-                        
-                        table_html += """
-                                    </tbody>
-                                </table>
-                            </div>
-                        </div>
-                        """
-                    
-                        st.markdown(table_html, unsafe_allow_html=True)
-                        
-                        # CSV 다운로드
-                        col1, col2 = st.columns([3, 1])
-                        with col2:
-                            csv_df = df[['순위', '상품명', '최저가', '판매처', '브랜드', '카테고리', '링크']]
-                            csv_data = csv_df.to_csv(index=False, encoding='utf-8-sig')
-                            st.download_button(
-                                label="📥 CSV 다운로드",
-                                data=csv_data,
-                                file_name=f"{keyword_input}_쇼핑순위.csv",
-                                mime="text/csv",
-                                use_container_width=True
-                            )
-                else:
-                    st.warning("⚠️ 검색 결과가 없습니다.")
-                    
-            except Exception as e:
-                st.error(f"❌ 검색 중 오류 발생: {str(e)}")
+    if search_button and not keyword_input:
+        st.error("⚠️ 검색 키워드를 입력해주세요.")
+        return
+    
+    # 필터·정렬을 바꿔 다시 실행되어도 저장된 결과를 그대로 사용
+    entry = load_stored_result("shopping", keyword_input if search_button else None,
+                               fetch_shopping_results, refresh_key="shopping_refresh")
+    if entry is not None:
+        render_shopping_results(entry)
 
 
 def check_authentication():
@@ -1021,6 +1289,7 @@ def main():
         if st.button("🚪 로그아웃"):
             st.session_state.authenticated = False
             st.session_state.username = None
+            result_store.clear()
             st.rerun()
     
     st.markdown("---")
@@ -1046,4 +1315,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # 재실행 1회를 루트 스팬으로 기록 (NAVER_TRACE=1일 때)
+    with tracing.rerun("app"):
+        profiling.run("app", main)
@@ -0,0 +1,105 @@
+"""
+Gemini 글 생성 스트리밍 벤치마크
+로컬 대체 서버(stub_server)가 글 조각(60자)마다 --chunk-ms씩 걸려 글을 만드는 상황에서
+일반 생성(generateContent)과 스트리밍(streamGenerateContent)의
+첫 글자가 보이기까지의 시간과 전체 시간을 비교합니다.
+
+글 재작성 페이지를 Streamlit AppTest로 실행해, 스트리밍을 켠 경우와 끈 경우
+st.session_state.rewritten_content가 같은지도 확인합니다 (다르면 AssertionError).
+
+실행:
+    python benchmarks/bench_gemini_stream.py --chars 3000 --chunk-ms 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import requests
+
+os.environ.setdefault("NAVER_DATA_DIR", tempfile.mkdtemp(prefix="bench_gemini_stream_"))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import config  # noqa: E402
+import gemini_api  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+PAGE = os.path.join(ROOT, "pages", "5_✍️_글_재작성.py")
+MODEL = "models/gemini-stub-flash"
+PROMPT = "벤치마크용 원본 글입니다."
+API_KEY = "bench-key"
+
+
+def blocking_generate() -> tuple:
+    """일반 생성: (첫 글자까지 시간, 전체 시간, 글), 응답 전체를 받아야 보이므로 두 시간이 같음"""
+    began = time.perf_counter()
+    response = requests.post(f"{config.GEMINI_API_BASE_URL}/v1/{MODEL}:generateContent",
+                             params={"key": API_KEY}, json={"contents": [{"parts": [{"text": PROMPT}]}]},
+                             timeout=120)
+    response.raise_for_status()
+    text = gemini_api.chunk_text(response.json())
+    elapsed = time.perf_counter() - began
+    return elapsed, elapsed, text
+
+
+def streaming_generate() -> tuple:
+    """스트리밍: (첫 조각까지 시간, 전체 시간, 이어 붙인 글)"""
+    began = time.perf_counter()
+    first = None
+    chunks = []
+    for chunk in gemini_api.stream_generate_content(MODEL, PROMPT, API_KEY):
+        if first is None:
+            first = time.perf_counter() - began
+        chunks.append(chunk)
+    return first, time.perf_counter() - began, "".join(chunks)
+
+
+def page_result(stream: bool, mode: str) -> str:
+    """글 재작성 페이지에서 버튼을 눌렀을 때 저장되는 rewritten_content"""
+    app = AppTest.from_file(PAGE, default_timeout=60)
+    app.run()
+    app.text_area[0].input(PROMPT)
+    app.radio[0].set_value(mode)
+    app.checkbox[0].set_value(stream)
+    app.button[0].click().run()
+    assert not app.exception, app.exception
+    assert not app.error, [element.value for element in app.error]
+    return app.session_state["rewritten_content"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gemini 글 생성 스트리밍 벤치마크")
+    parser.add_argument("--chars", type=int, default=3000, help="생성 글 길이")
+    parser.add_argument("--chunk-ms", type=float, default=100.0, help="글 조각(60자) 하나를 만드는 시간 (밀리초)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="서버 응답 지연 (밀리초)")
+    args = parser.parse_args()
+
+    with StubServer(response_delay=args.latency_ms / 1000, gemini_output_chars=args.chars,
+                    gemini_chunk_delay=args.chunk_ms / 1000) as server:
+        config.GEMINI_API_BASE_URL = server.base_url
+
+        blocking = blocking_generate()
+        streaming = streaming_generate()
+        assert streaming[2] == blocking[2], "스트리밍 조각을 이어 붙인 글이 일반 생성 글과 다름"
+
+        print(f"글 {args.chars}자, 조각당 {args.chunk_ms:.0f}ms, 서버 지연 {args.latency_ms:.0f}ms")
+        print(f"{'방식':<10}{'첫 글자(s)':>12}{'전체(s)':>10}")
+        print(f"{'일반':<10}{blocking[0]:>12.2f}{blocking[1]:>10.2f}")
+        print(f"{'스트리밍':<10}{streaming[0]:>12.2f}{streaming[1]:>10.2f}")
+
+        # 페이지 결과는 조각 지연 없이 비교
+        server.gemini_chunk_delay = 0.0
+        for mode in ("일반 글 모드", "HTML 코드 모드"):
+            assert page_result(True, mode) == page_result(False, mode), f"{mode}: 스트리밍 결과가 다름"
+
+    assert streaming[0] < blocking[0] / 5, "스트리밍 첫 조각이 충분히 빠르지 않음"
+    print("\n✅ 스트리밍과 일반 생성의 rewritten_content가 같음 (일반 글, HTML 코드 모드)")
+
+
+if __name__ == "__main__":
+    main()
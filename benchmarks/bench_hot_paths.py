@@ -0,0 +1,199 @@
+"""
+CPU 핫패스 마이크로 벤치마크
+네트워크를 제외하고 CPU 시간을 주로 쓰는 구간을 가짜 응답(payloads)으로 하나씩 측정합니다.
+
+    items_to_frame    shop.json items -> 정규화 데이터프레임 (컬럼 단위 태그 제거 포함)
+    shopping_frame    같은 items -> 쇼핑 순위 탭 표시용 데이터프레임 (items_to_frame + shopping_frame)
+    dedupe_titles     쇼핑 순위 탭의 중복 상품명 제거
+    word_counts       키워드 분석 페이지의 상품명 단어 빈도 (normalize.title_word_counts)
+    keyword_frame     keywordList -> 키워드 통계 데이터프레임
+    keyword_format    키워드 통계 한 페이지(500행) 표시 서식
+    shop_table        쇼핑 순위 HTML 표 (app.py와 같은 table_render 호출)
+    keyword_table     키워드 통계 HTML 표 (한 페이지)
+
+각 항목은 timeit 방식으로 여러 번 반복해 가장 빠른 1회 시간을 사용합니다.
+--save-baseline으로 기준 시간을 저장하고, --baseline으로 비교하면
+기준보다 --threshold 배 이상 느려진 항목이 있을 때 종료 코드 1로 끝납니다 (배포 전 확인용).
+기준을 저장한 컴퓨터와 다른 컴퓨터에서 비교할 때는 --normalize-speed로
+순수 파이썬 보정 작업의 시간 비율만큼 나눈 값을 기준 대비 배수로 사용합니다.
+
+실행:
+    python benchmarks/bench_hot_paths.py --sizes 100 1000 10000 100000
+    python benchmarks/bench_hot_paths.py --save-baseline benchmarks/hot_paths_baseline.json
+    python benchmarks/bench_hot_paths.py --baseline benchmarks/hot_paths_baseline.json --threshold 1.3
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import normalize  # noqa: E402
+import table_render  # noqa: E402
+from payloads import make_keyword_list, make_shop_response  # noqa: E402
+
+QUERY = "키보드"
+
+# 키워드 분석 탭의 페이지 크기 (app.KEYWORD_PAGE_SIZE, app은 Streamlit 페이지 설정을 실행하므로 가져오지 않음)
+KEYWORD_PAGE_SIZE = 500
+WORD_COUNT_LIMIT = 30
+
+
+def render_shop_table(df: pd.DataFrame) -> str:
+    """app.render_shopping_results의 표 본문"""
+    rank_class = ("rank-" + df['순위'].astype(str)).where(df['순위'] <= 3, "rank-col")
+    return table_render.render_rows([
+        table_render.elements(df['순위'], css_class=rank_class),
+        table_render.elements(df['상품명'], css_class="product-col"),
+        table_render.elements(table_render.format_number(df['최저가'], suffix="원"), css_class="price-col"),
+        table_render.elements(df['판매처'], css_class="mall-col"),
+        table_render.elements(df['브랜드'], css_class="mall-col"),
+        table_render.elements(df['카테고리'], css_class="mall-col", style="font-size: 0.75rem;"),
+        table_render.elements(table_render.links(df['링크'], "보기", css_class="link-btn"),
+                              style="text-align: center;", escape=False),
+    ])
+
+
+def render_keyword_table(display_df: pd.DataFrame) -> str:
+    """app.render_keyword_results의 표 본문"""
+    return table_render.render_rows(
+        [table_render.elements(display_df['순번'], css_class="num-col"),
+         table_render.elements(display_df['연관키워드'], css_class="keyword-col")]
+        + [table_render.elements(display_df[column], css_class="count-col")
+           for column in ['PC 월간검색수', '모바일 월간검색수', 'PC 월평균클릭수', '모바일 월평균클릭수',
+                          'PC 월평균클릭률', '모바일 월평균클릭률']]
+        + [table_render.elements(display_df['경쟁정도'], css_class="center-col"),
+           table_render.elements(display_df['월평균노출광고수'], css_class="count-col")]
+    )
+
+
+def build_cases(size: int) -> List[Tuple[str, Callable[[], object]]]:
+    """크기 size의 가짜 응답으로 항목별 측정 함수 생성 (입력 준비 시간은 측정에서 제외)"""
+    response = make_shop_response(QUERY, size)
+    items = response["items"]
+    frame = normalize.response_to_frame(response)
+    shop_df = normalize.shopping_frame(frame)
+
+    keyword_list = make_keyword_list(QUERY, size)
+    keyword_df = normalize.keyword_list_to_frame(keyword_list)
+    keyword_page = keyword_df.head(KEYWORD_PAGE_SIZE)
+    keyword_display = normalize.format_keyword_stats(keyword_page)
+
+    return [
+        ("items_to_frame", lambda: normalize.items_to_frame(items)),
+        ("shopping_frame", lambda: normalize.shopping_frame(normalize.items_to_frame(items))),
+        ("dedupe_titles", lambda: frame.drop_duplicates("title")),
+        ("word_counts", lambda: normalize.title_word_counts(frame["title"], WORD_COUNT_LIMIT)),
+        ("keyword_frame", lambda: normalize.keyword_list_to_frame(keyword_list)),
+        ("keyword_format", lambda: normalize.format_keyword_stats(keyword_page)),
+        ("shop_table", lambda: render_shop_table(shop_df)),
+        ("keyword_table", lambda: render_keyword_table(keyword_display)),
+    ]
+
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> float:
+    """가장 빠른 1회 실행 시간(초), 반복마다 최소 min_time초가 되도록 실행 횟수를 정함"""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    return min([elapsed] + timer.repeat(repeat=repeat - 1, number=number)) / number
+
+
+def calibration() -> float:
+    """컴퓨터 속도 보정용 순수 파이썬 작업의 1회 시간(초)"""
+    return measure(lambda: sorted(str(number) for number in range(20_000)), repeat=7, min_time=0.05)
+
+
+def check_outputs(size: int):
+    """측정 전 결과 확인 (벤치마크 대상이 의도한 일을 하는지)"""
+    response = make_shop_response(QUERY, size)
+    frame = normalize.response_to_frame(response)
+    assert len(frame) == size
+    assert not frame["title"].str.contains("<b>", regex=False).any()
+    assert frame["title"].duplicated().any() or size < 10
+    assert render_shop_table(normalize.shopping_frame(frame)).count("<tr>") \
+        == frame["title"].nunique()
+    counts = normalize.title_word_counts(frame["title"], WORD_COUNT_LIMIT)
+    assert all(word not in normalize.TITLE_STOPWORDS and len(word) > 1 for word, _ in counts)
+
+    keyword_df = normalize.keyword_list_to_frame(make_keyword_list(QUERY, size))
+    assert len(keyword_df) == size and keyword_df["pc_search_below_10"].any()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CPU 핫패스 마이크로 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="응답 항목 수 (여러 개 지정 가능, 기본: 100 1000 10000, 최대 100000 권장)")
+    parser.add_argument("--only", nargs="+", default=None, help="측정할 항목 이름 (기본: 전체)")
+    parser.add_argument("--repeat", type=int, default=7, help="반복 횟수 (가장 빠른 값 사용, 기본: 7)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="반복 1회의 최소 측정 시간(초)")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 시간 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=1.3,
+                        help="기준 대비 이 배수 이상 느려지면 실패 (기본: 1.3)")
+    parser.add_argument("--save-baseline", default=None, help="측정 결과를 기준 시간 JSON 파일로 저장")
+    parser.add_argument("--normalize-speed", action="store_true",
+                        help="보정 작업 시간 비율로 컴퓨터 속도 차이를 보정하여 비교")
+    args = parser.parse_args()
+
+    calibration_seconds = calibration()
+    baseline: Dict[str, float] = {}
+    speed_ratio = 1.0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            saved = json.load(f)
+        baseline = saved["results"]
+        # 1보다 크면 지금 컴퓨터가 기준을 저장한 컴퓨터보다 느림
+        if args.normalize_speed:
+            speed_ratio = calibration_seconds / saved["calibration"]
+            print(f"보정 작업 시간 비율(현재/기준): {speed_ratio:.2f}")
+
+    results: Dict[str, float] = {}
+    regressions = []
+
+    print(f"{'항목':<16}{'크기':>8}{'1회(ms)':>12}{'항목당(µs)':>12}" + (f"{'기준 대비':>10}" if baseline else ""))
+    for size in args.sizes:
+        check_outputs(size)
+        for name, func in build_cases(size):
+            if args.only and name not in args.only:
+                continue
+
+            seconds = measure(func, args.repeat, args.min_time)
+            key = f"{name}@{size}"
+            results[key] = seconds
+            line = f"{name:<16}{size:>8}{seconds * 1000:>12.3f}{seconds / size * 1e6:>12.3f}"
+
+            if key in baseline:
+                ratio = seconds / baseline[key] / speed_ratio
+                line += f"{ratio:>9.2f}x"
+                if ratio >= args.threshold:
+                    line += "  ⚠️ 느려짐"
+                    regressions.append((key, ratio))
+            print(line)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "pandas": pd.__version__,
+                       "calibration": calibration_seconds, "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n기준 시간 저장: {args.save_baseline}")
+
+    if regressions:
+        print(f"\n기준보다 {args.threshold}배 이상 느려진 항목 {len(regressions)}개:")
+        for key, ratio in regressions:
+            print(f"  {key}: {ratio:.2f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+HTTP 연결 풀 벤치마크
+호출마다 새 연결을 여는 기존 urllib 방식과 naver_api 공유 연결 풀을
+로컬 스텁 서버에 대해 비교합니다.
+
+실행:
+    python benchmarks/bench_http_pool.py --calls 200 --handshake-ms 30
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import naver_api  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+def fetch_urllib(base_url: str, start: int):
+    """기존 방식: 호출마다 새 연결"""
+    query = urllib.parse.urlencode({"query": "무선키보드", "display": 100, "start": start})
+    request = urllib.request.Request(f"{base_url}/v1/search/shop.json?{query}")
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def fetch_pooled(base_url: str, start: int):
+    """공유 연결 풀 사용"""
+    return naver_api.get_json(f"{base_url}/v1/search/shop.json",
+                              params={"query": "무선키보드", "display": 100, "start": start})
+
+
+def run(server: StubServer, fetch, calls: int, workers: int):
+    server.reset_stats()
+    starts = [1 + (i % 10) * 100 for i in range(calls)]
+
+    began = time.perf_counter()
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda start: fetch(server.base_url, start), starts))
+    else:
+        for start in starts:
+            fetch(server.base_url, start)
+    elapsed = time.perf_counter() - began
+
+    return elapsed, server.connections
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 연결 풀 벤치마크")
+    parser.add_argument("--calls", type=int, default=200, help="요청 횟수")
+    parser.add_argument("--workers", type=int, default=1, help="동시 요청 스레드 수")
+    parser.add_argument("--handshake-ms", type=float, default=30.0,
+                        help="새 연결마다 추가할 핸드셰이크 지연 (밀리초)")
+    args = parser.parse_args()
+
+    with StubServer(handshake_delay=args.handshake_ms / 1000) as server:
+        # 워밍업
+        fetch_pooled(server.base_url, 1)
+
+        print(f"요청 {args.calls}회, 동시 {args.workers}개, 핸드셰이크 지연 {args.handshake_ms:.0f}ms")
+        print(f"{'방식':<14}{'총 시간(s)':>12}{'요청당(ms)':>12}{'새 연결 수':>12}")
+        for name, fetch in (("urllib (기존)", fetch_urllib), ("연결 풀", fetch_pooled)):
+            elapsed, connections = run(server, fetch, args.calls, args.workers)
+            print(f"{name:<14}{elapsed:>12.3f}{elapsed / args.calls * 1000:>12.2f}{connections:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+키워드 통계 변환 벤치마크
+키워드 분석 탭에서 keywordList 항목마다 숫자 변환과 표시 문자열을 만들던 기존 방식과
+normalize.keyword_list_to_frame(컬럼 단위 변환) + 보이는 행만 서식을 적용하는 방식을 비교합니다.
+
+두 방식의 표시 결과가 월평균노출광고수 외에는 같은지 확인합니다 (다르면 AssertionError).
+월평균노출광고수는 기존에 응답에 없는 monthlyAveImpsCnt를 읽어 항상 "-"였고, 지금은 plAvgDepth를 표시합니다.
+
+실행:
+    python benchmarks/bench_keyword_stats.py --keywords 100 1000 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import normalize  # noqa: E402
+
+VISIBLE_ROWS = 500
+
+
+def make_keyword_list(count: int):
+    """keywordstool 응답처럼 숫자, 문자열 숫자, "< 10"이 섞인 keywordList"""
+    rng = random.Random(count)
+    keyword_list = []
+    for idx in range(count):
+        keyword_list.append({
+            "relKeyword": f"무선키보드{idx}",
+            "monthlyPcQcCnt": "< 10" if idx % 7 == 0 else rng.randint(10, 50000),
+            "monthlyMobileQcCnt": "< 10" if idx % 5 == 0 else rng.randint(10, 200000),
+            "monthlyAvePcClkCnt": round(rng.random() * 500, 1),
+            "monthlyAveMobileClkCnt": round(rng.random() * 2000, 1),
+            "monthlyAvePcCtr": round(rng.random() * 3, 2),
+            "monthlyAveMobileCtr": round(rng.random() * 3, 2),
+            "compIdx": rng.choice(["낮음", "중간", "높음"]),
+            "plAvgDepth": rng.randint(0, 15),
+        })
+    return keyword_list
+
+
+def _format_count(value):
+    return f"{int(value):,}" if str(value).isdigit() else str(value)
+
+
+def _format_decimal(value, pattern):
+    try:
+        return pattern.format(float(value))
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def per_row_loop(keyword_list):
+    """기존 방식: 항목마다 숫자 변환과 모든 셀의 표시 문자열 생성 후 정렬"""
+    rows = []
+    for idx, kw in enumerate(keyword_list, 1):
+        pc_search = kw.get('monthlyPcQcCnt', '-')
+        mobile_search = kw.get('monthlyMobileQcCnt', '-')
+        pc_num = int(pc_search) if str(pc_search).isdigit() else 0
+        mobile_num = int(mobile_search) if str(mobile_search).isdigit() else 0
+        rows.append({
+            '순번': idx,
+            '연관키워드': kw.get('relKeyword', ''),
+            'PC 월간검색수': _format_count(pc_search),
+            '모바일 월간검색수': _format_count(mobile_search),
+            'PC 월평균클릭수': _format_decimal(kw.get('monthlyAvePcClkCnt', '-'), "{:,.0f}"),
+            '모바일 월평균클릭수': _format_decimal(kw.get('monthlyAveMobileClkCnt', '-'), "{:,.0f}"),
+            'PC 월평균클릭률': _format_decimal(kw.get('monthlyAvePcCtr', '-'), "{:.2f}%"),
+            '모바일 월평균클릭률': _format_decimal(kw.get('monthlyAveMobileCtr', '-'), "{:.2f}%"),
+            '경쟁정도': kw.get('compIdx', '-'),
+            '월평균노출광고수': _format_decimal(kw.get('monthlyAveImpsCnt', '-'), "{:,.0f}"),
+            '_total_num': pc_num + mobile_num,
+        })
+    df = pd.DataFrame(rows).sort_values('_total_num', ascending=False)
+    return df.head(VISIBLE_ROWS)
+
+
+def columnar(keyword_list):
+    """컬럼 단위 변환 후 정렬하고 보이는 행에만 서식 적용"""
+    df = normalize.keyword_list_to_frame(keyword_list)
+    df = df.sort_values('total_search', ascending=False, kind="stable")
+    return normalize.format_keyword_stats(df.head(VISIBLE_ROWS))
+
+
+def check_same(keyword_list):
+    """노출광고수 필드 외에는 기존 방식과 표시 결과가 같은지 확인 (키워드별 비교)"""
+    expected = per_row_loop(keyword_list).set_index('연관키워드').drop(columns=['순번', '_total_num'])
+    actual = columnar(keyword_list).set_index('연관키워드').drop(columns=['순번'])
+    assert set(actual.index) == set(expected.index)
+    expected = expected.loc[actual.index, list(actual.columns)]
+
+    # 기존 방식은 응답에 없는 monthlyAveImpsCnt를 읽어 항상 "-"로 표시했음
+    assert (expected['월평균노출광고수'] == "-").all()
+    ads = {item['relKeyword']: f"{item['plAvgDepth']:,.0f}" for item in keyword_list}
+    assert actual['월평균노출광고수'].tolist() == [ads[keyword] for keyword in actual.index]
+
+    pd.testing.assert_frame_equal(actual.drop(columns=['월평균노출광고수']),
+                                  expected.drop(columns=['월평균노출광고수']), check_dtype=False)
+
+
+def measure(func, keyword_list, repeat: int) -> float:
+    """1회 실행 평균 시간(초)"""
+    func(keyword_list)  # 준비 실행
+    began = time.perf_counter()
+    for _ in range(repeat):
+        func(keyword_list)
+    return (time.perf_counter() - began) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 통계 변환 벤치마크")
+    parser.add_argument("--keywords", type=int, nargs="+", default=[100, 1000, 5000],
+                        help="키워드 수 (여러 개 지정 가능, 기본: 100 1000 5000)")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (기본: 20)")
+    args = parser.parse_args()
+
+    print(f"변환 + 정렬 + 표시 서식 시간 (ms), 상위 {VISIBLE_ROWS}행 표시, {args.repeat}회 평균")
+    print(f"{'키워드 수':>8} | {'반복문':>8} {'컬럼 단위':>8} {'비율':>6}")
+
+    for count in args.keywords:
+        keyword_list = make_keyword_list(count)
+        assert len(columnar(keyword_list)) == min(count, VISIBLE_ROWS)
+        check_same(keyword_list)
+
+        old = measure(per_row_loop, keyword_list, args.repeat) * 1000
+        new = measure(columnar, keyword_list, args.repeat) * 1000
+        print(f"{count:>8} | {old:>8.2f} {new:>8.2f} {old / new:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+일일 호출 수 기록(rate_limit.DailyLedger) 동시 기록 확인
+Streamlit 앱과 배치 CLI처럼 여러 프로세스가 같은 기록 파일에 호출 수를 더하는 상황과,
+여러 스레드가 마지막 남은 한도를 동시에 확인하는 상황을 재현합니다.
+
+    프로세스  --processes개 프로세스가 각각 --calls회 기록 -> 파일의 합계가 정확히 processes × calls
+    한도      --threads개 스레드가 한도 --quota회인 제한기로 동시에 호출 -> 성공이 정확히 quota회
+
+하나라도 맞지 않으면 AssertionError로 종료합니다.
+
+실행:
+    python benchmarks/bench_ledger.py --processes 4 --calls 500
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("NAVER_DATA_DIR", tempfile.mkdtemp(prefix="bench_ledger_"))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rate_limit  # noqa: E402
+
+KEY = "search:bench"
+
+
+def record_calls(path: str, calls: int, start):
+    """프로세스 1개: 매번 디스크에 합치도록 flush_interval=0으로 calls회 기록"""
+    ledger = rate_limit.DailyLedger(path, flush_interval=0)
+    start.wait()
+    for _ in range(calls):
+        ledger.record(KEY)
+    ledger.flush()
+
+
+def run_processes(path: str, processes: int, calls: int) -> float:
+    """여러 프로세스가 동시에 기록, 걸린 시간(초)"""
+    start = multiprocessing.Event()
+    workers = [multiprocessing.Process(target=record_calls, args=(path, calls, start)) for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    began = time.perf_counter()
+    start.set()
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0, worker.exitcode
+    return time.perf_counter() - began
+
+
+def run_threads(path: str, threads: int, quota: int) -> int:
+    """한도 quota회인 제한기를 threads개 스레드가 동시에 호출, 성공 횟수"""
+    limiter = rate_limit.ApiLimiter("search", 0, quota, rate_limit.DailyLedger(path))
+    barrier = threading.Barrier(threads)
+    succeeded = []
+
+    def worker():
+        barrier.wait()
+        while True:
+            try:
+                limiter.acquire("bench-credential")
+            except rate_limit.QuotaExceededError:
+                return
+            succeeded.append(1)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return len(succeeded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일일 호출 수 기록 동시 기록 확인")
+    parser.add_argument("--processes", type=int, default=4, help="동시에 기록하는 프로세스 수")
+    parser.add_argument("--calls", type=int, default=500, help="프로세스별 기록 횟수")
+    parser.add_argument("--threads", type=int, default=16, help="한도 확인 스레드 수")
+    parser.add_argument("--quota", type=int, default=1000, help="한도 확인에 사용할 일일 한도")
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="bench_ledger_")
+
+    path = os.path.join(data_dir, "processes.json")
+    elapsed = run_processes(path, args.processes, args.calls)
+    total = rate_limit.DailyLedger(path).used(KEY)
+    print(f"프로세스 {args.processes}개 × {args.calls}회 기록: 합계 {total:,}회 ({elapsed:.2f}s)")
+    assert total == args.processes * args.calls, f"기록이 사라짐: {total} != {args.processes * args.calls}"
+
+    succeeded = run_threads(os.path.join(data_dir, "threads.json"), args.threads, args.quota)
+    print(f"스레드 {args.threads}개, 한도 {args.quota:,}회: 성공 {succeeded:,}회")
+    assert succeeded == args.quota, f"한도와 성공 횟수가 다름: {succeeded} != {args.quota}"
+
+    print("\n✅ 동시에 기록해도 호출 수가 사라지거나 한도를 넘지 않음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+부하 벤치마크
+로컬 대체 서버(stub_server)에 대해 순위 확인, 키워드 분석, 쇼핑 순위 작업을 동시에 실행하여
+작업별 처리량(작업/초)과 지연 시간 p50/p99를 측정합니다.
+
+각 작업은 앱의 해당 탭과 같은 경로(naver_api 호출 + normalize 변환)를 거치며,
+캐시와 요청 합치기에 가려지지 않도록 작업마다 다른 키워드를 사용하고 캐시를 건너뜁니다.
+
+실행:
+    python benchmarks/bench_load.py --ops 200 --concurrency 8 --latency-ms 50 --jitter-ms 30
+    python benchmarks/bench_load.py --scenarios rank --error-rate 0.02 --search-rate 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+# 캐시·호출 기록이 저장소의 data 폴더에 남지 않도록 임시 폴더 사용, 클라이언트 속도 제한 없음
+os.environ.setdefault("NAVER_DATA_DIR", tempfile.mkdtemp(prefix="bench_load_"))
+os.environ.setdefault("NAVER_SEARCH_RATE_PER_SEC", "0")
+os.environ.setdefault("NAVER_SEARCHAD_RATE_PER_SEC", "0")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import naver_api  # noqa: E402
+import normalize  # noqa: E402
+import rank_scan  # noqa: E402
+from cache import shop_cache  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+# 순위 확인 대상 판매처 (스텁 상품에 없는 이름이면 1000위까지 모두 조회하는 최악의 경우)
+MISSING_MALL = "없는스토어"
+
+
+def rank_scan_op(index: int, mall_name: str, concurrent: bool):
+    """순위 확인 탭: 키워드 하나에서 판매처 최상위 상품 찾기"""
+    rank_scan.find_best_product(f"순위부하{index}", mall_name, concurrent=concurrent,
+                                prefetch=not concurrent)
+
+
+def keyword_analysis_op(index: int):
+    """키워드 분석 탭: 연관 키워드 통계 조회 + 정규화 + 첫 페이지 표시 서식"""
+    data = naver_api.get_keywordstool(f"키워드부하{index}", use_cache=False)
+    df = normalize.keyword_list_to_frame(data.get("keywordList", []))
+    normalize.format_keyword_stats(df.head(500))
+
+
+def shopping_rank_op(index: int):
+    """쇼핑 순위 탭: 1~100위 조회 + 정규화 + 중복 상품 제거"""
+    result = naver_api.search_shop(f"쇼핑부하{index}", display=100, start=1, sort="sim", use_cache=False)
+    normalize.response_to_frame(result).drop_duplicates("title")
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 q 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def run_scenario(op: Callable[[int], None], ops: int, concurrency: int) -> Dict[str, float]:
+    """작업 ops개를 concurrency개씩 동시에 실행하고 작업별 지연 시간 측정"""
+    def timed(index: int):
+        began = time.perf_counter()
+        try:
+            op(index)
+            error = False
+        except Exception:
+            error = True
+        return time.perf_counter() - began, error
+
+    calls_before = sum(naver_api.call_counts().values())
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed, range(ops)))
+    elapsed = time.perf_counter() - began
+
+    latencies = sorted(latency for latency, error in results if not error)
+    return {
+        "elapsed": elapsed,
+        "throughput": ops / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 50) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+        "errors": sum(error for _, error in results),
+        "requests": sum(naver_api.call_counts().values()) - calls_before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 벤치마크")
+    parser.add_argument("--scenarios", default="rank,keyword,shopping",
+                        help="실행할 작업 (rank, keyword, shopping 중 쉼표로 구분)")
+    parser.add_argument("--ops", type=int, default=100, help="작업별 실행 횟수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시에 실행할 작업 수 (세션 수)")
+    parser.add_argument("--mall", default=MISSING_MALL, help="순위 확인 판매처 (기본: 없는 판매처, 10페이지 조회)")
+    parser.add_argument("--sequential-pages", action="store_true",
+                        help="순위 확인 페이지를 병렬 대신 순차(+미리 요청)로 조회")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="서버 응답 지연 (밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=30.0, help="서버 응답 지연 임의 추가 최대값 (밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="서버 임의 503 비율 (0~1)")
+    parser.add_argument("--search-rate", type=float, default=0.0, help="서버 쇼핑 검색 초당 한도 (0은 무제한)")
+    parser.add_argument("--searchad-rate", type=float, default=0.0, help="서버 검색광고 초당 한도 (0은 무제한)")
+    args = parser.parse_args()
+
+    scenarios = {
+        "rank": ("순위 확인", lambda index: rank_scan_op(index, args.mall, not args.sequential_pages)),
+        "keyword": ("키워드 분석", keyword_analysis_op),
+        "shopping": ("쇼핑 순위", shopping_rank_op),
+    }
+    selected = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in scenarios]
+    if unknown:
+        parser.error(f"알 수 없는 작업: {', '.join(unknown)}")
+
+    with StubServer(response_delay=args.latency_ms / 1000, response_jitter=args.jitter_ms / 1000,
+                    error_rate=args.error_rate,
+                    rate_limits={"search": args.search_rate, "searchad": args.searchad_rate}) as server:
+        naver_api.SHOP_SEARCH_URL = f"{server.base_url}/v1/search/shop.json"
+        naver_api.SEARCHAD_BASE_URL = server.base_url
+
+        print(f"작업별 {args.ops}회, 동시 {args.concurrency}개, 서버 지연 {args.latency_ms:.0f}"
+              f"+0~{args.jitter_ms:.0f}ms, 오류율 {args.error_rate:.1%}")
+        print(f"{'작업':<10}{'작업/초':>10}{'p50(ms)':>10}{'p99(ms)':>10}{'API 요청':>10}{'오류':>6}")
+        for name in selected:
+            label, op = scenarios[name]
+            shop_cache.clear()
+            result = run_scenario(op, args.ops, args.concurrency)
+            print(f"{label:<10}{result['throughput']:>10.2f}{result['p50']:>10.1f}{result['p99']:>10.1f}"
+                  f"{result['requests']:>10}{result['errors']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+쇼핑 검색 결과 정규화 벤치마크
+상품마다 딕셔너리를 만들던 기존 방식(쇼핑 순위 탭의 반복문)과
+normalize.items_to_frame의 컬럼 단위 변환을 1000개 상품당 처리 시간으로 비교합니다.
+변환 후 탭과 페이지에서 공통으로 계산하는 통계(평균가, 판매처 수, 브랜드별 상품 수)를
+포함한 시간도 함께 측정합니다.
+
+실제 화면에서 변환하는 크기는 검색 응답 한 페이지(100개)이며, normalize.SMALL_INPUT_ITEMS 이하는
+파이썬 목록으로, 그보다 많으면 Arrow 배열 연산으로 변환합니다 (두 방식의 결과가 다르면 AssertionError).
+
+실행:
+    python benchmarks/bench_normalize.py --items 100 300 1000 10000 --repeat 50
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import normalize  # noqa: E402
+from stub_server import make_shop_items  # noqa: E402
+
+
+def make_items(count: int):
+    """응답 10페이지 분량처럼 다양한 값을 가진 상품 목록 (가격이 빈 항목, category2가 없는 항목 포함)"""
+    items = []
+    for start in range(1, count + 1, 100):
+        items.extend(make_shop_items("무선 키보드", start, min(100, count - start + 1)))
+
+    for rank, item in enumerate(items, 1):
+        if rank % 37 == 0:
+            item["lprice"] = ""
+        if rank % 11 == 0:
+            item["category2"] = ""
+    return items
+
+
+def per_dict_loop(items) -> pd.DataFrame:
+    """기존 방식: 상품마다 태그 제거, 가격 변환, 카테고리 연결 후 딕셔너리 생성"""
+    products = []
+    for rank, item in enumerate(items, 1):
+        lprice = item.get("lprice", "")
+        products.append({
+            "rank": rank,
+            "title": re.sub(r"<.*?>", "", item["title"]),
+            "price": int(lprice) if lprice.isdigit() else None,
+            "mallName": item.get("mallName", ""),
+            "brand": item.get("brand", ""),
+            "category": item.get("category1", "") + " > " + item.get("category2", "")
+            if item.get("category2") else item.get("category1", ""),
+            "link": item.get("link", ""),
+        })
+    return pd.DataFrame(products)
+
+
+def columnar(items) -> pd.DataFrame:
+    return normalize.items_to_frame(items)
+
+
+def per_dict_loop_with_stats(items):
+    """기존 방식 + 페이지별 통계를 상품 목록 반복으로 계산"""
+    df = per_dict_loop(items)
+    prices = [int(item["lprice"]) for item in items if item.get("lprice", "").isdigit()]
+    avg_price = sum(prices) / len(prices) if prices else 0
+    unique_malls = len(set(item.get("mallName", "") for item in items))
+    brands = {}
+    for item in items:
+        if item.get("brand"):
+            brands[item["brand"]] = brands.get(item["brand"], 0) + 1
+    return df, avg_price, unique_malls, brands
+
+
+def columnar_with_stats(items):
+    """컬럼 단위 정규화 + 같은 통계를 컬럼 연산으로 계산"""
+    df = normalize.items_to_frame(items)
+    avg_price = df["price"].mean()
+    unique_malls = df["mallName"].nunique()
+    brands = df.loc[df["brand"] != "", "brand"].value_counts()
+    return df, avg_price, unique_malls, brands
+
+
+def measure(func, items, repeat: int) -> float:
+    """1회 실행 평균 시간(초)"""
+    func(items)  # 준비 실행
+    began = time.perf_counter()
+    for _ in range(repeat):
+        func(items)
+    return (time.perf_counter() - began) / repeat
+
+
+def check_same(items):
+    """두 방식의 결과가 같은지 확인"""
+    expected = per_dict_loop(items)
+    actual = columnar(items)
+    for column in ["rank", "title", "mallName", "brand", "category", "link"]:
+        assert expected[column].astype(str).tolist() == actual[column].astype(str).tolist(), column
+    assert expected["price"].isna().tolist() == actual["price"].isna().tolist()
+    pd.testing.assert_frame_equal(actual, normalize.table_to_frame(normalize.items_to_table(items)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쇼핑 검색 결과 정규화 벤치마크")
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 300, 1000, 10000],
+                        help="상품 수 (여러 개 지정 가능, 기본: 100 300 1000 10000)")
+    parser.add_argument("--repeat", type=int, default=50, help="반복 횟수 (기본: 50)")
+    args = parser.parse_args()
+
+    print(f"1000개당 처리 시간 (ms), {args.repeat}회 평균, {normalize.SMALL_INPUT_ITEMS}개 이하는 파이썬 목록으로 변환")
+    print(f"{'상품 수':>8} | {'반복문':>8} {'컬럼 단위':>8} {'비율':>6} | {'반복문+통계':>10} {'컬럼+통계':>9} {'비율':>6}")
+
+    for count in args.items:
+        items = make_items(count)
+        check_same(items)
+
+        per_1000 = 1000 / len(items) * 1000
+        loop_time = measure(per_dict_loop, items, args.repeat) * per_1000
+        column_time = measure(columnar, items, args.repeat) * per_1000
+        loop_stats_time = measure(per_dict_loop_with_stats, items, args.repeat) * per_1000
+        column_stats_time = measure(columnar_with_stats, items, args.repeat) * per_1000
+
+        print(f"{len(items):>8} | {loop_time:>8.2f} {column_time:>8.2f} {loop_time / column_time:>5.2f}x | "
+              f"{loop_stats_time:>10.2f} {column_stats_time:>9.2f} {loop_stats_time / column_stats_time:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
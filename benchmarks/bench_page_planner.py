@@ -0,0 +1,101 @@
+"""
+순위 검색 페이지 계획 벤치마크
+항상 10페이지를 조회하던 기존 방식과 total 기반 계획 + 조기 종료 방식의
+키워드당 API 호출 수를 비교합니다.
+
+동시 조회는 첫 페이지의 total을 기다리지 않고 10페이지를 모두 요청하므로
+(total 밖의 응답은 버림) 호출 수는 기존 방식과 같고, 대신 키워드당 대기 시간이 왕복 1회로 줄어듭니다.
+
+키워드 세트는 실제 순위 확인 작업의 분포를 흉내낸 합성 데이터입니다.
+(검색 결과가 수십만 개인 대표 키워드, 수백 개뿐인 세부 키워드, 판매처가 1000위 안에 없는 경우)
+
+실행:
+    python benchmarks/bench_page_planner.py --keywords 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rank_scan  # noqa: E402
+
+MALL_NAME = "내스토어"
+
+
+def make_keyword_set(count: int, seed: int = 42):
+    """(키워드, 검색 결과 수, 판매처 최상위 순위 또는 None) 목록 생성"""
+    rng = random.Random(seed)
+    keywords = []
+    for i in range(count):
+        kind = rng.random()
+        if kind < 0.35:
+            # 대표 키워드: 결과가 매우 많고 순위는 넓게 분포
+            total = rng.randint(50_000, 2_000_000)
+        elif kind < 0.75:
+            # 중간 키워드
+            total = rng.randint(1_000, 50_000)
+        else:
+            # 세부(롱테일) 키워드: 결과가 1000개 미만
+            total = rng.randint(20, 999)
+
+        if rng.random() < 0.7:
+            best_rank = min(total, int(rng.expovariate(1 / 180)) + 1)
+            best_rank = best_rank if best_rank <= rank_scan.MAX_RANK else None
+        else:
+            best_rank = None
+        keywords.append((f"키워드{i}", total, best_rank))
+    return keywords
+
+
+def make_fetch(keyword_set, counter):
+    """실제 API 대신 합성 응답을 돌려주는 조회 함수"""
+    lookup = {keyword: (total, best_rank) for keyword, total, best_rank in keyword_set}
+
+    def fetch(keyword, start):
+        counter[0] += 1
+        total, best_rank = lookup[keyword]
+        last = min(total, rank_scan.MAX_RANK, start + rank_scan.PAGE_SIZE - 1)
+        items = []
+        for rank in range(start, last + 1):
+            mall = MALL_NAME if rank == best_rank else f"스토어{rank % 97}"
+            items.append({"title": f"상품 {rank}", "lprice": "1000", "link": "", "mallName": mall})
+        return {"total": total, "start": start, "display": len(items), "items": items}
+
+    return fetch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="순위 검색 페이지 계획 벤치마크")
+    parser.add_argument("--keywords", type=int, default=500, help="키워드 수")
+    args = parser.parse_args()
+
+    keyword_set = make_keyword_set(args.keywords)
+    counter = [0]
+    rank_scan.fetch_shop_page = make_fetch(keyword_set, counter)
+
+    baseline_calls = len(keyword_set) * (rank_scan.MAX_RANK // rank_scan.PAGE_SIZE)
+    print(f"키워드 {len(keyword_set)}개 (기존 방식: 키워드당 10회, 총 {baseline_calls:,}회)")
+    print(f"{'방식':<16}{'총 호출':>10}{'키워드당':>10}{'절감(키워드당)':>16}{'시간(s)':>10}")
+
+    for name, options in (("계획+조기종료", {}), ("+ 다음 페이지 미리조회", {"prefetch": True}),
+                          ("+ 동시 조회", {"concurrent": True})):
+        counter[0] = 0
+        mismatches = 0
+        began = time.perf_counter()
+        for keyword, total, best_rank in keyword_set:
+            product = rank_scan.find_best_product(keyword, MALL_NAME, **options)
+            found_rank = product.rank if product else None
+            mismatches += found_rank != best_rank
+        elapsed = time.perf_counter() - began
+
+        per_keyword = counter[0] / len(keyword_set)
+        print(f"{name:<16}{counter[0]:>10,}{per_keyword:>10.2f}{10 - per_keyword:>16.2f}{elapsed:>10.3f}"
+              + (f"  (순위 불일치 {mismatches}건)" if mismatches else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+순위 검색 결과 상품 메모리 벤치마크
+상품마다 딕셔너리를 만들던 기존 방식과 rank_scan.ProductRecord(__slots__, 판매처명 intern,
+정수 가격)가 유지하는 메모리를 tracemalloc으로 비교합니다.
+
+실제 응답처럼 페이지마다 json.loads로 만든 문자열을 사용하고, 결과만 남긴 채
+페이지는 버린 뒤 남아 있는 메모리를 측정합니다.
+
+실행:
+    python benchmarks/bench_product_memory.py --items 100000
+"""
+
+import argparse
+import gc
+import json
+import os
+import re
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rank_scan  # noqa: E402
+from stub_server import make_shop_items  # noqa: E402
+
+PAGE_SIZE = 100
+
+
+def legacy_product(rank: int, item: dict) -> dict:
+    """기존 방식: 순위 결과 딕셔너리"""
+    return {
+        "rank": rank,
+        "title": re.sub(r"<.*?>", "", item["title"]),
+        "price": item["lprice"],
+        "link": item["link"],
+        "mallName": item["mallName"],
+        "productId": item.get("productId"),
+    }
+
+
+def build_products(count: int, make_product):
+    """JSON 페이지를 하나씩 파싱해 상품 결과만 남김 (페이지 객체는 바로 버림)"""
+    products = []
+    for start in range(1, count + 1, PAGE_SIZE):
+        payload = json.dumps({"items": make_shop_items("무선 키보드", start, min(PAGE_SIZE, count - start + 1))},
+                             ensure_ascii=False)
+        page = json.loads(payload)
+        for idx, item in enumerate(page["items"]):
+            products.append(make_product(start + idx, item))
+    return products
+
+
+def measure(count: int, make_product) -> int:
+    """상품 결과 목록이 유지하는 메모리(바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    products = build_products(count, make_product)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del products
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="순위 검색 결과 상품 메모리 벤치마크")
+    parser.add_argument("--items", type=int, default=100_000, help="상품 수 (기본: 100000)")
+    args = parser.parse_args()
+
+    legacy = measure(args.items, legacy_product)
+    compact = measure(args.items, rank_scan.ProductRecord.from_item)
+
+    print(f"상품 {args.items:,}개")
+    print(f"  딕셔너리          : {legacy / 1024 / 1024:8.1f} MiB ({legacy / args.items:6.0f} B/상품)")
+    print(f"  ProductRecord     : {compact / 1024 / 1024:8.1f} MiB ({compact / args.items:6.0f} B/상품)")
+    print(f"  절감              : {(1 - compact / legacy) * 100:7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+순위 기록 요약(rank_history latest.parquet) 동시 저장 확인
+Streamlit 앱과 배치 CLI처럼 여러 프로세스가 동시에 순위 기록을 추가하는 상황을 재현하여,
+요약에 모든 (키워드, 판매처)가 남아 있는지와 append 1회 시간을 측정합니다.
+
+    --processes개 프로세스가 각각 --batches회, 한 번에 키워드 --keywords개를 추가
+    -> 요약 행 수가 정확히 processes × batches × keywords
+
+요약에서 사라진 기록이 있으면 AssertionError로 종료합니다.
+
+실행:
+    python benchmarks/bench_rank_history.py --processes 4 --batches 20
+"""
+
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+
+os.environ.setdefault("NAVER_DATA_DIR", tempfile.mkdtemp(prefix="bench_rank_history_"))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rank_history  # noqa: E402
+
+MALL = "벤치몰"
+
+
+def append_batches(process: int, batches: int, keywords: int, start, elapsed):
+    """프로세스 1개: 서로 다른 키워드로 batches회 append"""
+    start.wait()
+    began = time.perf_counter()
+    for batch in range(batches):
+        checked_at = datetime.now(timezone.utc)
+        rank_history.append([
+            {"checked_at": checked_at, "keyword": f"p{process}-b{batch}-k{index}", "mall": MALL,
+             "rank": index + 1, "productId": str(index), "price": 10000}
+            for index in range(keywords)
+        ])
+    elapsed.put((time.perf_counter() - began) / batches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="순위 기록 요약 동시 저장 확인")
+    parser.add_argument("--processes", type=int, default=4, help="동시에 저장하는 프로세스 수")
+    parser.add_argument("--batches", type=int, default=20, help="프로세스별 append 횟수")
+    parser.add_argument("--keywords", type=int, default=5, help="append 1회당 키워드 수")
+    args = parser.parse_args()
+
+    start = multiprocessing.Event()
+    elapsed = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=append_batches,
+                                       args=(process, args.batches, args.keywords, start, elapsed))
+               for process in range(args.processes)]
+    for worker in workers:
+        worker.start()
+    start.set()
+    per_append = [elapsed.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0, worker.exitcode
+
+    expected = args.processes * args.batches * args.keywords
+    snapshot = rank_history.latest_ranks()
+    history = pd.concat([pd.read_parquet(path) for path in
+                         glob.glob(os.path.join(rank_history.HISTORY_DIR, "date=*", "*.parquet"))])
+    print(f"프로세스 {args.processes}개 × append {args.batches}회 × 키워드 {args.keywords}개")
+    print(f"요약 {len(snapshot):,}행, 전체 기록 {len(history):,}행, "
+          f"append 1회 평균 {sum(per_append) / len(per_append) * 1000:.1f}ms")
+
+    assert len(history) == expected, f"기록 파일이 사라짐: {len(history)} != {expected}"
+    assert len(snapshot) == expected, f"요약에서 기록이 사라짐: {len(snapshot)} != {expected}"
+    print("\n✅ 여러 프로세스가 동시에 저장해도 요약에 모든 기록이 남음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+글 재작성 페이지 재실행 시간 벤치마크
+로컬 대체 서버(stub_server)의 /v1/models에 응답 지연을 두고, 글 재작성 페이지를 Streamlit AppTest로
+여러 번 다시 실행하여 모델 목록 캐시 상태별 재실행 시간과 실제 /v1/models 요청 수를 측정합니다.
+
+    cold   첫 재실행 (모델 목록을 받을 때까지 기다림)
+    warm   캐시가 있는 재실행 (요청 없음)
+    stale  TTL이 지난 뒤의 재실행 (기존 목록으로 바로 그리고 백그라운드에서 새로 받음)
+
+warm, stale 재실행이 --budget-ms를 넘거나 재실행 중에 /v1/models를 기다리면 AssertionError로 종료합니다.
+
+실행:
+    python benchmarks/bench_rewrite_page.py --latency-ms 300 --reruns 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("NAVER_DATA_DIR", tempfile.mkdtemp(prefix="bench_rewrite_page_"))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import config  # noqa: E402
+import gemini_api  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+PAGE = os.path.join(ROOT, "pages", "5_✍️_글_재작성.py")
+
+
+def models_requests(server: StubServer) -> int:
+    """대체 서버가 받은 /v1/models 요청 수"""
+    return sum(1 for path, _, _ in server.request_log if path == "/v1/models")
+
+
+def rerun_ms(app: AppTest) -> float:
+    """페이지 재실행 1회 시간(밀리초)"""
+    began = time.perf_counter()
+    app.run(timeout=30)
+    elapsed = (time.perf_counter() - began) * 1000
+    assert not app.exception, app.exception
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="글 재작성 페이지 재실행 시간 벤치마크")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="/v1/models 응답 지연 (밀리초)")
+    parser.add_argument("--reruns", type=int, default=20, help="warm 재실행 횟수")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="warm, stale 재실행 허용 시간 (밀리초)")
+    args = parser.parse_args()
+
+    with StubServer(response_delay=args.latency_ms / 1000) as server:
+        config.GEMINI_API_BASE_URL = server.base_url
+        gemini_api.model_catalog.invalidate()
+
+        app = AppTest.from_file(PAGE)
+        cold = rerun_ms(app)
+        assert app.selectbox[0].options, "모델 목록이 비어 있음"
+        assert models_requests(server) == 1
+
+        # 글 입력, 옵션 변경처럼 위젯 값을 바꾼 재실행
+        warm = []
+        for index in range(args.reruns):
+            app.text_area[0].input(f"원본 글 {index}")
+            app.radio[0].set_value("HTML 코드 모드" if index % 2 else "일반 글 모드")
+            warm.append(rerun_ms(app))
+        assert models_requests(server) == 1, "캐시가 있는데 /v1/models를 호출함"
+
+        # TTL이 지난 뒤: 바로 그리고 백그라운드에서 새로 받음
+        gemini_api.model_catalog.ttl = 0
+        stale = rerun_ms(app)
+        gemini_api.model_catalog.ttl = config.GEMINI_MODELS_TTL
+        deadline = time.time() + 5
+        while models_requests(server) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert models_requests(server) == 2, "TTL이 지났는데 백그라운드에서 새로 받지 않음"
+
+    warm_p50 = statistics.median(warm)
+    warm_max = max(warm)
+    print(f"/v1/models 지연 {args.latency_ms:.0f}ms, warm 재실행 {args.reruns}회")
+    print(f"{'상태':<8}{'재실행(ms)':>12}")
+    print(f"{'cold':<8}{cold:>12.1f}")
+    print(f"{'warm':<8}{warm_p50:>12.1f}  (p50, 최대 {warm_max:.1f})")
+    print(f"{'stale':<8}{stale:>12.1f}")
+
+    assert warm_p50 < args.budget_ms, f"warm 재실행 p50 {warm_p50:.1f}ms > {args.budget_ms}ms"
+    assert stale < args.latency_ms, f"stale 재실행이 모델 목록 요청을 기다림 ({stale:.1f}ms)"
+    print("\n✅ 캐시가 있는 재실행은 /v1/models를 기다리지 않음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+동일 요청 합치기 벤치마크
+여러 세션이 같은 인기 키워드를 동시에 조회하는 상황을 스레드로 흉내내어,
+요청 합치기를 끈 경우와 켠 경우의 실제 API 요청 수와 합쳐진 호출 수를 비교합니다.
+
+합치기를 켠 경우 키워드·페이지별로 요청이 정확히 1개만 나갔는지 확인하고,
+아니면 AssertionError로 종료합니다.
+
+실행:
+    python benchmarks/bench_single_flight.py --sessions 8 --keywords 3 --delay-ms 100
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+# 캐시가 저장소의 data 폴더에 남지 않도록 임시 폴더 사용, 속도 제한 없음
+os.environ.setdefault("NAVER_DATA_DIR", tempfile.mkdtemp(prefix="bench_single_flight_"))
+os.environ.setdefault("NAVER_SEARCH_RATE_PER_SEC", "0")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import naver_api  # noqa: E402
+from cache import shop_cache  # noqa: E402
+from single_flight import SingleFlight  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+class NoCoalescing:
+    """비교용: 합치지 않고 매번 호출"""
+
+    def do(self, key, func):
+        return func()
+
+    def stats(self):
+        return {"calls": 0, "coalesced": 0}
+
+
+def run(server: StubServer, sessions: int, keywords: int, pages: int):
+    """세션마다 같은 키워드 목록의 모든 페이지를 동시에 조회"""
+    shop_cache.clear()
+    server.reset_stats()
+    coalesced_before = naver_api.coalesced_counts()["search"]
+    barrier = threading.Barrier(sessions)
+
+    def session():
+        barrier.wait()
+        for keyword_index in range(keywords):
+            for page in range(pages):
+                naver_api.search_shop(f"인기키워드{keyword_index}", start=1 + page * 100)
+
+    threads = [threading.Thread(target=session) for _ in range(sessions)]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    coalesced = naver_api.coalesced_counts()["search"] - coalesced_before
+    return elapsed, Counter((query, start) for _, query, start in server.request_log), coalesced
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동일 요청 합치기 벤치마크")
+    parser.add_argument("--sessions", type=int, default=8, help="동시에 조회하는 세션(스레드) 수")
+    parser.add_argument("--keywords", type=int, default=3, help="세션마다 조회하는 키워드 수")
+    parser.add_argument("--pages", type=int, default=2, help="키워드마다 조회하는 페이지 수")
+    parser.add_argument("--delay-ms", type=float, default=100.0, help="스텁 서버 응답 지연 (밀리초)")
+    args = parser.parse_args()
+
+    calls = args.sessions * args.keywords * args.pages
+    with StubServer(response_delay=args.delay_ms / 1000) as server:
+        naver_api.SHOP_SEARCH_URL = f"{server.base_url}/v1/search/shop.json"
+
+        print(f"세션 {args.sessions}개 × 키워드 {args.keywords}개 × 페이지 {args.pages}개 = 호출 {calls}회, "
+              f"응답 지연 {args.delay_ms:.0f}ms")
+        print(f"{'방식':<12}{'총 시간(s)':>12}{'API 요청':>10}{'합친 호출':>10}")
+
+        flight = naver_api._flights["search"]
+        for name, replacement in (("합치기 없음", NoCoalescing()), ("합치기", SingleFlight("search"))):
+            naver_api._flights["search"] = replacement
+            elapsed, requests, coalesced = run(server, args.sessions, args.keywords, args.pages)
+            print(f"{name:<12}{elapsed:>12.3f}{sum(requests.values()):>10}{coalesced:>10}")
+        naver_api._flights["search"] = flight
+
+    # 합치기를 켠 경우: 같은 키워드·페이지는 요청 1개, 나머지는 모두 합쳐지거나 캐시에서 응답
+    assert len(requests) == args.keywords * args.pages, requests
+    assert all(count == 1 for count in requests.values()), requests
+    assert coalesced > 0
+
+
+if __name__ == "__main__":
+    main()
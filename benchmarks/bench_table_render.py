@@ -0,0 +1,106 @@
+"""
+HTML 표 렌더링 벤치마크
+쇼핑 순위 표를 iterrows + 문자열 더하기로 만들던 기존 방식과
+table_render의 컬럼 단위 렌더링을 행 수별로 비교합니다.
+
+실행:
+    python benchmarks/bench_table_render.py --rows 100 1000 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import normalize  # noqa: E402
+import table_render  # noqa: E402
+from stub_server import make_shop_items  # noqa: E402
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    """쇼핑 순위 탭과 같은 컬럼의 데이터프레임"""
+    items = normalize.items_to_frame(make_shop_items("키보드 & 마우스", 1, rows))
+    return pd.DataFrame({
+        '순위': range(1, rows + 1),
+        '상품명': items["title"],
+        '최저가': items["price"].fillna(0),
+        '판매처': items["mallName"],
+        '브랜드': items["brand"],
+        '카테고리': items["category"],
+        '링크': items["link"],
+    })
+
+
+def iterrows_concat(df: pd.DataFrame) -> str:
+    """기존 방식: 행마다 f-string을 만들어 문자열에 더함"""
+    table_html = ""
+    for _, row in df.iterrows():
+        rank = row['순위']
+        rank_class = f"rank-{rank}" if rank <= 3 else "rank-col"
+
+        table_html += f"""
+                    <tr>
+                        <td class="{rank_class}">{rank}</td>
+                        <td class="product-col">{row['상품명']}</td>
+                        <td class="price-col">{row['최저가']:,}원</td>
+                        <td class="mall-col">{row['판매처']}</td>
+                        <td class="mall-col">{row['브랜드']}</td>
+                        <td class="mall-col" style="font-size: 0.75rem;">{row['카테고리']}</td>
+                        <td style="text-align: center;">
+                            <a href="{row['링크']}" target="_blank" class="link-btn">보기</a>
+                        </td>
+                    </tr>
+        """
+    return table_html
+
+
+def columnar(df: pd.DataFrame) -> str:
+    """table_render: 컬럼 단위로 셀을 만들고 한 번에 연결"""
+    rank_class = ("rank-" + df['순위'].astype(str)).where(df['순위'] <= 3, "rank-col")
+    return table_render.render_rows([
+        table_render.elements(df['순위'], css_class=rank_class),
+        table_render.elements(df['상품명'], css_class="product-col"),
+        table_render.elements(table_render.format_number(df['최저가'], suffix="원"), css_class="price-col"),
+        table_render.elements(df['판매처'], css_class="mall-col"),
+        table_render.elements(df['브랜드'], css_class="mall-col"),
+        table_render.elements(df['카테고리'], css_class="mall-col", style="font-size: 0.75rem;"),
+        table_render.elements(table_render.links(df['링크'], "보기", css_class="link-btn"),
+                              style="text-align: center;", escape=False),
+    ])
+
+
+def measure(func, df: pd.DataFrame, repeat: int) -> float:
+    """1회 실행 평균 시간(초)"""
+    func(df)  # 준비 실행
+    began = time.perf_counter()
+    for _ in range(repeat):
+        func(df)
+    return (time.perf_counter() - began) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 표 렌더링 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="행 수 (여러 개 지정 가능, 기본: 100 1000 10000)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (기본: 5)")
+    args = parser.parse_args()
+
+    print(f"표 1개 렌더링 시간 (ms), {args.repeat}회 평균")
+    print(f"{'행 수':>8} | {'iterrows':>10} {'컬럼 단위':>10} {'비율':>8}")
+
+    for rows in args.rows:
+        df = make_frame(rows)
+        assert columnar(df).count("<tr>") == rows
+        assert "키보드 &amp; 마우스" in columnar(df)
+
+        old = measure(iterrows_concat, df, args.repeat) * 1000
+        new = measure(columnar, df, args.repeat) * 1000
+        print(f"{rows:>8} | {old:>10.2f} {new:>10.2f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
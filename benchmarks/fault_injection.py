@@ -0,0 +1,194 @@
+"""
+API 오류 주입 점검
+로컬 스텁 서버에 오류 응답(429, 5xx, Retry-After, 연결 끊김)을 주입하여
+resilience 모듈의 재시도, 백오프, 회로 차단기 동작을 확인합니다.
+
+실제 API 할당량을 쓰지 않으며, 시나리오마다 기대한 결과가 아니면 AssertionError로 종료합니다.
+
+실행:
+    python benchmarks/fault_injection.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# 호출 기록·캐시가 저장소의 data 폴더에 남지 않도록 임시 폴더 사용, 속도 제한 없음
+os.environ.setdefault("NAVER_DATA_DIR", tempfile.mkdtemp(prefix="fault_injection_"))
+os.environ.setdefault("NAVER_SEARCH_RATE_PER_SEC", "0")
+os.environ.setdefault("NAVER_SEARCHAD_RATE_PER_SEC", "0")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import naver_api  # noqa: E402
+import rank_scan  # noqa: E402
+import resilience  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+# 점검 시간을 줄이기 위한 짧은 백오프
+RETRIES = 3
+FAST_POLICY = resilience.RetryPolicy(retries=RETRIES, base_delay=0.01, max_delay=0.05, max_retry_after=5)
+
+
+def reset_breakers(failure_threshold: int = 5, reset_timeout: float = 30.0):
+    for name in list(resilience.BREAKERS):
+        resilience.BREAKERS[name] = resilience.CircuitBreaker(name, failure_threshold, reset_timeout)
+
+
+def starts_for(server: StubServer, query: str):
+    """검색어별로 요청된 페이지 시작 위치 목록 (요청 순서)"""
+    return [start for _, logged_query, start in server.request_log if logged_query == query]
+
+
+def scenario_page_retry(server: StubServer):
+    """순위 검색 7페이지에서 500 한 번: 그 페이지만 다시 요청하고 1~6페이지는 유지"""
+    server.inject_fault(500, count=1, start=601)
+    result = rank_scan.find_best_product("페이지재시도", "없는스토어", prefetch=True)
+    starts = starts_for(server, "페이지재시도")
+
+    assert result is None
+    assert starts.count(601) == 2, starts
+    assert all(starts.count(start) == 1 for start in range(1, 1001, 100) if start != 601), starts
+    return f"요청 {len(starts)}회 (페이지 10개 + 7페이지 재시도 1회)"
+
+
+def scenario_retry_after(server: StubServer):
+    """429 + Retry-After: 1 -> 1초 기다린 뒤 재시도"""
+    server.inject_fault(429, count=1, retry_after=1)
+    began = time.perf_counter()
+    naver_api.search_shop("재시도대기", use_cache=False)
+    elapsed = time.perf_counter() - began
+
+    assert elapsed >= 1.0, elapsed
+    assert len(starts_for(server, "재시도대기")) == 2
+    return f"{elapsed:.2f}초 후 성공"
+
+
+def scenario_connection_drop(server: StubServer):
+    """응답 없이 연결이 끊기면 연결 오류로 보고 재시도"""
+    server.inject_fault(0, count=1)
+    naver_api.search_shop("연결끊김", use_cache=False)
+
+    assert len(starts_for(server, "연결끊김")) == 2
+    return "두 번째 요청에서 성공"
+
+
+def scenario_retries_exhausted(server: StubServer):
+    """503이 계속되면 재시도 횟수만큼 시도한 뒤 NaverApiError 전달"""
+    server.inject_fault(503, count=RETRIES + 1)
+    try:
+        naver_api.search_shop("재시도소진", use_cache=False)
+    except naver_api.NaverApiError as e:
+        assert e.status == 503
+    else:
+        raise AssertionError("NaverApiError가 발생하지 않음")
+
+    assert len(starts_for(server, "재시도소진")) == RETRIES + 1
+    return f"요청 {RETRIES + 1}회 후 오류 전달"
+
+
+def scenario_no_retry_on_client_error(server: StubServer):
+    """400은 다시 시도하지 않고 회로 차단기 실패로도 집계하지 않음"""
+    server.inject_fault(400, count=1)
+    try:
+        naver_api.search_shop("잘못된요청", use_cache=False)
+    except naver_api.NaverApiError as e:
+        assert e.status == 400
+    else:
+        raise AssertionError("NaverApiError가 발생하지 않음")
+
+    assert len(starts_for(server, "잘못된요청")) == 1
+    assert resilience.BREAKERS["search"].state == "closed"
+    return "요청 1회, 회로 닫힘 유지"
+
+
+def scenario_circuit_breaker(server: StubServer):
+    """연속 실패가 기준을 넘으면 요청을 보내지 않고, 차단 시간이 지나면 시험 요청 1개로 복구"""
+    reset_breakers(failure_threshold=3, reset_timeout=0.5)
+    server.inject_fault(500, count=1000)
+
+    try:
+        naver_api.search_shop("회로차단", use_cache=False)
+    except naver_api.NaverApiError:
+        pass
+    sent = len(starts_for(server, "회로차단"))
+    assert resilience.BREAKERS["search"].state == "open"
+
+    # 열린 동안에는 서버에 요청이 가지 않음
+    for _ in range(5):
+        try:
+            naver_api.search_shop("회로차단", use_cache=False)
+        except resilience.CircuitOpenError:
+            pass
+        else:
+            raise AssertionError("CircuitOpenError가 발생하지 않음")
+    assert len(starts_for(server, "회로차단")) == sent
+
+    server.clear_faults()
+    time.sleep(0.5)
+    assert resilience.BREAKERS["search"].state == "half_open"
+    naver_api.search_shop("회로차단", use_cache=False)
+    assert resilience.BREAKERS["search"].state == "closed"
+    return f"실패 {sent}회 후 차단, 차단 중 요청 0회, {0.5}초 후 복구"
+
+
+def scenario_breaker_disabled(server: StubServer):
+    """회로 차단기를 끄면(기준 0) 차단 없이 재시도 횟수만큼 시도"""
+    reset_breakers(failure_threshold=0)
+    server.inject_fault(503, count=RETRIES + 1)
+    try:
+        naver_api.search_shop("차단기꺼짐", use_cache=False)
+    except naver_api.NaverApiError as e:
+        assert e.status == 503
+    else:
+        raise AssertionError("NaverApiError가 발생하지 않음")
+
+    assert len(starts_for(server, "차단기꺼짐")) == RETRIES + 1
+    assert resilience.BREAKERS["search"].state == "closed"
+    naver_api.search_shop("차단기꺼짐", use_cache=False)
+    return f"요청 {RETRIES + 1}회 후 오류 전달, 다음 요청은 바로 전송"
+
+
+def scenario_keywordstool_retry(server: StubServer):
+    """키워드 도구 503 한 번: 재시도마다 새로 서명해 두 번째 요청에서 성공"""
+    server.inject_fault(503, count=1, path="/keywordstool")
+    data = naver_api.get_keywordstool("광고", use_cache=False)
+
+    requested = [path for path, _, _ in server.request_log if path == "/keywordstool"]
+    assert len(requested) == 2, requested
+    assert data["keywordList"], data
+    return "재시도 후 응답 반환"
+
+
+SCENARIOS = [
+    scenario_page_retry,
+    scenario_retry_after,
+    scenario_connection_drop,
+    scenario_retries_exhausted,
+    scenario_no_retry_on_client_error,
+    scenario_circuit_breaker,
+    scenario_breaker_disabled,
+    scenario_keywordstool_retry,
+]
+
+
+def main():
+    resilience.DEFAULT_POLICY = FAST_POLICY
+
+    with StubServer() as server:
+        naver_api.SHOP_SEARCH_URL = f"{server.base_url}/v1/search/shop.json"
+        naver_api.SEARCHAD_BASE_URL = server.base_url
+
+        for scenario in SCENARIOS:
+            server.reset_stats()
+            server.clear_faults()
+            reset_breakers()
+            detail = scenario(server)
+            print(f"✅ {scenario.__doc__.strip().splitlines()[0]}\n   {detail}")
+
+    print(f"\n{len(SCENARIOS)}개 시나리오 통과")
+
+
+if __name__ == "__main__":
+    main()
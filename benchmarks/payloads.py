@@ -0,0 +1,89 @@
+"""
+벤치마크용 가짜 API 응답 생성기
+실제 shop.json, keywordList 응답과 비슷한 분포의 응답을 100~100,000개 규모로 만듭니다.
+
+같은 인자에는 항상 같은 응답을 돌려주므로 실행 사이의 시간을 비교할 수 있습니다.
+    - 상품명: 검색어를 <b> 태그로 감싸고 단어 3~8개, 약 15%는 앞선 상품명과 중복
+    - 최저가: 약 3%는 빈 문자열, 판매처는 소수 판매처에 몰린 분포, 브랜드 약 30%는 빈 값
+    - keywordList: 검색수 숫자·"< 10" 혼합, 클릭수·클릭률 실수, 경쟁정도 문자열
+"""
+
+import random
+from typing import Dict, List
+
+_WORDS = ["무선", "유선", "블루투스", "기계식", "저소음", "게이밍", "사무용", "휴대용", "미니", "풀배열",
+          "텐키리스", "RGB", "백라이트", "충전식", "멀티페어링", "USB", "C타입", "한글", "각인", "화이트",
+          "블랙", "그레이", "정품", "국내", "당일발송", "무료배송", "1+1", "세트", "신형", "2024년형",
+          "의", "을", "에서", "로"]
+_CATEGORIES = [("디지털/가전", "PC주변기기"), ("디지털/가전", "노트북"), ("생활/건강", "문구/사무용품"),
+               ("디지털/가전", "")]
+
+
+def make_shop_items(query: str, count: int, seed: int = 0) -> List[Dict]:
+    """검색어 query의 가짜 shop.json items count개"""
+    rng = random.Random(f"{seed}:{query}:{count}")
+    malls = [f"스토어{index}" for index in range(max(20, count // 20))]
+    brands = [f"브랜드{index}" for index in range(100)]
+
+    items = []
+    titles: List[str] = []
+    for rank in range(1, count + 1):
+        if titles and rng.random() < 0.15:
+            title = rng.choice(titles)
+        else:
+            words = rng.sample(_WORDS, rng.randint(3, 8))
+            words.insert(rng.randint(0, len(words)), f"<b>{query}</b>")
+            title = " ".join(words)
+            titles.append(title)
+
+        category1, category2 = rng.choice(_CATEGORIES)
+        items.append({
+            "title": title,
+            "link": f"https://search.shopping.naver.com/catalog/{seed}{rank:07d}",
+            "image": f"https://shopping-phinf.pstatic.net/main_{rank:07d}/{rank:07d}.jpg",
+            "lprice": "" if rng.random() < 0.03 else str(rng.randrange(3_000, 300_000, 10)),
+            "hprice": "",
+            # 상위 판매처에 상품이 몰리는 분포
+            "mallName": malls[min(int(rng.paretovariate(1.2)) - 1, len(malls) - 1)],
+            "productId": str(80_000_000_000 + rank),
+            "productType": rng.choice(["1", "2", "3"]),
+            "brand": "" if rng.random() < 0.3 else rng.choice(brands),
+            "maker": "",
+            "category1": category1,
+            "category2": category2,
+            "category3": "",
+            "category4": "",
+        })
+    return items
+
+
+def make_shop_response(query: str, count: int, start: int = 1, seed: int = 0) -> Dict:
+    """가짜 shop.json 응답 (items count개)"""
+    return {
+        "lastBuildDate": "Mon, 01 Jan 2024 00:00:00 +0900",
+        "total": max(count, 100_000),
+        "start": start,
+        "display": count,
+        "items": make_shop_items(query, count, seed),
+    }
+
+
+def make_keyword_list(hint: str, count: int, seed: int = 0) -> List[Dict]:
+    """힌트 키워드 hint의 가짜 keywordList count개 (검색수 약 20%는 "< 10")"""
+    rng = random.Random(f"{seed}:{hint}:{count}")
+    keyword_list = []
+    for index in range(count):
+        pc = rng.choice((rng.randint(0, 9), rng.randint(10, 5_000), rng.randint(5_000, 200_000)))
+        mobile = rng.choice((rng.randint(0, 9), rng.randint(10, 20_000), rng.randint(20_000, 800_000)))
+        keyword_list.append({
+            "relKeyword": hint if index == 0 else f"{hint}{rng.choice(_WORDS)}{index}",
+            "monthlyPcQcCnt": pc if pc >= 10 else "< 10",
+            "monthlyMobileQcCnt": mobile if mobile >= 10 else "< 10",
+            "monthlyAvePcClkCnt": round(rng.random() * 500, 1),
+            "monthlyAveMobileClkCnt": round(rng.random() * 2000, 1),
+            "monthlyAvePcCtr": round(rng.random() * 3, 2),
+            "monthlyAveMobileCtr": round(rng.random() * 5, 2),
+            "plAvgDepth": rng.randint(0, 15),
+            "compIdx": rng.choice(["낮음", "중간", "높음"]),
+        })
+    return keyword_list
@@ -0,0 +1,588 @@
+"""
+로컬 API 대체(스텁) 서버
+실제 API 할당량을 쓰지 않고 HTTP 클라이언트 동작과 성능, 부하를 측정하기 위한 서버입니다.
+
+흉내내는 API:
+    GET  /v1/search/shop.json                   네이버 쇼핑 검색 (start/display/sort/total, 결정적 가짜 상품)
+    GET  /keywordstool                          네이버 검색광고 키워드 도구 (X-Signature 서명 검증)
+    GET  /v1/models                             Gemini 모델 목록
+    POST /v1/models/{모델}:generateContent       Gemini 글 생성
+    POST /v1/models/{모델}:streamGenerateContent Gemini 글 생성 스트리밍 (alt=sse면 SSE, 아니면 JSON 배열)
+
+같은 요청에는 항상 같은 응답을 돌려주므로 실행마다 결과를 비교할 수 있습니다.
+HTTP/1.1 keep-alive를 지원하며, 새로 수락한 TCP 연결 수를 세어
+클라이언트가 연결을 재사용하는지 확인할 수 있습니다.
+
+inject_fault()로 특정 페이지(start)에 오류 응답(429, 5xx, Retry-After)이나
+응답 없는 연결 끊김을 원하는 횟수만큼 주입할 수 있습니다.
+response_delay/response_jitter로 응답 지연, error_rate로 임의 503 비율,
+rate_limits로 API별 초당 요청 한도(초과 시 429)를 설정할 수 있습니다.
+Gemini 생성 글은 gemini_chunk_chars자씩 gemini_chunk_delay초 간격으로 만들어지는 것으로 흉내내어,
+일반 생성은 전체 시간이 지난 뒤 한 번에, 스트리밍은 조각마다 바로 보냅니다.
+
+단독 실행 후 출력되는 환경 변수를 설정하면 앱(app.py, pages/)도 이 서버를 사용합니다:
+    python benchmarks/stub_server.py --port 8765 --latency-ms 80 --error-rate 0.01
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import hmac
+import json
+import random
+import threading
+import time
+import urllib.parse
+import zlib
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+SHOP_PATH = "/v1/search/shop.json"
+KEYWORDSTOOL_PATH = "/keywordstool"
+
+SHOP_SORTS = ("sim", "date", "asc", "dsc")
+# 쇼핑 검색 API는 start 1000, display 100까지 허용
+SHOP_MAX_START = 1000
+SHOP_MAX_DISPLAY = 100
+
+# 검색광고 API가 허용하는 서명 타임스탬프 오차(초)
+SIGNATURE_MAX_SKEW = 300
+
+GEMINI_MODELS = [
+    {"name": "models/gemini-stub-flash", "displayName": "Gemini Stub Flash",
+     "supportedGenerationMethods": ["generateContent", "streamGenerateContent", "countTokens"]},
+    {"name": "models/gemini-stub-pro", "displayName": "Gemini Stub Pro",
+     "supportedGenerationMethods": ["generateContent", "streamGenerateContent", "countTokens"]},
+    {"name": "models/embedding-stub", "displayName": "Embedding Stub",
+     "supportedGenerationMethods": ["embedContent"]},
+]
+
+_COMP_LEVELS = ("낮음", "중간", "높음")
+_RELATED_SUFFIXES = ("추천", "가격", "후기", "순위", "세트", "정품", "할인", "브랜드", "인기", "최저가")
+
+
+def _hash(*parts) -> int:
+    """문자열 조각으로 결정되는 32비트 해시 (실행마다 같은 값)"""
+    return zlib.crc32(":".join(str(part) for part in parts).encode("utf-8"))
+
+
+def _price(query: str, rank: int) -> int:
+    return 1000 + _hash(query, rank) % 100_000 // 10 * 10
+
+
+def make_shop_item(query: str, rank: int) -> Dict:
+    """검색어와 정확도순 순위로 결정되는 가짜 쇼핑 상품 1개"""
+    return {
+        "title": f"<b>{query}</b> 상품 {rank}",
+        "link": f"https://search.shopping.naver.com/catalog/{rank}",
+        "image": "",
+        "lprice": str(_price(query, rank)),
+        "hprice": "",
+        "mallName": f"스토어{rank % 50}",
+        "productId": str(100000 + rank),
+        "productType": "1",
+        "brand": f"브랜드{rank % 20}",
+        "maker": "",
+        "category1": "디지털/가전",
+        "category2": "PC주변기기",
+        "category3": "",
+        "category4": "",
+    }
+
+
+def make_shop_items(query: str, start: int, display: int) -> List[Dict]:
+    """검색어와 위치로 결정되는 가짜 쇼핑 상품 목록 생성 (정확도순)"""
+    return [make_shop_item(query, rank) for rank in range(start, start + display)]
+
+
+@lru_cache(maxsize=256)
+def shop_order(query: str, total: int, sort: str) -> tuple:
+    """정렬 기준별 상품 순서 (정확도순 순위 목록, 조회할 수 있는 최대 1099개까지)"""
+    ranks = range(1, min(total, SHOP_MAX_START + SHOP_MAX_DISPLAY - 1) + 1)
+    if sort == "asc":
+        return tuple(sorted(ranks, key=lambda rank: (_price(query, rank), rank)))
+    if sort == "dsc":
+        return tuple(sorted(ranks, key=lambda rank: (-_price(query, rank), rank)))
+    if sort == "date":
+        return tuple(sorted(ranks, key=lambda rank: _hash("date", query, rank)))
+    return tuple(ranks)
+
+
+def make_keyword_stats(keyword: str) -> Dict:
+    """키워드로 결정되는 가짜 keywordList 항목 (검색수 10 미만은 "< 10")"""
+    rng = random.Random(_hash("keyword", keyword))
+    pc = rng.choice((rng.randint(0, 9), rng.randint(10, 5_000), rng.randint(5_000, 200_000)))
+    mobile = rng.choice((rng.randint(0, 9), rng.randint(10, 20_000), rng.randint(20_000, 800_000)))
+    pc_ctr = round(rng.uniform(0, 5), 2)
+    mobile_ctr = round(rng.uniform(0, 8), 2)
+    return {
+        "relKeyword": keyword,
+        "monthlyPcQcCnt": pc if pc >= 10 else "< 10",
+        "monthlyMobileQcCnt": mobile if mobile >= 10 else "< 10",
+        "monthlyAvePcClkCnt": round(pc * pc_ctr / 100, 1),
+        "monthlyAveMobileClkCnt": round(mobile * mobile_ctr / 100, 1),
+        "monthlyAvePcCtr": pc_ctr,
+        "monthlyAveMobileCtr": mobile_ctr,
+        "plAvgDepth": rng.randint(0, 15),
+        "compIdx": rng.choice(_COMP_LEVELS),
+    }
+
+
+def make_keyword_list(hint_keywords: List[str], related: int) -> List[Dict]:
+    """힌트 키워드와 연관 키워드 related개의 통계 목록"""
+    keywords = list(hint_keywords)
+    for index in range(related):
+        hint = hint_keywords[index % len(hint_keywords)]
+        round_no = index // len(_RELATED_SUFFIXES)
+        keywords.append(f"{hint}{_RELATED_SUFFIXES[index % len(_RELATED_SUFFIXES)]}{round_no or ''}")
+    return [make_keyword_stats(keyword) for keyword in keywords]
+
+
+def searchad_signature(timestamp: str, method: str, uri: str, secret_key: str) -> str:
+    """검색광고 API 서명 (HMAC-SHA256, base64)"""
+    message = f"{timestamp}.{method}.{uri}".encode("utf-8")
+    return base64.b64encode(hmac.new(secret_key.encode("utf-8"), message, hashlib.sha256).digest()).decode("ascii")
+
+
+def make_gemini_text(model: str, prompt: str, length: int) -> str:
+    """프롬프트로 결정되는 가짜 생성 글 (약 length자)"""
+    sentence = f"{model} 모델이 생성한 예시 문장 {_hash(prompt) % 1000}번입니다. "
+    return "<p>" + (sentence * (length // len(sentence) + 1))[:length] + "</p>"
+
+
+def api_for_path(path: str) -> str:
+    """요청 경로의 API 이름 (search, searchad, gemini)"""
+    if path == SHOP_PATH:
+        return "search"
+    if path == KEYWORDSTOOL_PATH:
+        return "searchad"
+    return "gemini"
+
+
+class _RateWindow:
+    """초당 요청 수 한도 (토큰 버킷, 토큰이 없으면 거부)"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """쇼핑 검색, 검색광고 키워드 도구, Gemini API 응답을 흉내내는 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+    # keep-alive 연결에서 Nagle 알고리즘과 지연 ACK가 겹쳐 생기는 40ms 지연 방지
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.stats_lock:
+            self.server.connections += 1
+        # 새 연결마다 TCP+TLS 핸드셰이크 왕복 시간을 흉내냄
+        if self.server.handshake_delay:
+            time.sleep(self.server.handshake_delay)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def handle_request(self, method: str):
+        parsed = urllib.parse.urlparse(self.path)
+        params = {name: values[0] for name, values in urllib.parse.parse_qs(parsed.query).items()}
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        api = api_for_path(parsed.path)
+        query = params.get("query") or params.get("hintKeywords") or parsed.path.rsplit("/", 1)[-1]
+        start = int(params["start"]) if api == "search" and params.get("start", "").isdigit() else 1
+
+        with self.server.stats_lock:
+            self.server.requests += 1
+            self.server.request_log.append((parsed.path, query, start))
+            fault = self.server.take_fault(parsed.path, start)
+            allowed = self.server.allow_request(api)
+            random_error = self.server.error_rate and self.server.rng.random() < self.server.error_rate
+
+        self.server.wait_latency()
+
+        if fault is not None:
+            if fault["status"] == 0:
+                # 응답 없이 연결 끊기 (클라이언트에서는 연결 오류)
+                self.close_connection = True
+                self.connection.shutdown(2)
+                return
+            headers = {}
+            if fault["retry_after"] is not None:
+                headers["Retry-After"] = str(fault["retry_after"])
+            self.send_json(fault["status"], {"errorMessage": "Injected fault", "errorCode": str(fault["status"])},
+                           headers)
+            return
+
+        if not allowed:
+            self.send_json(429, {"errorMessage": "Rate limit exceeded. (속도 제한을 초과했습니다.)",
+                                 "errorCode": "012"}, {"Retry-After": "1"})
+            return
+        if random_error:
+            self.send_json(503, {"errorMessage": "Service Unavailable", "errorCode": "503"})
+            return
+
+        if method == "GET" and parsed.path == SHOP_PATH:
+            self.handle_shop(params)
+        elif method == "GET" and parsed.path == KEYWORDSTOOL_PATH:
+            self.handle_keywordstool(params)
+        elif method == "GET" and parsed.path in ("/v1/models", "/v1beta/models"):
+            self.handle_gemini_models(params)
+        elif method == "POST" and parsed.path.endswith(":generateContent"):
+            self.handle_gemini_generate(parsed.path, params, body)
+        elif method == "POST" and parsed.path.endswith(":streamGenerateContent"):
+            self.handle_gemini_stream(parsed.path, params, body)
+        else:
+            self.send_json(404, {"errorMessage": "Not Found"})
+
+    def handle_shop(self, params: Dict[str, str]):
+        """쇼핑 검색: 잘못된 파라미터는 실제 API처럼 400 + 오류 코드"""
+        query = params.get("query", "")
+        display = params.get("display", "10")
+        start = params.get("start", "1")
+        sort = params.get("sort", "sim")
+
+        if not query:
+            self.send_json(400, {"errorMessage": "Incorrect query request (잘못된 쿼리요청입니다.)",
+                                 "errorCode": "SE01"})
+            return
+        if not display.isdigit() or not 1 <= int(display) <= SHOP_MAX_DISPLAY:
+            self.send_json(400, {"errorMessage": "Invalid display value (부적절한 display 값입니다.)",
+                                 "errorCode": "SE02"})
+            return
+        if not start.isdigit() or not 1 <= int(start) <= SHOP_MAX_START:
+            self.send_json(400, {"errorMessage": "Invalid start value (부적절한 start 값입니다.)",
+                                 "errorCode": "SE03"})
+            return
+        if sort not in SHOP_SORTS:
+            self.send_json(400, {"errorMessage": "Invalid sort value (부적절한 sort 값입니다.)",
+                                 "errorCode": "SE04"})
+            return
+
+        start, display = int(start), int(display)
+        total = self.server.shop_total(query)
+        ranks = shop_order(query, total, sort)[start - 1:start - 1 + display]
+        self.send_json(200, {
+            "lastBuildDate": time.strftime("%a, %d %b %Y %H:%M:%S +0900"),
+            "total": total,
+            "start": start,
+            "display": len(ranks),
+            "items": [make_shop_item(query, rank) for rank in ranks],
+        })
+
+    def handle_keywordstool(self, params: Dict[str, str]):
+        """키워드 도구: 인증 헤더와 서명을 확인한 뒤 힌트 키워드(최대 5개)의 연관 키워드 통계"""
+        error = self.server.check_searchad_headers(self.headers, "GET", KEYWORDSTOOL_PATH)
+        if error:
+            self.send_json(403, {"code": 1018, "title": error})
+            return
+
+        hints = [hint.strip() for hint in params.get("hintKeywords", "").split(",") if hint.strip()]
+        if not hints or len(hints) > 5:
+            self.send_json(400, {"code": 11001, "title": "hintKeywords는 1~5개여야 합니다."})
+            return
+
+        self.send_json(200, {"keywordList": make_keyword_list(hints, self.server.related_keywords)})
+
+    def handle_gemini_models(self, params: Dict[str, str]):
+        if not self.server.check_gemini_key(params.get("key")):
+            self.send_gemini_error(400, "API key not valid. Please pass a valid API key.", "INVALID_ARGUMENT")
+            return
+        self.send_json(200, {"models": GEMINI_MODELS})
+
+    def parse_gemini_request(self, path: str, params: Dict[str, str], body: bytes) -> Optional[tuple]:
+        """글 생성 요청의 (모델, 프롬프트), 잘못된 요청이면 오류 응답을 보내고 None"""
+        if not self.server.check_gemini_key(params.get("key")):
+            self.send_gemini_error(400, "API key not valid. Please pass a valid API key.", "INVALID_ARGUMENT")
+            return None
+
+        # /v1/models/gemini-stub-flash:generateContent -> models/gemini-stub-flash, generateContent
+        model, method = path.split("/", 2)[-1].rsplit(":", 1)
+        if model not in {entry["name"] for entry in GEMINI_MODELS
+                         if method in entry["supportedGenerationMethods"]}:
+            self.send_gemini_error(404, f"{model} is not found or is not supported for {method}.", "NOT_FOUND")
+            return None
+
+        try:
+            payload = json.loads(body or b"{}")
+            prompt = "".join(part.get("text", "") for content in payload["contents"] for part in content["parts"])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self.send_gemini_error(400, "Invalid JSON payload received.", "INVALID_ARGUMENT")
+            return None
+        return model, prompt
+
+    def gemini_chunks(self, model: str, prompt: str) -> List[str]:
+        """생성 글을 스트리밍 조각으로 나눈 목록"""
+        text = make_gemini_text(model, prompt, self.server.gemini_output_chars)
+        size = max(1, self.server.gemini_chunk_chars)
+        return [text[index:index + size] for index in range(0, len(text), size)]
+
+    @staticmethod
+    def gemini_response(model: str, prompt: str, text: str, finished: bool = True) -> Dict:
+        """generateContent 응답 형식 (스트리밍은 조각마다 하나, 마지막 조각에만 finishReason)"""
+        candidate = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+        response = {"candidates": [candidate], "modelVersion": model.split("/", 1)[-1]}
+        if finished:
+            candidate["finishReason"] = "STOP"
+            response["usageMetadata"] = {"promptTokenCount": len(prompt) // 4,
+                                         "candidatesTokenCount": len(text) // 4,
+                                         "totalTokenCount": (len(prompt) + len(text)) // 4}
+        return response
+
+    def handle_gemini_generate(self, path: str, params: Dict[str, str], body: bytes):
+        request = self.parse_gemini_request(path, params, body)
+        if request is None:
+            return
+        model, prompt = request
+
+        chunks = self.gemini_chunks(model, prompt)
+        # 글 전체가 만들어질 때까지 기다렸다가 한 번에 응답
+        time.sleep(self.server.gemini_chunk_delay * len(chunks))
+        self.send_json(200, self.gemini_response(model, prompt, "".join(chunks)))
+
+    def handle_gemini_stream(self, path: str, params: Dict[str, str], body: bytes):
+        """스트리밍 생성: 조각마다 chunked 전송 (alt=sse면 "data: {...}" 이벤트, 아니면 JSON 배열)"""
+        request = self.parse_gemini_request(path, params, body)
+        if request is None:
+            return
+        model, prompt = request
+        sse = params.get("alt") == "sse"
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if sse else "application/json; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        chunks = self.gemini_chunks(model, prompt)
+        if not sse:
+            self.write_chunk(b"[")
+        for index, text in enumerate(chunks):
+            time.sleep(self.server.gemini_chunk_delay)
+            finished = index == len(chunks) - 1
+            data = json.dumps(self.gemini_response(model, prompt, text, finished), ensure_ascii=False)
+            if sse:
+                self.write_chunk(f"data: {data}\r\n\r\n".encode("utf-8"))
+            else:
+                self.write_chunk((data if index == 0 else f",\r\n{data}").encode("utf-8"))
+        if not sse:
+            self.write_chunk(b"]")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def write_chunk(self, data: bytes):
+        """Transfer-Encoding: chunked 조각 1개 전송"""
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def send_gemini_error(self, status: int, message: str, reason: str):
+        self.send_json(status, {"error": {"code": status, "message": message, "status": reason}})
+
+    def send_json(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    백그라운드 스레드에서 실행되는 스텁 서버
+
+    Args:
+        handshake_delay: 새 연결마다 추가할 지연(초)
+        response_delay: 응답마다 추가할 지연(초)
+        response_jitter: 응답 지연에 더할 임의 시간의 최대값(초)
+        error_rate: 임의로 503을 응답할 비율 (0~1)
+        rate_limits: API별(search, searchad, gemini) 초당 요청 한도, 초과하면 429
+        shop_total: 쇼핑 검색 결과 수 (totals에 없는 검색어)
+        totals: 검색어별 쇼핑 검색 결과 수
+        related_keywords: 키워드 도구 응답의 연관 키워드 수 (힌트 키워드 제외)
+        api_key, secret_key: 검색광고 API 인증 키 (기본값은 config 기본값과 같음)
+        gemini_key: Gemini API 키 (None이면 비어 있지 않은 모든 키 허용)
+        gemini_output_chars: Gemini 생성 글 길이
+        gemini_chunk_chars: Gemini 스트리밍 조각 하나의 글자 수
+        gemini_chunk_delay: Gemini 조각 하나를 만드는 시간(초), 일반 생성은 조각 수만큼 기다린 뒤 응답
+        seed: 지연·오류 난수 시드
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, handler=StubHandler,
+                 handshake_delay: float = 0.0, response_delay: float = 0.0, response_jitter: float = 0.0,
+                 error_rate: float = 0.0, rate_limits: Optional[Dict[str, float]] = None,
+                 shop_total: int = 5000, totals: Optional[Dict[str, int]] = None, related_keywords: int = 50,
+                 api_key: str = "your_api_key_here", secret_key: str = "your_secret_key_here",
+                 gemini_key: Optional[str] = None, gemini_output_chars: int = 3000,
+                 gemini_chunk_chars: int = 60, gemini_chunk_delay: float = 0.0, seed: int = 42):
+        super().__init__((host, port), handler)
+        self.handshake_delay = handshake_delay
+        self.response_delay = response_delay
+        self.response_jitter = response_jitter
+        self.error_rate = error_rate
+        self.rate_windows = {api: _RateWindow(rate) for api, rate in (rate_limits or {}).items() if rate > 0}
+        self.default_total = shop_total
+        self.totals = dict(totals or {})
+        self.related_keywords = related_keywords
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.gemini_key = gemini_key
+        self.gemini_output_chars = gemini_output_chars
+        self.gemini_chunk_chars = gemini_chunk_chars
+        self.gemini_chunk_delay = gemini_chunk_delay
+        self.rng = random.Random(seed)
+        self.stats_lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.request_log: List[tuple] = []
+        self.faults: List[Dict] = []
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.connections = 0
+            self.requests = 0
+            self.request_log = []
+
+    def shop_total(self, query: str) -> int:
+        return self.totals.get(query, self.default_total)
+
+    def allow_request(self, api: str) -> bool:
+        """API별 초당 요청 한도 확인 (stats_lock을 잡은 상태에서 호출)"""
+        window = self.rate_windows.get(api)
+        return window is None or window.allow()
+
+    def wait_latency(self):
+        """설정된 응답 지연만큼 대기"""
+        delay = self.response_delay
+        if self.response_jitter:
+            with self.stats_lock:
+                delay += self.rng.uniform(0, self.response_jitter)
+        if delay:
+            time.sleep(delay)
+
+    def check_searchad_headers(self, headers, method: str, uri: str) -> Optional[str]:
+        """검색광고 API 인증 헤더 확인 (문제가 없으면 None, 있으면 오류 메시지)"""
+        timestamp = headers.get("X-Timestamp", "")
+        if not (timestamp.isdigit() and headers.get("X-Customer") and headers.get("X-Signature")):
+            return "인증 헤더(X-Timestamp, X-API-KEY, X-Customer, X-Signature)가 없습니다."
+        if headers.get("X-API-KEY") != self.api_key:
+            return "등록되지 않은 API 키입니다."
+        if abs(time.time() - int(timestamp) / 1000) > SIGNATURE_MAX_SKEW:
+            return "서명 타임스탬프가 만료되었습니다."
+        expected = searchad_signature(timestamp, method, uri, self.secret_key)
+        if not hmac.compare_digest(headers["X-Signature"], expected):
+            return "서명이 올바르지 않습니다."
+        return None
+
+    def check_gemini_key(self, key: Optional[str]) -> bool:
+        return bool(key) and (self.gemini_key is None or key == self.gemini_key)
+
+    def inject_fault(self, status: int = 500, count: int = 1, start: Optional[int] = None,
+                     retry_after: Optional[int] = None, path: Optional[str] = None):
+        """
+        다음 요청부터 오류 응답 주입
+
+        Args:
+            status: 응답 상태 코드 (0이면 응답 없이 연결을 끊음)
+            count: 주입 횟수
+            start: 이 시작 위치(페이지) 요청에만 주입, 없으면 모든 요청
+            retry_after: Retry-After 헤더 값(초)
+            path: 이 경로 요청에만 주입, 없으면 모든 경로
+        """
+        with self.stats_lock:
+            self.faults.append({"status": status, "count": count, "start": start,
+                                "retry_after": retry_after, "path": path})
+
+    def take_fault(self, path: str, start: int) -> Optional[Dict]:
+        """요청에 해당하는 주입 오류를 하나 꺼냄 (stats_lock을 잡은 상태에서 호출)"""
+        for fault in self.faults:
+            if fault["start"] not in (None, start) or fault["path"] not in (None, path):
+                continue
+            fault["count"] -= 1
+            if fault["count"] <= 0:
+                self.faults.remove(fault)
+            return fault
+        return None
+
+    def clear_faults(self):
+        with self.stats_lock:
+            self.faults = []
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 API 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 (밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="응답 지연에 더할 임의 시간 최대값 (밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="임의 503 응답 비율 (0~1)")
+    parser.add_argument("--search-rate", type=float, default=0.0, help="쇼핑 검색 초당 요청 한도 (0은 무제한)")
+    parser.add_argument("--searchad-rate", type=float, default=0.0, help="검색광고 초당 요청 한도 (0은 무제한)")
+    parser.add_argument("--gemini-rate", type=float, default=0.0, help="Gemini 초당 요청 한도 (0은 무제한)")
+    parser.add_argument("--gemini-chunk-ms", type=float, default=0.0,
+                        help="Gemini 생성 글 조각(60자) 하나를 만드는 시간 (밀리초)")
+    parser.add_argument("--total", type=int, default=5000, help="쇼핑 검색 결과 수")
+    parser.add_argument("--api-key", default="stub-api-key", help="검색광고 API 키")
+    parser.add_argument("--secret-key", default="stub-secret-key", help="검색광고 API 비밀 키 (서명 검증)")
+    args = parser.parse_args()
+
+    rate_limits = {"search": args.search_rate, "searchad": args.searchad_rate, "gemini": args.gemini_rate}
+    with StubServer(args.host, args.port, response_delay=args.latency_ms / 1000,
+                    response_jitter=args.jitter_ms / 1000, error_rate=args.error_rate, rate_limits=rate_limits,
+                    shop_total=args.total, api_key=args.api_key, secret_key=args.secret_key,
+                    gemini_chunk_delay=args.gemini_chunk_ms / 1000) as server:
+        print(f"스텁 서버 실행 중: {server.base_url}")
+        print("앱에서 사용하려면 다음 환경 변수를 설정하세요:")
+        print(f"  NAVER_SHOP_BASE_URL={server.base_url}")
+        print(f"  NAVER_SEARCHAD_BASE_URL={server.base_url}")
+        print(f"  GEMINI_BASE_URL={server.base_url}")
+        print(f"  NAVER_API_KEY={args.api_key}")
+        print(f"  NAVER_SECRET_KEY={args.secret_key}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""
+API 응답 캐시
+자주 쓰는 응답은 메모리(LRU)에, 나머지는 SQLite 파일에 저장하는 2단 캐시입니다.
+같은 검색어·페이지를 다시 조회할 때 API를 호출하지 않고 저장된 응답을 돌려줍니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import config
+
+
+class LRUCache:
+    """항목 수가 제한된 메모리 캐시 (항목별 만료 시각 포함, 스레드 안전)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expires_at: float):
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCache:
+    """SQLite 파일에 JSON으로 저장하는 디스크 캐시 (항목별 TTL)"""
+
+    # set 호출이 이 횟수만큼 쌓이면 만료된 항목 정리
+    PURGE_EVERY = 500
+
+    def __init__(self, path: str, table: str = "responses"):
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[tuple]:
+        """(만료 시각, 값) 반환, 없거나 만료되었으면 None"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None or row[1] <= time.time():
+            return None
+        return row[1], json.loads(row[0])
+
+    # SELECT 1회에 넣는 키 수 (SQLite 바인딩 변수 수 제한 이하)
+    GET_MANY_CHUNK = 500
+
+    def get_many(self, keys: List[str]) -> Dict[str, tuple]:
+        """여러 키를 한 번에 조회 ({키: (만료 시각, 값)}, 없거나 만료된 키는 제외)"""
+        rows = []
+        with self._lock:
+            for index in range(0, len(keys), self.GET_MANY_CHUNK):
+                chunk = keys[index:index + self.GET_MANY_CHUNK]
+                rows.extend(self._conn.execute(
+                    f"SELECT key, value, expires_at FROM {self.table} "
+                    f"WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+                ).fetchall())
+
+        now = time.time()
+        return {key: (expires_at, json.loads(value)) for key, value, expires_at in rows if expires_at > now}
+
+    def set(self, key: str, value: Any, expires_at: float):
+        payload = json.dumps(value, ensure_ascii=False)
+
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, expires_at),
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+
+    def set_many(self, items: Dict[str, Any], expires_at: float):
+        """여러 항목을 한 트랜잭션으로 저장"""
+        rows = [(key, json.dumps(value, ensure_ascii=False), expires_at) for key, value in items.items()]
+
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._conn.commit()
+
+
+class TieredCache:
+    """
+    메모리 LRU + SQLite 2단 캐시
+
+    메모리에서 찾지 못하면 디스크를 확인하고, 디스크에서 찾은 항목은
+    메모리로 올려 다음 조회부터는 디스크를 읽지 않습니다.
+    메모리 캐시는 저장된 객체를 그대로 돌려주므로 호출한 쪽에서 값을 수정하면 안 됩니다.
+    """
+
+    def __init__(self, name: str, ttl: float, memory_entries: int, disk_path: Optional[str] = None):
+        self.name = name
+        self.ttl = ttl
+        self.memory = LRUCache(memory_entries)
+        self.disk = SqliteCache(disk_path, table=name) if disk_path else None
+        self._stats_lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def _count(self, field: str):
+        with self._stats_lock:
+            self._stats[field] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value
+
+        if self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                self.memory.set(key, value, expires_at)
+                self._count("disk_hits")
+                return value
+
+        self._count("misses")
+        return None
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        여러 키 조회 (메모리에 없는 키는 디스크에서 한 번에 읽음)
+
+        Returns:
+            {키: 값} (없는 키는 제외)
+        """
+        found = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            value = self.memory.get(key)
+            if value is not None:
+                found[key] = value
+                self._count("memory_hits")
+            else:
+                missing.append(key)
+
+        on_disk = self.disk.get_many(missing) if missing and self.disk is not None else {}
+        for key, (expires_at, value) in on_disk.items():
+            self.memory.set(key, value, expires_at)
+            found[key] = value
+
+        with self._stats_lock:
+            self._stats["disk_hits"] += len(on_disk)
+            self._stats["misses"] += len(missing) - len(on_disk)
+        return found
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        self.memory.set(key, value, expires_at)
+        if self.disk is not None:
+            self.disk.set(key, value, expires_at)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None):
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        for key, value in items.items():
+            self.memory.set(key, value, expires_at)
+        if self.disk is not None:
+            self.disk.set_many(items, expires_at)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """적중/실패 횟수와 적중률"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        stats["memory_entries"] = len(self.memory)
+        return stats
+
+
+def shop_cache_key(query: str, start: int = 1, display: int = 100, sort: Optional[str] = None) -> str:
+    """쇼핑 검색 요청을 정규화한 캐시 키 (공백 정리, 정렬 기본값 sim)"""
+    normalized_query = " ".join(query.split())
+    return json.dumps([normalized_query, int(start), int(display), sort or "sim"], ensure_ascii=False)
+
+
+CACHE_DB_PATH = os.path.join(config.DATA_DIR, "cache.sqlite3")
+
+# 쇼핑 검색(shop.json) 응답 캐시
+shop_cache = TieredCache(
+    "shop",
+    ttl=config.SHOP_CACHE_TTL,
+    memory_entries=config.SHOP_CACHE_MEMORY_ENTRIES,
+    disk_path=CACHE_DB_PATH if config.SHOP_CACHE_DISK else None,
+)
+
+# 키워드 도구(keywordstool) 응답 캐시
+# 연관 키워드별 통계(keywordList 항목)와 힌트 키워드별 연관 키워드 목록을 따로 저장하여,
+# 힌트로 조회한 적 없이 연관 키워드로만 받았던 키워드도 get_cached_keyword_stats로 통계를 찾을 수 있음
+keyword_stats_cache = TieredCache(
+    "keyword_stats",
+    ttl=config.KEYWORD_STATS_CACHE_TTL,
+    memory_entries=5000,
+    disk_path=CACHE_DB_PATH,
+)
+keyword_hint_cache = TieredCache(
+    "keyword_hints",
+    ttl=config.KEYWORD_STATS_CACHE_TTL,
+    memory_entries=256,
+    disk_path=CACHE_DB_PATH,
+)
+
+
+def keyword_cache_key(keyword: str) -> str:
+    """키워드 도구의 relKeyword 표기(공백 없음, 대문자)에 맞춘 캐시 키"""
+    return "".join(keyword.split()).upper()
+
+
+def store_keywordstool(hint_keyword: str, data: Dict):
+    """keywordstool 응답의 모든 연관 키워드 통계와 힌트 키워드의 연관 목록 저장"""
+    entries = {}
+    rel_keys = []
+    for entry in data.get("keywordList", []):
+        rel_keyword = entry.get("relKeyword")
+        if not rel_keyword:
+            continue
+        key = keyword_cache_key(rel_keyword)
+        entries[key] = entry
+        rel_keys.append(key)
+
+    keyword_stats_cache.set_many(entries)
+    keyword_hint_cache.set(keyword_cache_key(hint_keyword), rel_keys)
+
+
+def get_cached_keywordstool(hint_keyword: str) -> Optional[Dict]:
+    """
+    저장된 통계로 keywordstool 응답 재구성
+
+    Returns:
+        {"keywordList": [...]} 또는 None (힌트 목록이나 일부 통계가 만료된 경우)
+    """
+    rel_keys = keyword_hint_cache.get(keyword_cache_key(hint_keyword))
+    if rel_keys is None:
+        return None
+
+    entries = keyword_stats_cache.get_many(rel_keys)
+    if len(entries) < len(set(rel_keys)):
+        return None
+
+    return {"keywordList": [entries[key] for key in rel_keys]}
+
+
+def get_cached_keyword_stats(keywords: List[str]) -> Dict[str, Dict]:
+    """
+    힌트나 연관 키워드로 받은 적 있는 키워드의 통계 (API 호출 없음)
+
+    Returns:
+        {입력 키워드: keywordList 항목} (저장된 통계가 없는 키워드는 제외)
+    """
+    keys = {keyword: keyword_cache_key(keyword) for keyword in keywords}
+    entries = keyword_stats_cache.get_many(list(keys.values()))
+    return {keyword: entries[key] for keyword, key in keys.items() if key in entries}
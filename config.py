@@ -0,0 +1,95 @@
+"""
+공통 설정
+API 키와 네트워크 관련 설정을 환경 변수에서 읽어옵니다.
+"""
+
+import os
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+# 네이버 쇼핑 검색 API 설정
+CLIENT_ID = os.getenv("NAVER_CLIENT_ID", "your_client_id_here")
+CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET", "your_client_secret_here")
+
+# 네이버 광고 API 설정
+CUSTOMER_ID = os.getenv("NAVER_CUSTOMER_ID", "your_customer_id_here")
+API_KEY = os.getenv("NAVER_API_KEY", "your_api_key_here")
+SECRET_KEY = os.getenv("NAVER_SECRET_KEY", "your_secret_key_here")
+
+# API 기본 주소 (부하 테스트·벤치마크 시 로컬 대체 서버 benchmarks/stub_server.py 주소로 변경)
+SHOP_API_BASE_URL = os.getenv("NAVER_SHOP_BASE_URL", "https://openapi.naver.com").rstrip("/")
+SEARCHAD_API_BASE_URL = os.getenv("NAVER_SEARCHAD_BASE_URL", "https://api.searchad.naver.com").rstrip("/")
+GEMINI_API_BASE_URL = os.getenv("GEMINI_BASE_URL", "https://generativelanguage.googleapis.com").rstrip("/")
+
+# HTTP 연결 설정 (초 단위)
+HTTP_CONNECT_TIMEOUT = float(os.getenv("NAVER_HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("NAVER_HTTP_READ_TIMEOUT", "10"))
+
+# 호스트별로 유지할 keep-alive 연결 수
+HTTP_POOL_SIZE = int(os.getenv("NAVER_HTTP_POOL_SIZE", "20"))
+
+# 캐시, 호출 기록 등 로컬 데이터 저장 위치
+DATA_DIR = os.getenv("NAVER_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+
+# 호출 속도 및 일일 한도 (한도 0은 무제한)
+SEARCH_API_RATE_PER_SEC = float(os.getenv("NAVER_SEARCH_RATE_PER_SEC", "10"))
+SEARCH_API_DAILY_QUOTA = int(os.getenv("NAVER_SEARCH_DAILY_QUOTA", "25000"))
+SEARCHAD_API_RATE_PER_SEC = float(os.getenv("NAVER_SEARCHAD_RATE_PER_SEC", "5"))
+SEARCHAD_API_DAILY_QUOTA = int(os.getenv("NAVER_SEARCHAD_DAILY_QUOTA", "0"))
+
+# 일시적 API 오류(429, 5xx, 연결 오류) 재시도 설정
+# 최대 재시도 횟수 / 백오프 기본·최대 대기(초) / 이보다 긴 Retry-After는 재시도하지 않음(초)
+RETRY_ATTEMPTS = int(os.getenv("NAVER_RETRY_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.getenv("NAVER_RETRY_BASE_DELAY", "0.5"))
+RETRY_MAX_DELAY = float(os.getenv("NAVER_RETRY_MAX_DELAY", "8"))
+RETRY_AFTER_MAX = float(os.getenv("NAVER_RETRY_AFTER_MAX", "30"))
+
+# API별 회로 차단기: 연속 실패 횟수 기준 / 차단 유지 시간(초), 기준이 0이면 사용 안 함
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("NAVER_CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("NAVER_CIRCUIT_RESET_TIMEOUT", "30"))
+
+# 쇼핑 검색 응답 캐시 (TTL 초, 메모리 항목 수, 디스크 캐시 사용 여부)
+SHOP_CACHE_TTL = float(os.getenv("NAVER_SHOP_CACHE_TTL", "600"))
+SHOP_CACHE_MEMORY_ENTRIES = int(os.getenv("NAVER_SHOP_CACHE_MEMORY_ENTRIES", "512"))
+SHOP_CACHE_DISK = os.getenv("NAVER_SHOP_CACHE_DISK", "1") == "1"
+
+# 키워드 도구(keywordstool) 통계 캐시 TTL (월간 집계 데이터이므로 기본 30일)
+KEYWORD_STATS_CACHE_TTL = float(os.getenv("NAVER_KEYWORD_STATS_CACHE_TTL", str(30 * 24 * 3600)))
+
+# 순위 확인 동시 실행 설정
+# 키워드 하나의 페이지 병렬 조회 작업자 수 / 동시에 검색할 키워드 수 / 프로세스 전체 동시 요청 상한
+RANK_SCAN_WORKERS = int(os.getenv("RANK_SCAN_WORKERS", "10"))
+RANK_KEYWORD_WORKERS = int(os.getenv("RANK_KEYWORD_WORKERS", "5"))
+RANK_MAX_INFLIGHT = int(os.getenv("RANK_MAX_INFLIGHT", "20"))
+
+# 순차 조회 시 다음 페이지를 미리 요청할지 여부
+RANK_SCAN_PREFETCH = os.getenv("RANK_SCAN_PREFETCH", "1") == "1"
+
+# 순위 확인 진행 상황 화면 갱신 최소 간격(초), 상품을 찾거나 키워드가 끝나면 바로 갱신
+RANK_UI_UPDATE_INTERVAL = float(os.getenv("RANK_UI_UPDATE_INTERVAL", "0.25"))
+
+# 지연 시간 계측 (진단 페이지), 이름별로 보관할 최근 측정값 수
+METRICS_ENABLED = os.getenv("NAVER_METRICS", "1") == "1"
+METRICS_WINDOW = int(os.getenv("NAVER_METRICS_WINDOW", "1000"))
+
+# 재실행 단위 스팬 추적 (JSONL 파일), 파일 최대 크기(바이트)를 넘으면 백업 개수만큼 돌려 씀
+TRACE_ENABLED = os.getenv("NAVER_TRACE", "0") == "1"
+TRACE_FILE = os.getenv("NAVER_TRACE_FILE", os.path.join(DATA_DIR, "traces.jsonl"))
+TRACE_MAX_BYTES = int(os.getenv("NAVER_TRACE_MAX_BYTES", str(10 * 1024 * 1024)))
+TRACE_BACKUPS = int(os.getenv("NAVER_TRACE_BACKUPS", "5"))
+
+# 관리자 아이디 (쉼표로 구분, 재실행 프로파일링 사용 가능) / 프로파일 요약에 표시할 상위 함수 수
+ADMIN_USERS = [name.strip() for name in os.getenv("NAVER_ADMIN_USERS", "").split(",") if name.strip()]
+PROFILE_TOP_N = int(os.getenv("NAVER_PROFILE_TOP_N", "30"))
+
+# Gemini 모델 목록 캐시 (글 재작성 페이지)
+# 새로 받는 주기(초) / 새로 받기 실패 시 다시 시도할 간격(초) / 요청 타임아웃(초)
+GEMINI_MODELS_TTL = float(os.getenv("GEMINI_MODELS_TTL", "3600"))
+GEMINI_MODELS_RETRY_INTERVAL = float(os.getenv("GEMINI_MODELS_RETRY_INTERVAL", "60"))
+GEMINI_MODELS_TIMEOUT = float(os.getenv("GEMINI_MODELS_TIMEOUT", "10"))
+
+# Gemini 글 생성 스트리밍: 조각 사이 최대 대기 시간(초) / 화면 갱신 최소 간격(초)
+GEMINI_STREAM_READ_TIMEOUT = float(os.getenv("GEMINI_STREAM_READ_TIMEOUT", "120"))
+GEMINI_STREAM_UPDATE_INTERVAL = float(os.getenv("GEMINI_STREAM_UPDATE_INTERVAL", "0.1"))
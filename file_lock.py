@@ -0,0 +1,59 @@
+"""
+프로세스 간 파일 잠금
+여러 프로세스(Streamlit 앱, 배치 CLI)가 같은 파일을 읽고 고쳐 쓰는 구간을 한 번에 하나씩 실행합니다.
+
+잠금은 대상 파일 옆의 "<파일>.lock"에 걸며, 잠근 프로세스가 비정상 종료되어도 운영체제가 풀어 줍니다.
+같은 프로세스의 다른 스레드끼리도 서로 기다립니다.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _lock(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+
+    # msvcrt.LK_LOCK은 10초 동안 재시도한 뒤 OSError를 내므로 풀릴 때까지 반복
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            time.sleep(0.05)
+
+
+def _unlock(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def locked(path: str) -> Iterator[None]:
+    """
+    path 파일에 대한 배타 잠금 (다른 프로세스가 잠그고 있으면 풀릴 때까지 대기)
+
+    사용 예:
+        with file_lock.locked(LEDGER_PATH):
+            읽기 -> 합치기 -> 임시 파일에 쓰고 os.replace
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", "a+b") as f:
+        f.seek(0)
+        _lock(f)
+        try:
+            yield
+        finally:
+            _unlock(f)
@@ -0,0 +1,207 @@
+"""
+Gemini API 클라이언트
+글 재작성 페이지에서 사용하는 모델 목록 조회를 프로세스 전체에서 캐시하고,
+글 생성 결과를 스트리밍(streamGenerateContent, SSE)으로 받습니다.
+
+Streamlit은 글 입력, 옵션 변경 등 상호작용마다 페이지를 다시 실행하므로, 재실행마다
+/v1/models를 호출하면 그때마다 네트워크 왕복만큼 화면이 늦어집니다.
+모델 목록은 거의 바뀌지 않으므로 API 키별로 메모리에 보관하고,
+    - 처음 조회할 때만 요청을 기다리고 (여러 세션이 동시에 조회해도 요청은 한 번)
+    - config.GEMINI_MODELS_TTL이 지나면 보관한 목록을 바로 돌려준 뒤 백그라운드 스레드에서 새로 받습니다.
+새로 받기에 실패하면 기존 목록을 계속 사용하고 config.GEMINI_MODELS_RETRY_INTERVAL 뒤에 다시 시도합니다.
+
+2500자 이상의 글은 전체가 만들어질 때까지 수십 초가 걸리므로, stream_generate_content()는
+생성되는 조각을 받는 대로 돌려주어 화면에 바로 표시할 수 있게 합니다.
+"""
+
+import json
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+import requests
+
+import config
+import metrics
+from single_flight import SingleFlight
+
+# keep-alive 연결을 재사용하는 공용 세션 (요청마다 새 연결을 맺지 않음)
+_session = requests.Session()
+
+
+def fetch_models(api_key: str) -> List[str]:
+    """
+    generateContent를 지원하는 모델 이름 목록 조회 (캐시 없이 API 호출)
+
+    Returns:
+        모델 이름 목록 (예: ["models/gemini-2.5-flash", ...])
+
+    Raises:
+        requests.exceptions.HTTPError: 2xx 이외의 응답을 받은 경우
+        requests.exceptions.RequestException: 네트워크 오류
+    """
+    with metrics.api_call("gemini/models", cacheable=False):
+        metrics.note_attempt()
+        response = _session.get(f"{config.GEMINI_API_BASE_URL}/v1/models", params={"key": api_key},
+                                timeout=config.GEMINI_MODELS_TIMEOUT)
+        metrics.note_bytes(len(response.content))
+        response.raise_for_status()
+        models_data = response.json()
+
+    # 'generateContent'를 지원하는 모델만 필터링
+    return [m['name'] for m in models_data.get('models', [])
+            if 'generateContent' in m.get('supportedGenerationMethods', [])]
+
+
+def chunk_text(chunk: Dict) -> str:
+    """generateContent 응답(또는 스트리밍 조각 1개)의 첫 번째 후보 글"""
+    candidates = chunk.get("candidates") or [{}]
+    parts = (candidates[0].get("content") or {}).get("parts") or []
+    return "".join(part.get("text", "") for part in parts)
+
+
+def stream_generate_content(model_name: str, prompt: str, api_key: str) -> Iterator[str]:
+    """
+    글 생성 스트리밍 (streamGenerateContent, SSE)
+
+    조각을 모두 이어 붙이면 generateContent 응답의 글과 같습니다.
+    반복을 시작할 때 요청을 보내며, 끝나면(중간에 멈춰도) 연결을 정리합니다.
+
+    Args:
+        model_name: 모델 이름 (예: models/gemini-2.5-flash)
+        prompt: 프롬프트
+        api_key: Gemini API 키
+
+    Yields:
+        생성된 글 조각 (빈 조각은 건너뜀)
+
+    Raises:
+        requests.exceptions.HTTPError: 2xx 이외의 응답을 받은 경우 (response로 오류 본문 확인 가능)
+        requests.exceptions.RequestException: 네트워크 오류, 조각 사이 대기 시간 초과
+    """
+    began = time.perf_counter()
+    received = 0
+    first = True
+    error = False
+    response = _session.post(
+        f"{config.GEMINI_API_BASE_URL}/v1/{model_name}:streamGenerateContent",
+        params={"alt": "sse", "key": api_key},
+        json={"contents": [{"parts": [{"text": prompt}]}]},
+        stream=True,
+        timeout=(config.HTTP_CONNECT_TIMEOUT, config.GEMINI_STREAM_READ_TIMEOUT),
+    )
+    try:
+        if not response.ok:
+            # 연결을 닫기 전에 오류 본문을 읽어 두어 HTTPError.response에서 확인할 수 있게 함
+            _ = response.content
+        response.raise_for_status()
+        # text/event-stream에는 charset이 없어 requests가 ISO-8859-1로 해석하므로 직접 지정
+        response.encoding = "utf-8"
+        for line in response.iter_lines(decode_unicode=True):
+            # SSE 이벤트: "data: {...}" 한 줄마다 응답 조각 1개, 빈 줄은 이벤트 구분
+            if not line or not line.startswith("data:"):
+                continue
+            received += len(line)
+            text = chunk_text(json.loads(line[len("data:"):]))
+            if not text:
+                continue
+            if first:
+                # 첫 조각이 보일 때까지 걸린 시간
+                metrics.record(metrics.STAGE, "gemini.first_chunk", time.perf_counter() - began)
+                first = False
+            yield text
+    except Exception:
+        error = True
+        raise
+    finally:
+        response.close()
+        metrics.record(metrics.ENDPOINT, "gemini/streamGenerateContent", time.perf_counter() - began,
+                       size=received or None, error=error)
+
+
+class _Entry:
+    """API 키 하나의 모델 목록"""
+
+    __slots__ = ("models", "fetched_at", "refreshing", "failed_at")
+
+    def __init__(self, models: List[str], fetched_at: float):
+        self.models = models
+        self.fetched_at = fetched_at
+        self.refreshing = False
+        self.failed_at: Optional[float] = None
+
+
+class ModelCatalog:
+    """API 키별 모델 목록 캐시 (TTL이 지나면 백그라운드에서 새로 받음, 스레드 안전)"""
+
+    def __init__(self, ttl: float = config.GEMINI_MODELS_TTL,
+                 retry_interval: float = config.GEMINI_MODELS_RETRY_INTERVAL,
+                 fetch: Callable[[str], List[str]] = fetch_models,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self._fetch = fetch
+        self._clock = clock
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._flight = SingleFlight("gemini-models")
+
+    def get(self, api_key: str) -> List[str]:
+        """
+        모델 이름 목록 (처음 조회할 때만 API 응답을 기다림)
+
+        Raises:
+            처음 조회에 실패한 경우 fetch_models()의 예외
+        """
+        with self._lock:
+            entry = self._entries.get(api_key)
+            if entry is not None:
+                if self._should_refresh(entry):
+                    entry.refreshing = True
+                    threading.Thread(target=self._refresh_in_background, args=(api_key, entry),
+                                     name="gemini-models-refresh", daemon=True).start()
+                return entry.models
+
+        return self._flight.do(api_key, lambda: self._load(api_key))
+
+    def _should_refresh(self, entry: _Entry) -> bool:
+        """TTL이 지났고, 새로 받는 중이 아니며, 최근에 실패하지 않았는지"""
+        now = self._clock()
+        if entry.refreshing or now - entry.fetched_at < self.ttl:
+            return False
+        return entry.failed_at is None or now - entry.failed_at >= self.retry_interval
+
+    def _load(self, api_key: str) -> List[str]:
+        """API에서 받아 저장"""
+        models = self._fetch(api_key)
+        with self._lock:
+            self._entries[api_key] = _Entry(models, self._clock())
+        return models
+
+    def _refresh_in_background(self, api_key: str, entry: _Entry):
+        """TTL이 지난 목록 새로 받기 (실패하면 기존 목록 유지)"""
+        try:
+            self._load(api_key)
+        except Exception:
+            with self._lock:
+                entry.failed_at = self._clock()
+        finally:
+            with self._lock:
+                entry.refreshing = False
+
+    def invalidate(self, api_key: Optional[str] = None):
+        """저장된 목록 삭제 (api_key가 None이면 전체)"""
+        with self._lock:
+            if api_key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(api_key, None)
+
+
+# 프로세스 전체에서 공유하는 모델 목록 캐시
+model_catalog = ModelCatalog()
+
+
+def list_models(api_key: str) -> List[str]:
+    """generateContent를 지원하는 모델 이름 목록 (프로세스 전체 캐시)"""
+    return model_catalog.get(api_key)
@@ -0,0 +1,187 @@
+"""
+지연 시간 계측
+API 호출(엔드포인트)과 처리 단계(JSON 파싱, 정규화, HTML 렌더링 등)의 소요 시간을
+프로세스 전체에서 최근 METRICS_WINDOW개씩 기록하고 p50/p95/p99로 요약합니다.
+
+API 호출은 api_call()로 감싸면 그 안에서 보낸 HTTP 요청 수(재시도 포함),
+응답 바이트, 캐시 적중 여부가 함께 기록됩니다. 요청을 보내지 않고 끝난 호출은
+진행 중인 같은 요청에 합쳐진 것(coalesced)으로 기록합니다.
+처리 단계는 stage() 또는 timed()로 감쌉니다.
+두 경우 모두 추적(tracing)이 켜져 있으면 같은 이름의 스팬으로도 기록됩니다.
+
+기록은 모든 세션이 공유하며 진단 페이지(pages/6)에서 확인할 수 있습니다.
+"""
+
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import config
+import tracing
+
+ENDPOINT = "endpoint"
+STAGE = "stage"
+
+# (기록 시각, 소요 시간(초), 응답 바이트, 캐시 상태, 재시도 수, 오류 여부)
+Sample = Tuple[float, float, Optional[int], Optional[str], int, bool]
+
+_series: Dict[Tuple[str, str], Deque[Sample]] = {}
+_lock = threading.Lock()
+
+
+class ApiCall:
+    """API 호출 1회의 계측 정보 (api_call()이 만들고 naver_api 등이 채움)"""
+
+    __slots__ = ("endpoint", "cacheable", "attempts", "bytes", "cache", "error")
+
+    def __init__(self, endpoint: str, cacheable: bool):
+        self.endpoint = endpoint
+        self.cacheable = cacheable
+        self.attempts = 0
+        self.bytes: Optional[int] = None
+        # 캐시에서 응답을 찾았으면 "hit"
+        self.cache: Optional[str] = None
+        self.error = False
+
+    def cache_state(self) -> Optional[str]:
+        """hit, miss, coalesced(요청 없이 다른 호출의 결과를 받음), None(캐시 없는 API)"""
+        if self.cache is not None:
+            return self.cache
+        if self.attempts == 0 and not self.error:
+            return "coalesced"
+        return "miss" if self.cacheable else None
+
+
+_current_call: contextvars.ContextVar[Optional[ApiCall]] = contextvars.ContextVar("metrics_api_call", default=None)
+
+
+def record(kind: str, name: str, seconds: float, size: Optional[int] = None, cache: Optional[str] = None,
+           retries: int = 0, error: bool = False):
+    """측정값 1개 기록 (kind: ENDPOINT 또는 STAGE)"""
+    if not config.METRICS_ENABLED:
+        return
+    sample = (time.time(), seconds, size, cache, retries, error)
+    with _lock:
+        series = _series.get((kind, name))
+        if series is None:
+            series = _series[(kind, name)] = deque(maxlen=config.METRICS_WINDOW)
+        series.append(sample)
+
+
+@contextmanager
+def api_call(endpoint: str, cacheable: bool = True) -> Iterator[ApiCall]:
+    """
+    API 호출 1회 계측 (재시도와 속도 제한 대기를 포함한 전체 시간)
+
+    Args:
+        endpoint: 엔드포인트 이름 (예: search/shop.json)
+        cacheable: 응답 캐시가 있는 API인지 (캐시 적중률 집계 대상)
+    """
+    call = ApiCall(endpoint, cacheable)
+    token = _current_call.set(call)
+    began = time.perf_counter()
+    with tracing.span(endpoint) as span:
+        try:
+            yield call
+        except BaseException:
+            call.error = True
+            raise
+        finally:
+            _current_call.reset(token)
+            retries = max(call.attempts - 1, 0)
+            record(ENDPOINT, endpoint, time.perf_counter() - began, call.bytes, call.cache_state(),
+                   retries, call.error)
+            span.set(cache=call.cache_state(), bytes=call.bytes, retries=retries)
+
+
+def note_attempt():
+    """현재 API 호출에서 HTTP 요청 1회 전송 (재시도 수 집계용)"""
+    call = _current_call.get()
+    if call is not None:
+        call.attempts += 1
+
+
+def note_bytes(size: int):
+    """현재 API 호출의 응답 본문 크기 (재시도한 경우 마지막 응답)"""
+    call = _current_call.get()
+    if call is not None:
+        call.bytes = size
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """처리 단계 소요 시간 계측"""
+    began = time.perf_counter()
+    error = False
+    with tracing.span(name):
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            record(STAGE, name, time.perf_counter() - began, error=error)
+
+
+def timed(name: str) -> Callable:
+    """함수 전체를 처리 단계로 계측하는 데코레이터"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 q 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(len(sorted_values) * q / 100) - 1))
+    return sorted_values[index]
+
+
+def summary(kind: str) -> List[Dict]:
+    """
+    이름별 최근 측정값 요약
+
+    Returns:
+        [{name, count, p50_ms, p95_ms, p99_ms, avg_kb, hit_rate, coalesced, retries, errors, last_seen}]
+        (hit_rate는 캐시 대상 호출이 없으면 None)
+    """
+    with _lock:
+        snapshot = {name: list(series) for (series_kind, name), series in _series.items() if series_kind == kind}
+
+    rows = []
+    for name, samples in sorted(snapshot.items()):
+        seconds = sorted(sample[1] for sample in samples)
+        sizes = [sample[2] for sample in samples if sample[2] is not None]
+        caches = [sample[3] for sample in samples]
+        hits = caches.count("hit")
+        lookups = hits + caches.count("miss")
+        rows.append({
+            "name": name,
+            "count": len(samples),
+            "p50_ms": percentile(seconds, 50) * 1000,
+            "p95_ms": percentile(seconds, 95) * 1000,
+            "p99_ms": percentile(seconds, 99) * 1000,
+            "avg_kb": sum(sizes) / len(sizes) / 1024 if sizes else None,
+            "hit_rate": hits / lookups if lookups else None,
+            "coalesced": caches.count("coalesced"),
+            "retries": sum(sample[4] for sample in samples),
+            "errors": sum(sample[5] for sample in samples),
+            "last_seen": max(sample[0] for sample in samples),
+        })
+    return rows
+
+
+def reset():
+    """기록 전체 삭제"""
+    with _lock:
+        _series.clear()
@@ -0,0 +1,287 @@
+"""
+네이버 API 공통 클라이언트
+쇼핑 검색 API와 검색광고 API 호출을 하나의 keep-alive 연결 풀로 처리합니다.
+
+urllib3의 PoolManager는 스레드 안전하므로 모든 탭, 페이지, 작업 스레드와
+Streamlit 세션이 같은 연결을 재사용할 수 있습니다. 호출마다 TCP/TLS 연결을
+새로 맺지 않기 때문에 페이지를 여러 번 조회하는 순위 확인이 특히 빨라집니다.
+
+일시적인 오류(429, 5xx, 연결 오류)는 resilience 모듈의 재시도 정책과
+API별 회로 차단기를 거쳐 요청 단위로 다시 시도합니다.
+
+여러 세션이 같은 요청을 동시에 보내면 single_flight로 합쳐 API는 한 번만 호출하고,
+나머지 호출은 진행 중인 요청의 결과를 함께 받습니다.
+
+API 호출마다 metrics 모듈에 지연 시간, 응답 크기, 캐시 적중 여부, 재시도 수를 기록하고,
+HTTP 왕복(http)과 JSON 파싱(json.parse)은 처리 단계로 따로 기록합니다.
+추적(tracing)이 켜져 있으면 호출 스팬에 키워드, 시작 위치, 받은 항목 수를 붙입니다.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+import urllib.parse
+from typing import Dict, Optional
+
+import urllib3
+
+import config
+import metrics
+import rate_limit
+import resilience
+import tracing
+import cache
+from cache import shop_cache, shop_cache_key
+from single_flight import SingleFlight
+
+SHOP_SEARCH_URL = f"{config.SHOP_API_BASE_URL}/v1/search/shop.json"
+SEARCHAD_BASE_URL = config.SEARCHAD_API_BASE_URL
+
+_DEFAULT_TIMEOUT = urllib3.Timeout(connect=config.HTTP_CONNECT_TIMEOUT, read=config.HTTP_READ_TIMEOUT)
+
+# 프로세스 전체에서 공유하는 연결 풀 (호스트별 최대 HTTP_POOL_SIZE개 연결 유지)
+_pool = urllib3.PoolManager(
+    num_pools=8,
+    maxsize=config.HTTP_POOL_SIZE,
+    block=True,
+    timeout=_DEFAULT_TIMEOUT,
+    retries=False,
+)
+
+
+# 실제로 전송한 API 요청 수 (캐시 적중 제외)
+_call_counts = {"search": 0, "searchad": 0}
+_call_counts_lock = threading.Lock()
+
+
+def _count_call(api: str):
+    with _call_counts_lock:
+        _call_counts[api] += 1
+
+
+def call_counts() -> Dict[str, int]:
+    """프로세스 시작 후 API별 실제 요청 수"""
+    with _call_counts_lock:
+        return dict(_call_counts)
+
+
+# API별 동일 요청 합치기 (진행 중인 같은 요청이 있으면 그 결과를 함께 사용)
+_flights = {"search": SingleFlight("search"), "searchad": SingleFlight("searchad")}
+
+
+def coalesced_counts() -> Dict[str, int]:
+    """프로세스 시작 후 API별로 진행 중인 같은 요청에 합쳐져 보내지 않은 호출 수"""
+    return {api: flight.stats()["coalesced"] for api, flight in _flights.items()}
+
+
+class NaverApiError(Exception):
+    """네이버 API가 2xx 이외의 상태 코드를 반환했을 때 발생하는 예외"""
+
+    def __init__(self, status: int, body: str, url: str, retry_after: Optional[float] = None):
+        self.status = status
+        self.body = body
+        self.url = url
+        # 응답의 Retry-After 헤더 (초), 없으면 None
+        self.retry_after = retry_after
+        super().__init__(f"HTTP Error {status}: {body[:200]}")
+
+    @classmethod
+    def from_response(cls, response: urllib3.BaseHTTPResponse, url: str) -> "NaverApiError":
+        return cls(response.status, response.data.decode("utf-8", "replace"), url,
+                   resilience.parse_retry_after(response.headers.get("Retry-After")))
+
+
+def request(method: str, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+            timeout: Optional[float] = None) -> urllib3.BaseHTTPResponse:
+    """
+    공유 연결 풀을 통해 HTTP 요청 전송
+
+    Args:
+        method: HTTP 메서드
+        url: 요청 URL (쿼리 문자열 제외)
+        params: 쿼리 파라미터
+        headers: 요청 헤더
+        timeout: 읽기 타임아웃(초), 없으면 기본 설정 사용
+
+    Returns:
+        본문이 미리 읽혀 있는(gzip 해제 완료) urllib3 응답 객체
+    """
+    if params:
+        url = f"{url}?{urllib.parse.urlencode(params)}"
+
+    request_headers = {"Accept-Encoding": "gzip"}
+    if headers:
+        request_headers.update(headers)
+
+    if timeout is not None:
+        timeout = urllib3.Timeout(connect=config.HTTP_CONNECT_TIMEOUT, read=timeout)
+    else:
+        timeout = _DEFAULT_TIMEOUT
+
+    metrics.note_attempt()
+    with metrics.stage("http"):
+        response = _pool.request(method, url, headers=request_headers, timeout=timeout)
+    metrics.note_bytes(len(response.data))
+    return response
+
+
+def get_json(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+             timeout: Optional[float] = None) -> Dict:
+    """
+    GET 요청 후 JSON 응답 반환
+
+    Raises:
+        NaverApiError: 2xx 이외의 응답을 받은 경우
+    """
+    response = request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    if not 200 <= response.status < 300:
+        raise NaverApiError.from_response(response, url)
+
+    with metrics.stage("json.parse"):
+        return json.loads(response.data)
+
+
+def search_shop(query: str, display: int = 100, start: int = 1, sort: Optional[str] = None,
+                client_id: Optional[str] = None, client_secret: Optional[str] = None,
+                use_cache: bool = True) -> Dict:
+    """
+    네이버 쇼핑 검색 API 호출
+
+    Args:
+        query: 검색 키워드
+        display: 한 번에 가져올 상품 수 (최대 100)
+        start: 검색 시작 위치 (최대 1000)
+        sort: 정렬 기준 (sim, date, asc, dsc), 없으면 API 기본값
+        client_id: 네이버 애플리케이션 Client ID (없으면 환경 변수 값)
+        client_secret: 네이버 애플리케이션 Client Secret (없으면 환경 변수 값)
+        use_cache: False이면 캐시를 건너뛰고 API를 호출한 뒤 캐시를 갱신
+
+    Returns:
+        API 응답 딕셔너리 (total, start, display, items), 캐시되거나 합쳐진 응답은 수정하지 말 것
+
+    Raises:
+        NaverApiError: 2xx 이외의 응답을 받은 경우 (일시적 오류는 재시도 후)
+        QuotaExceededError: 일일 호출 한도를 모두 사용한 경우
+        CircuitOpenError: 오류가 계속되어 쇼핑 검색 API 호출을 잠시 중단한 경우
+    """
+    with metrics.api_call("search/shop.json") as call:
+        tracing.annotate(query=query, start=start, display=display)
+        cache_key = shop_cache_key(query, start, display, sort)
+        result = shop_cache.get(cache_key) if use_cache else None
+        if result is not None:
+            call.cache = "hit"
+        else:
+            result = _search_shop(query, display, start, sort, client_id, client_secret, cache_key)
+        tracing.annotate(items=len(result.get("items", [])))
+        return result
+
+
+def _search_shop(query: str, display: int, start: int, sort: Optional[str], client_id: Optional[str],
+                 client_secret: Optional[str], cache_key: str) -> Dict:
+    """캐시에 없는 쇼핑 검색 요청 (재시도, 동일 요청 합치기 적용)"""
+    params = {"query": query, "display": display, "start": start}
+    if sort:
+        params["sort"] = sort
+
+    client_id = client_id or config.CLIENT_ID
+    headers = {
+        "X-Naver-Client-Id": client_id,
+        "X-Naver-Client-Secret": client_secret or config.CLIENT_SECRET,
+    }
+
+    def send() -> Dict:
+        # 초당 호출 수 제한에 걸리면 토큰이 생길 때까지 대기 (재시도도 호출 수에 포함)
+        rate_limit.acquire("search", client_id)
+        _count_call("search")
+        return get_json(SHOP_SEARCH_URL, params=params, headers=headers)
+
+    def fetch() -> Dict:
+        result = resilience.call("search", send)
+        shop_cache.set(cache_key, result)
+        return result
+
+    # 같은 애플리케이션의 같은 검색이 진행 중이면 그 응답을 함께 사용
+    return _flights["search"].do((client_id, cache_key), fetch)
+
+
+def generate_signature(timestamp: str, method: str, uri: str, secret_key: str) -> str:
+    """네이버 광고 API 서명 생성"""
+    message = f"{timestamp}.{method}.{uri}"
+    signature = hmac.new(
+        secret_key.encode('utf-8'),
+        message.encode('utf-8'),
+        hashlib.sha256
+    ).digest()
+    return base64.b64encode(signature).decode('utf-8')
+
+
+def searchad_headers(method: str, uri: str, api_key: Optional[str] = None,
+                     secret_key: Optional[str] = None, customer_id: Optional[str] = None) -> Dict:
+    """네이버 광고 API 인증 헤더 생성"""
+    timestamp = str(round(time.time() * 1000))
+
+    return {
+        'Content-Type': 'application/json; charset=UTF-8',
+        'X-Timestamp': timestamp,
+        'X-API-KEY': api_key or config.API_KEY,
+        'X-Customer': str(customer_id or config.CUSTOMER_ID),
+        'X-Signature': generate_signature(timestamp, method, uri, secret_key or config.SECRET_KEY),
+    }
+
+
+def get_keywordstool(hint_keyword: str, api_key: Optional[str] = None, secret_key: Optional[str] = None,
+                     customer_id: Optional[str] = None, use_cache: bool = True) -> Dict:
+    """
+    네이버 광고 API 키워드 도구(/keywordstool) 조회
+
+    월간 집계 데이터이므로 응답의 모든 연관 키워드를 캐시에 저장하고,
+    같은 힌트 키워드를 다시 조회하면 API를 호출하지 않습니다.
+
+    Args:
+        hint_keyword: 연관 키워드를 조회할 힌트 키워드
+        use_cache: False이면 캐시를 건너뛰고 API를 호출한 뒤 캐시를 갱신
+
+    Returns:
+        API 응답 딕셔너리 (keywordList), 합쳐진 응답은 수정하지 말 것
+
+    Raises:
+        NaverApiError: 2xx 이외의 응답을 받은 경우 (일시적 오류는 재시도 후)
+        QuotaExceededError: 일일 호출 한도를 모두 사용한 경우
+        CircuitOpenError: 오류가 계속되어 검색광고 API 호출을 잠시 중단한 경우
+    """
+    with metrics.api_call("searchad/keywordstool") as call:
+        tracing.annotate(keyword=hint_keyword)
+        data = cache.get_cached_keywordstool(hint_keyword) if use_cache else None
+        if data is not None:
+            call.cache = "hit"
+        else:
+            data = _get_keywordstool(hint_keyword, api_key, secret_key, customer_id)
+        tracing.annotate(items=len(data.get("keywordList", [])))
+        return data
+
+
+def _get_keywordstool(hint_keyword: str, api_key: Optional[str], secret_key: Optional[str],
+                      customer_id: Optional[str]) -> Dict:
+    """캐시에 없는 키워드 도구 요청 (재시도, 동일 요청 합치기 적용)"""
+    uri = "/keywordstool"
+    customer_id = str(customer_id or config.CUSTOMER_ID)
+
+    def send() -> Dict:
+        # 서명 타임스탬프가 대기 시간만큼 오래되지 않도록 토큰을 먼저 확보하고, 재시도마다 새로 서명
+        rate_limit.acquire("searchad", customer_id)
+        _count_call("searchad")
+        headers = searchad_headers("GET", uri, api_key, secret_key, customer_id)
+        return get_json(f"{SEARCHAD_BASE_URL}{uri}",
+                        params={"hintKeywords": hint_keyword, "showDetail": "1"},
+                        headers=headers)
+
+    def fetch() -> Dict:
+        data = resilience.call("searchad", send)
+        cache.store_keywordstool(hint_keyword, data)
+        return data
+
+    return _flights["searchad"].do(("keywordstool", customer_id, hint_keyword), fetch)
@@ -0,0 +1,337 @@
+"""
+API 응답 정규화
+shop.json 응답의 items 목록과 keywordstool 응답의 keywordList를
+한 번에 타입이 정해진 데이터프레임으로 변환합니다.
+
+항목마다 태그 제거, 숫자 변환, 문자열 연결을 반복하지 않고
+컬럼 단위(벡터화) 연산으로 처리하므로 모든 탭과 페이지가 같은 결과를 사용합니다.
+검색 응답 몇 페이지 분량의 상품 목록은 배열 연산의 고정 비용이 더 크므로 파이썬 목록으로 처리합니다.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import metrics
+import tracing
+
+# 정규화에 사용하는 API 응답 항목 필드 (모두 문자열)
+ITEM_FIELDS = ["title", "link", "image", "lprice", "mallName", "productId", "brand", "category1", "category2"]
+
+# 정규화 결과 컬럼
+#   rank: 검색 결과 순위 (start 기준)
+#   title: 태그를 제거한 상품명
+#   price: 최저가 (숫자가 아니면 <NA>)
+#   category: "category1 > category2" (category2가 없으면 category1)
+COLUMNS = ["rank", "title", "link", "image", "price", "mallName", "productId", "brand",
+           "category1", "category2", "category"]
+
+# Arrow 타입 -> pandas 타입 (문자열은 Arrow 기반 string, 정수는 결측값을 허용하는 Int64)
+_PANDAS_TYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.int64(): pd.Int64Dtype(),
+    pa.float64(): pd.Float64Dtype(),
+    pa.bool_(): pd.BooleanDtype(),
+}
+
+# 이 개수 이하의 상품 목록은 Arrow 배열 연산 대신 파이썬 목록으로 정규화
+# (100개 한 페이지에서는 배열 연산과 테이블 변환의 고정 비용이 항목 처리 시간보다 큼, benchmarks/bench_normalize.py)
+SMALL_INPUT_ITEMS = 500
+
+_TAG_PATTERN = re.compile(r"<[^>]*>")
+_DIGITS_PATTERN = re.compile(r"[0-9]+")
+
+
+def _to_int(column: pa.Array) -> pa.Array:
+    """숫자로만 된 문자열은 정수로, 나머지(빈 문자열 포함)는 null로 변환"""
+    digits = pc.match_substring_regex(column, r"^[0-9]+$")
+    return pc.cast(pc.if_else(digits, column, pa.scalar(None, pa.string())), pa.int64())
+
+
+def items_to_table(items: List[Dict], start: int = 1) -> pa.Table:
+    """
+    쇼핑 검색 상품 목록을 정규화된 Arrow 테이블로 변환
+
+    필드마다 값을 한 번씩 모아 Arrow 배열로 만든 뒤, 태그 제거·가격 변환·카테고리
+    연결은 배열 단위 연산으로 처리합니다.
+
+    Args:
+        items: shop.json 응답의 items 목록 (수정하지 않음)
+        start: 첫 상품의 순위 (응답의 start 값)
+
+    Returns:
+        COLUMNS 컬럼의 Arrow 테이블 (없는 문자열 필드는 빈 문자열)
+    """
+    columns = {field: pa.array([item.get(field) or "" for item in items], pa.string())
+               for field in ITEM_FIELDS}
+
+    columns["rank"] = pa.array(range(start, start + len(items)), pa.int64())
+    columns["title"] = pc.replace_substring_regex(columns["title"], r"<[^>]*>", "")
+    columns["price"] = _to_int(columns.pop("lprice"))
+    columns["category"] = pc.if_else(
+        pc.not_equal(columns["category2"], ""),
+        pc.binary_join_element_wise(columns["category1"], columns["category2"], " > "),
+        columns["category1"],
+    )
+
+    return pa.table({name: columns[name] for name in COLUMNS})
+
+
+def _items_to_columns(items: List[Dict], start: int) -> Dict[str, List]:
+    """적은 상품 목록 정규화 (items_to_table과 같은 값을 컬럼별 파이썬 목록으로)"""
+    columns = {field: [item.get(field) or "" for item in items] for field in ITEM_FIELDS}
+
+    columns["rank"] = list(range(start, start + len(items)))
+    columns["title"] = [_TAG_PATTERN.sub("", title) for title in columns["title"]]
+    columns["price"] = [int(price) if _DIGITS_PATTERN.fullmatch(price) else None for price in columns.pop("lprice")]
+    columns["category"] = [f"{category1} > {category2}" if category2 else category1
+                           for category1, category2 in zip(columns["category1"], columns["category2"])]
+    return columns
+
+
+def _int_array(values: List[Optional[int]]) -> pd.arrays.IntegerArray:
+    """None을 결측값으로 하는 Int64 배열 (pd.array보다 타입 추론이 없어 빠름)"""
+    return pd.arrays.IntegerArray(np.array([value or 0 for value in values], dtype=np.int64),
+                                  np.array([value is None for value in values], dtype=bool))
+
+
+def table_to_frame(table: pa.Table) -> pd.DataFrame:
+    """정규화된 Arrow 테이블을 복사 없이 데이터프레임으로 변환"""
+    return pd.DataFrame(
+        {name: pd.array(table[name], dtype=_PANDAS_TYPES[table[name].type]) for name in table.column_names},
+        copy=False,
+    )
+
+
+@metrics.timed("normalize.items")
+def items_to_frame(items: List[Dict], start: int = 1) -> pd.DataFrame:
+    """
+    쇼핑 검색 상품 목록을 정규화된 데이터프레임으로 변환
+
+    Args:
+        items: shop.json 응답의 items 목록 (수정하지 않음)
+        start: 첫 상품의 순위 (응답의 start 값)
+
+    Returns:
+        COLUMNS 컬럼의 데이터프레임 (문자열은 Arrow 기반 string, 순위와 가격은 Int64)
+    """
+    tracing.annotate(items=len(items), start=start)
+    if len(items) > SMALL_INPUT_ITEMS:
+        return table_to_frame(items_to_table(items, start))
+
+    columns = _items_to_columns(items, start)
+    string_type = _PANDAS_TYPES[pa.string()]
+    return pd.DataFrame(
+        {name: _int_array(columns[name]) if name in ("rank", "price") else pd.array(columns[name], dtype=string_type)
+         for name in COLUMNS},
+        copy=False,
+    )
+
+
+def response_to_frame(result: Dict) -> pd.DataFrame:
+    """shop.json 응답 전체를 정규화 (순위는 응답의 start부터)"""
+    return items_to_frame(result.get("items", []), start=int(result.get("start", 1) or 1))
+
+
+@metrics.timed("format.shopping")
+def shopping_frame(items: pd.DataFrame) -> pd.DataFrame:
+    """
+    쇼핑 순위 탭의 결과 표 (같은 상품명은 상위 순위만 유지)
+
+    Args:
+        items: items_to_frame 결과
+
+    Returns:
+        순위, 상품명, 최저가, 판매처, 브랜드, 카테고리, 링크 컬럼과
+        필터·정렬용 _price_num(최저가 숫자), _original_rank(원래 순위) 컬럼
+    """
+    items = items.drop_duplicates("title")
+    price = items["price"].fillna(0)
+    df = pd.DataFrame({
+        '상품명': items["title"],
+        '최저가': price,
+        '판매처': items["mallName"].replace("", "-"),
+        '브랜드': items["brand"].replace("", "-"),
+        '카테고리': items["category"].replace("", "-"),
+        '링크': items["link"],
+        '_price_num': price
+    }).reset_index(drop=True)
+
+    # 중복을 제거한 뒤의 순위 (1위부터 시작)
+    df.insert(0, '순위', range(1, len(df) + 1))
+    df['_original_rank'] = df['순위']
+    return df
+
+
+# 상품명 단어 빈도에서 제외할 조사
+TITLE_STOPWORDS = ["의", "를", "을", "에", "에서", "로", "으로"]
+
+
+@metrics.timed("analyze.word_counts")
+def title_word_counts(titles: pd.Series, limit: int) -> List[Tuple[str, int]]:
+    """
+    상품명 단어 빈도 상위 limit개
+
+    소문자로 바꿔 공백으로 나눈 단어 중 한 글자 단어와 조사는 제외하고,
+    빈도가 같으면 먼저 등장한 단어를 앞에 둡니다.
+
+    Returns:
+        [(단어, 출현 횟수)] (빈도 내림차순)
+    """
+    words = titles.str.lower().str.split().explode().dropna()
+    words = words[(words.str.len() > 1) & ~words.isin(TITLE_STOPWORDS)]
+    counts = words.value_counts(sort=False).sort_values(ascending=False, kind="stable")
+    return list(counts.head(limit).items())
+
+
+# keywordstool keywordList 항목 필드 (검색광고 API 문서의 응답 필드)
+#   클릭수·클릭률: monthlyAve{Pc,Mobile}ClkCnt, monthlyAve{Pc,Mobile}Ctr (키워드 분석 탭과 같음)
+#   월평균노출광고수: plAvgDepth
+# 이전에 키워드 분석 탭이 읽던 monthlyAveImpsCnt와 연관검색어 페이지가 읽던 monthly{Pc,Mobile}ClickCnt는
+# 응답에 없는 필드라 항상 "-" 또는 0으로 표시되었음 (benchmarks/bench_keyword_stats.py에서 차이 확인)
+KEYWORD_FIELDS = ["relKeyword", "monthlyPcQcCnt", "monthlyMobileQcCnt", "monthlyAvePcClkCnt",
+                  "monthlyAveMobileClkCnt", "monthlyAvePcCtr", "monthlyAveMobileCtr", "compIdx", "plAvgDepth"]
+
+# 검색수가 10 미만이면 API가 숫자 대신 "< 10"을 반환함
+# 합계와 정렬에는 하한값 0으로 계산하고, 화면에는 "< 10"으로 표시
+BELOW_10_VALUE = 0
+BELOW_10_TEXT = "< 10"
+
+# 경쟁정도 문자열 -> 숫자 (평균, 차트용)
+COMP_LEVELS = {"낮음": 1, "중간": 2, "높음": 3}
+
+# 키워드 통계 정규화 결과 컬럼
+#   rank: 응답 순서 (1부터)
+#   pc_search / mobile_search / total_search: 월간 검색수 (Int64)
+#   pc_search_below_10 / mobile_search_below_10: 검색수가 "< 10"으로 온 항목
+#   pc_click / mobile_click / total_click: 월평균 클릭수 (Float64)
+#   pc_ctr / mobile_ctr: 월평균 클릭률 (%, Float64)
+#   comp_idx / comp_level: 경쟁정도 (낮음/중간/높음) / 1~3
+#   avg_ads: 월평균 노출 광고수 (plAvgDepth)
+KEYWORD_COLUMNS = ["rank", "keyword", "pc_search", "mobile_search", "total_search",
+                   "pc_search_below_10", "mobile_search_below_10", "pc_click", "mobile_click", "total_click",
+                   "pc_ctr", "mobile_ctr", "comp_idx", "comp_level", "avg_ads"]
+
+
+def _to_number(values: List) -> Tuple[pa.Array, pa.Array]:
+    """
+    숫자/문자열이 섞인 값 목록을 실수 배열로 변환
+
+    Returns:
+        (float64 배열, "< 10" 여부 배열), 숫자가 아닌 값("-", 빈 값)은 null
+    """
+    try:
+        # 대부분의 필드는 숫자로만 오므로 문자열 변환 없이 바로 배열 생성
+        numbers = pa.array(values, pa.float64())
+        return numbers, pa.nulls(len(values), pa.bool_()).fill_null(False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        pass
+
+    text = pc.utf8_trim_whitespace(pa.array([None if value is None else str(value) for value in values],
+                                            pa.string()))
+    below_10 = pc.fill_null(pc.starts_with(text, "<"), False)
+    text = pc.replace_substring(text, ",", "")
+    numeric = pc.match_substring_regex(text, r"^-?[0-9]+(\.[0-9]+)?$")
+    numbers = pc.cast(pc.if_else(numeric, text, pa.scalar(None, pa.string())), pa.float64())
+    return pc.if_else(below_10, float(BELOW_10_VALUE), numbers), below_10
+
+
+def keyword_list_to_table(keyword_list: List[Dict]) -> pa.Table:
+    """
+    keywordstool 응답의 keywordList를 정규화된 Arrow 테이블로 변환
+
+    필드마다 값을 한 번씩 모은 뒤 숫자 변환, "< 10" 처리, 합계는 배열 단위 연산으로 처리합니다.
+
+    Args:
+        keyword_list: keywordList 항목 목록 (수정하지 않음)
+
+    Returns:
+        KEYWORD_COLUMNS 컬럼의 Arrow 테이블 (응답 순서 유지)
+    """
+    values = {field: [item.get(field) for item in keyword_list] for field in KEYWORD_FIELDS}
+
+    pc_search, pc_below = _to_number(values["monthlyPcQcCnt"])
+    mobile_search, mobile_below = _to_number(values["monthlyMobileQcCnt"])
+    pc_click, _ = _to_number(values["monthlyAvePcClkCnt"])
+    mobile_click, _ = _to_number(values["monthlyAveMobileClkCnt"])
+    pc_ctr, _ = _to_number(values["monthlyAvePcCtr"])
+    mobile_ctr, _ = _to_number(values["monthlyAveMobileCtr"])
+    avg_ads, _ = _to_number(values["plAvgDepth"])
+
+    pc_search = pc.cast(pc.round(pc_search), pa.int64())
+    mobile_search = pc.cast(pc.round(mobile_search), pa.int64())
+    comp_idx = pa.array([value or "" for value in values["compIdx"]], pa.string())
+
+    columns = {
+        "rank": pa.array(range(1, len(keyword_list) + 1), pa.int64()),
+        "keyword": pa.array([value or "" for value in values["relKeyword"]], pa.string()),
+        "pc_search": pc_search,
+        "mobile_search": mobile_search,
+        "total_search": pc.add(pc.fill_null(pc_search, 0), pc.fill_null(mobile_search, 0)),
+        "pc_search_below_10": pc_below,
+        "mobile_search_below_10": mobile_below,
+        "pc_click": pc_click,
+        "mobile_click": mobile_click,
+        "total_click": pc.add(pc.fill_null(pc_click, 0.0), pc.fill_null(mobile_click, 0.0)),
+        "pc_ctr": pc_ctr,
+        "mobile_ctr": mobile_ctr,
+        "comp_idx": comp_idx,
+        "comp_level": pa.array([COMP_LEVELS.get(value) for value in comp_idx.to_pylist()], pa.int64()),
+        "avg_ads": avg_ads,
+    }
+    return pa.table({name: columns[name] for name in KEYWORD_COLUMNS})
+
+
+@metrics.timed("normalize.keywords")
+def keyword_list_to_frame(keyword_list: List[Dict]) -> pd.DataFrame:
+    """
+    keywordstool 응답의 keywordList를 정규화된 데이터프레임으로 변환
+
+    Args:
+        keyword_list: keywordList 항목 목록 (수정하지 않음)
+
+    Returns:
+        KEYWORD_COLUMNS 컬럼의 데이터프레임 (검색수는 Int64, 클릭수·클릭률은 Float64)
+    """
+    tracing.annotate(items=len(keyword_list))
+    return table_to_frame(keyword_list_to_table(keyword_list))
+
+
+def format_numbers(values: pd.Series, pattern: str, below_10: Optional[pd.Series] = None,
+                    missing: str = "-") -> List[str]:
+    """숫자 컬럼을 표시 문자열 목록으로 변환 (결측값은 missing, below_10이 참이면 "< 10")"""
+    text = [missing if value is pd.NA else pattern.format(value) for value in values.tolist()]
+    if below_10 is None:
+        return text
+    return [BELOW_10_TEXT if below else value for value, below in zip(text, below_10.tolist())]
+
+
+@metrics.timed("format.keywords")
+def format_keyword_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    정규화된 키워드 통계를 화면 표시용 문자열 컬럼으로 변환
+
+    행마다 문자열을 만드므로 화면에 보이는 부분(페이지, 상위 N개)에만 적용하세요.
+
+    Args:
+        df: keyword_list_to_frame 결과 또는 그 일부
+
+    Returns:
+        순번, 연관키워드, 월간검색수, 월평균클릭수, 월평균클릭률, 경쟁정도, 월평균노출광고수 컬럼
+    """
+    return pd.DataFrame({
+        "순번": df["rank"].tolist(),
+        "연관키워드": df["keyword"].tolist(),
+        "PC 월간검색수": format_numbers(df["pc_search"], "{:,}", df["pc_search_below_10"]),
+        "모바일 월간검색수": format_numbers(df["mobile_search"], "{:,}", df["mobile_search_below_10"]),
+        "PC 월평균클릭수": format_numbers(df["pc_click"], "{:,.0f}"),
+        "모바일 월평균클릭수": format_numbers(df["mobile_click"], "{:,.0f}"),
+        "PC 월평균클릭률": format_numbers(df["pc_ctr"], "{:.2f}%"),
+        "모바일 월평균클릭률": format_numbers(df["mobile_ctr"], "{:.2f}%"),
+        "경쟁정도": [value or "-" for value in df["comp_idx"].tolist()],
+        "월평균노출광고수": format_numbers(df["avg_ads"], "{:,.0f}"),
+    })
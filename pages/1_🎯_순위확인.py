@@ -4,12 +4,16 @@
 """
 
 import streamlit as st
-import json
-import urllib.request
-import urllib.parse
 import os
+import pandas as pd
 from dotenv import load_dotenv
 
+import metrics
+import naver_api
+import normalize
+import profiling
+import tracing
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -83,92 +87,70 @@ def search_rank(keyword, shop_name, sort_option, display_count):
     try:
         with st.spinner("🔍 순위를 검색하는 중..."):
             # 네이버 쇼핑 API 호출
-            url = "https://openapi.naver.com/v1/search/shop.json"
-            params = {
-                "query": keyword,
-                "display": min(display_count, 100),
-                "sort": sort_param
-            }
-            
-            # URL 인코딩
-            query_string = urllib.parse.urlencode(params)
-            full_url = f"{url}?{query_string}"
-            
-            # 요청 헤더
-            request = urllib.request.Request(full_url)
-            request.add_header("X-Naver-Client-Id", CLIENT_ID)
-            request.add_header("X-Naver-Client-Secret", CLIENT_SECRET)
-            
-            # API 호출
-            response = urllib.request.urlopen(request)
-            response_data = response.read()
-            result = json.loads(response_data.decode('utf-8'))
+            result = naver_api.search_shop(keyword, display=min(display_count, 100), sort=sort_param,
+                                           client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
             
             if result.get('items'):
-                display_results(result['items'], shop_name, keyword)
+                display_results(normalize.response_to_frame(result), shop_name, keyword)
             else:
                 st.warning("⚠️ 검색 결과가 없습니다.")
                 
     except Exception as e:
         st.error(f"❌ 검색 중 오류 발생: {str(e)}")
 
+@metrics.timed("page1.render")
 def display_results(items, shop_name, keyword):
-    """검색 결과 표시"""
+    """검색 결과 표시 (items: normalize.items_to_frame 결과)"""
     
     found_rank = None
     total_results = len(items)
     
-    # 판매처명 매칭 (부분 일치)
-    for i, item in enumerate(items, 1):
-        item_title = item.get('title', '').replace('<b>', '').replace('</b>', '')
-        item_mall = item.get('mallName', '')
-        
-        # 판매처명이 제목이나 몰명에 포함되어 있는지 확인
-        if shop_name.lower() in item_mall.lower() or shop_name.lower() in item_title.lower():
-            found_rank = i
-            break
+    # 판매처명이 제목이나 몰명에 포함되어 있는지 확인 (부분 일치)
+    shop_lower = shop_name.lower()
+    matched = (items['mallName'].str.lower().str.contains(shop_lower, regex=False)
+               | items['title'].str.lower().str.contains(shop_lower, regex=False))
+    if matched.any():
+        found_rank = int(items.loc[matched.idxmax(), 'rank'])
     
     # 결과 표시
     if found_rank:
         st.success(f"🎉 **{shop_name}**의 **{keyword}** 순위: **{found_rank}위**")
         
         # 해당 상품 정보 표시
-        target_item = items[found_rank - 1]
+        target_item = items.iloc[found_rank - 1]
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            st.markdown(f"**상품명:** {target_item.get('title', '').replace('<b>', '').replace('</b>', '')}")
-            st.markdown(f"**판매처:** {target_item.get('mallName', '')}")
-            st.markdown(f"**가격:** {target_item.get('lprice', 'N/A')}원")
+            st.markdown(f"**상품명:** {target_item['title']}")
+            st.markdown(f"**판매처:** {target_item['mallName']}")
+            st.markdown(f"**가격:** {format_price(target_item['price'])}원")
         
         with col2:
-            if target_item.get('image'):
+            if target_item['image']:
                 st.image(target_item['image'], width=150)
         
         # 상위 10개 결과 표시
         st.markdown("### 📊 상위 10개 검색 결과")
-        for i, item in enumerate(items[:10], 1):
-            item_title = item.get('title', '').replace('<b>', '').replace('</b>', '')
-            item_mall = item.get('mallName', '')
-            item_price = item.get('lprice', 'N/A')
-            
+        for item in items.head(10).itertuples(index=False):
             # 현재 순위 강조
-            if i == found_rank:
-                st.markdown(f"**{i}위** 🎯 **{item_mall}** - {item_title} ({item_price}원)")
+            if item.rank == found_rank:
+                st.markdown(f"**{item.rank}위** 🎯 **{item.mallName}** - {item.title} ({format_price(item.price)}원)")
             else:
-                st.markdown(f"{i}위 - {item_mall} - {item_title} ({item_price}원)")
+                st.markdown(f"{item.rank}위 - {item.mallName} - {item.title} ({format_price(item.price)}원)")
     else:
         st.warning(f"⚠️ **{shop_name}**의 **{keyword}** 검색 결과에서 해당 판매처를 찾을 수 없습니다.")
         st.info(f"총 {total_results}개 상품 중에서 검색했습니다.")
         
         # 상위 10개 결과 표시
         st.markdown("### 📊 상위 10개 검색 결과")
-        for i, item in enumerate(items[:10], 1):
-            item_title = item.get('title', '').replace('<b>', '').replace('</b>', '')
-            item_mall = item.get('mallName', '')
-            item_price = item.get('lprice', 'N/A')
-            st.markdown(f"{i}위 - {item_mall} - {item_title} ({item_price}원)")
+        for item in items.head(10).itertuples(index=False):
+            st.markdown(f"{item.rank}위 - {item.mallName} - {item.title} ({format_price(item.price)}원)")
+
+def format_price(price):
+    """가격 표시 (숫자가 아니었던 가격은 N/A)"""
+    return "N/A" if pd.isna(price) else price
 
 # 메인 실행
 if __name__ == "__main__":
-    rank_checker_tab()
+    with tracing.rerun("page1"):
+        profiling.run("page1", rank_checker_tab)
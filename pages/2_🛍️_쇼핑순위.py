@@ -4,12 +4,16 @@
 """
 
 import streamlit as st
-import json
-import urllib.request
-import urllib.parse
 import os
+import pandas as pd
 from dotenv import load_dotenv
 
+import metrics
+import naver_api
+import normalize
+import profiling
+import tracing
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -73,37 +77,20 @@ def search_shopping_rank(keyword, sort_option, display_count):
     try:
         with st.spinner("🔍 순위를 조회하는 중..."):
             # 네이버 쇼핑 API 호출
-            url = "https://openapi.naver.com/v1/search/shop.json"
-            params = {
-                "query": keyword,
-                "display": min(display_count, 100),
-                "sort": sort_param
-            }
-            
-            # URL 인코딩
-            query_string = urllib.parse.urlencode(params)
-            full_url = f"{url}?{query_string}"
-            
-            # 요청 헤더
-            request = urllib.request.Request(full_url)
-            request.add_header("X-Naver-Client-Id", CLIENT_ID)
-            request.add_header("X-Naver-Client-Secret", CLIENT_SECRET)
-            
-            # API 호출
-            response = urllib.request.urlopen(request)
-            response_data = response.read()
-            result = json.loads(response_data.decode('utf-8'))
+            result = naver_api.search_shop(keyword, display=min(display_count, 100), sort=sort_param,
+                                           client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
             
             if result.get('items'):
-                display_shopping_results(result['items'], keyword, sort_option)
+                display_shopping_results(normalize.response_to_frame(result), keyword, sort_option)
             else:
                 st.warning("⚠️ 검색 결과가 없습니다.")
                 
     except Exception as e:
         st.error(f"❌ 검색 중 오류 발생: {str(e)}")
 
+@metrics.timed("page2.render")
 def display_shopping_results(items, keyword, sort_option):
-    """쇼핑 순위 결과 표시"""
+    """쇼핑 순위 결과 표시 (items: normalize.items_to_frame 결과)"""
     
     st.success(f"🎉 **{keyword}** 키워드 순위 조회 완료!")
     
@@ -114,15 +101,15 @@ def display_shopping_results(items, keyword, sort_option):
         st.metric("📊 총 상품 수", len(items))
     
     with col2:
-        prices = [int(item.get('lprice', 0)) for item in items if item.get('lprice', '').isdigit()]
-        if prices:
-            avg_price = sum(prices) / len(prices)
+        prices = items['price'].dropna()
+        if len(prices):
+            avg_price = prices.mean()
             st.metric("💰 평균 가격", f"{avg_price:,.0f}원")
         else:
             st.metric("💰 평균 가격", "N/A")
     
     with col3:
-        unique_malls = len(set([item.get('mallName', '') for item in items]))
+        unique_malls = items['mallName'].nunique()
         st.metric("🏪 판매처 수", unique_malls)
     
     with col4:
@@ -141,12 +128,13 @@ def display_shopping_results(items, keyword, sort_option):
         page = st.selectbox("📄 페이지 선택", range(1, total_pages + 1), format_func=lambda x: f"페이지 {x}")
         start_idx = (page - 1) * items_per_page
         end_idx = min(start_idx + items_per_page, len(items))
-        page_items = items[start_idx:end_idx]
+        page_items = items.iloc[start_idx:end_idx]
     else:
+        start_idx = 0
         page_items = items
     
     # 상품 목록 표시
-    for i, item in enumerate(page_items, start_idx + 1):
+    for i, item in enumerate(page_items.itertuples(index=False), start_idx + 1):
         with st.container():
             col1, col2, col3 = st.columns([1, 4, 1])
             
@@ -159,20 +147,17 @@ def display_shopping_results(items, keyword, sort_option):
                     st.markdown(f"### {i}위")
             
             with col2:
-                item_title = item.get('title', '').replace('<b>', '').replace('</b>', '')
-                item_mall = item.get('mallName', '')
-                item_price = item.get('lprice', 'N/A')
-                item_brand = item.get('brand', '')
+                item_price = "N/A" if pd.isna(item.price) else item.price
                 
-                st.markdown(f"**{item_title}**")
-                st.markdown(f"🏪 {item_mall}")
-                if item_brand:
-                    st.markdown(f"🏷️ {item_brand}")
+                st.markdown(f"**{item.title}**")
+                st.markdown(f"🏪 {item.mallName}")
+                if item.brand:
+                    st.markdown(f"🏷️ {item.brand}")
                 st.markdown(f"💰 {item_price}원")
             
             with col3:
-                if item.get('image'):
-                    st.image(item['image'], width=100)
+                if item.image:
+                    st.image(item.image, width=100)
                 else:
                     st.markdown("📷 이미지 없음")
             
@@ -184,4 +169,5 @@ def display_shopping_results(items, keyword, sort_option):
 
 # 메인 실행
 if __name__ == "__main__":
-    shopping_rank_tab()
+    with tracing.rerun("page2"):
+        profiling.run("page2", shopping_rank_tab)
@@ -4,12 +4,16 @@
 """
 
 import streamlit as st
-import json
-import urllib.request
-import urllib.parse
 import os
+import pandas as pd
 from dotenv import load_dotenv
 
+import metrics
+import naver_api
+import normalize
+import profiling
+import tracing
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -72,37 +76,20 @@ def analyze_keywords(keyword, analysis_type, max_keywords, min_search_volume):
     try:
         with st.spinner("📊 키워드를 분석하는 중..."):
             # 네이버 쇼핑 API 호출
-            url = "https://openapi.naver.com/v1/search/shop.json"
-            params = {
-                "query": keyword,
-                "display": 100,
-                "sort": "sim"
-            }
-            
-            # URL 인코딩
-            query_string = urllib.parse.urlencode(params)
-            full_url = f"{url}?{query_string}"
-            
-            # 요청 헤더
-            request = urllib.request.Request(full_url)
-            request.add_header("X-Naver-Client-Id", CLIENT_ID)
-            request.add_header("X-Naver-Client-Secret", CLIENT_SECRET)
-            
-            # API 호출
-            response = urllib.request.urlopen(request)
-            response_data = response.read()
-            result = json.loads(response_data.decode('utf-8'))
+            result = naver_api.search_shop(keyword, display=100, sort="sim",
+                                           client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
             
             if result.get('items'):
-                display_keyword_analysis(result['items'], keyword, analysis_type, max_keywords, min_search_volume)
+                display_keyword_analysis(normalize.response_to_frame(result), keyword, analysis_type, max_keywords, min_search_volume)
             else:
                 st.warning("⚠️ 분석할 데이터가 없습니다.")
                 
     except Exception as e:
         st.error(f"❌ 분석 중 오류 발생: {str(e)}")
 
+@metrics.timed("page3.render")
 def display_keyword_analysis(items, keyword, analysis_type, max_keywords, min_search_volume):
-    """키워드 분석 결과 표시"""
+    """키워드 분석 결과 표시 (items: normalize.items_to_frame 결과)"""
     
     st.success(f"🎉 **{keyword}** 키워드 분석 완료!")
     
@@ -113,15 +100,15 @@ def display_keyword_analysis(items, keyword, analysis_type, max_keywords, min_se
         st.metric("📊 총 상품 수", len(items))
     
     with col2:
-        unique_brands = len(set([item.get('brand', '') for item in items if item.get('brand')]))
+        unique_brands = items.loc[items['brand'] != '', 'brand'].nunique()
         st.metric("🏷️ 브랜드 수", unique_brands)
     
     with col3:
-        unique_malls = len(set([item.get('mallName', '') for item in items]))
+        unique_malls = items['mallName'].nunique()
         st.metric("🏪 판매처 수", unique_malls)
     
     with col4:
-        avg_price = sum([int(item.get('lprice', 0)) for item in items if item.get('lprice', '').isdigit()]) / len(items)
+        avg_price = items['price'].sum() / len(items)
         st.metric("💰 평균 가격", f"{avg_price:,.0f}원")
     
     st.markdown("---")
@@ -138,18 +125,8 @@ def display_related_keywords(items, keyword, max_keywords):
     """연관 키워드 분석 결과"""
     st.markdown("### 🔗 연관 키워드 분석")
     
-    # 상품명에서 키워드 추출
-    keywords = {}
-    for item in items:
-        title = item.get('title', '').replace('<b>', '').replace('</b>', '').lower()
-        words = title.split()
-        
-        for word in words:
-            if len(word) > 1 and word not in ['의', '를', '을', '에', '에서', '로', '으로']:
-                keywords[word] = keywords.get(word, 0) + 1
-    
-    # 상위 키워드 정렬
-    sorted_keywords = sorted(keywords.items(), key=lambda x: x[1], reverse=True)[:max_keywords]
+    # 상품명에서 키워드 추출 후 상위 키워드 정렬 (빈도가 같으면 먼저 등장한 단어 우선)
+    sorted_keywords = normalize.title_word_counts(items['title'], max_keywords)
     
     # 키워드 클라우드 형태로 표시
     st.markdown("#### 📈 키워드 빈도 분석")
@@ -166,36 +143,27 @@ def display_competitor_keywords(items, keyword, max_keywords):
     """경쟁 키워드 분석 결과"""
     st.markdown("### ⚔️ 경쟁 키워드 분석")
     
-    # 브랜드별 분석
-    brand_analysis = {}
-    for item in items:
-        brand = item.get('brand', '')
-        if brand:
-            if brand not in brand_analysis:
-                brand_analysis[brand] = {'count': 0, 'avg_price': 0, 'items': []}
-            brand_analysis[brand]['count'] += 1
-            brand_analysis[brand]['items'].append(item)
-    
-    # 브랜드별 평균 가격 계산
-    for brand, data in brand_analysis.items():
-        prices = [int(item.get('lprice', 0)) for item in data['items'] if item.get('lprice', '').isdigit()]
-        if prices:
-            data['avg_price'] = sum(prices) / len(prices)
+    # 브랜드별 상품 수와 평균 가격
+    brand_analysis = (items[items['brand'] != '']
+                      .groupby('brand', sort=False)
+                      .agg(count=('brand', 'size'), avg_price=('price', 'mean'))
+                      .fillna({'avg_price': 0}))
     
     # 브랜드별 경쟁력 분석
     st.markdown("#### 🏆 브랜드별 경쟁력 분석")
-    sorted_brands = sorted(brand_analysis.items(), key=lambda x: x[1]['count'], reverse=True)[:max_keywords]
+    sorted_brands = brand_analysis.sort_values('count', ascending=False, kind='stable').head(max_keywords)
     
-    for i, (brand, data) in enumerate(sorted_brands, 1):
+    for i, (brand, count, avg_price) in enumerate(
+            zip(sorted_brands.index, sorted_brands['count'], sorted_brands['avg_price']), 1):
         col1, col2, col3, col4 = st.columns([1, 2, 1, 1])
         with col1:
             st.markdown(f"**{i}위**")
         with col2:
             st.markdown(f"**{brand}**")
         with col3:
-            st.metric("상품 수", data['count'])
+            st.metric("상품 수", int(count))
         with col4:
-            st.metric("평균가", f"{data['avg_price']:,.0f}원")
+            st.metric("평균가", f"{avg_price:,.0f}원")
 
 def display_trend_keywords(items, keyword, max_keywords):
     """트렌드 키워드 분석 결과"""
@@ -210,18 +178,9 @@ def display_trend_keywords(items, keyword, max_keywords):
         "20만원 이상": 0
     }
     
-    for item in items:
-        price = int(item.get('lprice', 0)) if item.get('lprice', '').isdigit() else 0
-        if price < 10000:
-            price_ranges["1만원 미만"] += 1
-        elif price < 50000:
-            price_ranges["1-5만원"] += 1
-        elif price < 100000:
-            price_ranges["5-10만원"] += 1
-        elif price < 200000:
-            price_ranges["10-20만원"] += 1
-        else:
-            price_ranges["20만원 이상"] += 1
+    buckets = pd.cut(items['price'].fillna(0), bins=[-float('inf'), 10000, 50000, 100000, 200000, float('inf')],
+                     labels=list(price_ranges), right=False)
+    price_ranges.update(buckets.value_counts().to_dict())
     
     # 가격대별 트렌드 표시
     st.markdown("#### 💰 가격대별 트렌드")
@@ -236,4 +195,5 @@ def display_trend_keywords(items, keyword, max_keywords):
 
 # 메인 실행
 if __name__ == "__main__":
-    keyword_analysis_tab()
+    with tracing.rerun("page3"):
+        profiling.run("page3", keyword_analysis_tab)
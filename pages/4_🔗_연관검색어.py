@@ -4,20 +4,18 @@
 """
 
 import streamlit as st
-import json
-import urllib.request
-import urllib.parse
 import os
-import time
-import requests
-import hmac
-import hashlib
-import base64
 import pandas as pd
 from dotenv import load_dotenv
 from collections import Counter
 import re
 
+import metrics
+import naver_api
+import normalize
+import profiling
+import tracing
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -30,128 +28,54 @@ CUSTOMER_ID = os.getenv("NAVER_CUSTOMER_ID", "3900043")
 CLIENT_ID = os.getenv("NAVER_CLIENT_ID", "your_client_id_here")
 CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET", "your_client_secret_here")
 
-BASE_URL = 'https://api.searchad.naver.com'
-
-def generate_signature(timestamp, method, uri, secret_key):
-    """네이버 광고 API 서명 생성 (네이버 공식 문서 샘플 코드 기준)"""
-    message = f"{timestamp}.{method}.{uri}"
-    hash_obj = hmac.new(
-        secret_key.encode('utf-8'), 
-        message.encode('utf-8'), 
-        hashlib.sha256
-    )
-    return base64.b64encode(hash_obj.digest()).decode()
-
-def get_header(method, uri, api_key, secret_key, customer_id):
-    """네이버 광고 API 헤더 생성 (네이버 공식 문서 기준)"""
-    timestamp = str(round(time.time() * 1000))
-    signature = generate_signature(timestamp, method, uri, secret_key)
-    
-    if signature is None:
-        return None
-    
-    return {
-        'Content-Type': 'application/json; charset=UTF-8',
-        'X-Timestamp': timestamp,
-        'X-API-KEY': api_key,
-        'X-Customer': str(customer_id),
-        'X-Signature': signature
-    }
-
-def safe_int_conversion(value):
-    """값을 정수로 안전하게 변환하고, 변환 실패 시 0을 반환합니다."""
-    if isinstance(value, int):
-        return value
-    try:
-        return int(value)
-    except (ValueError, TypeError):
-        return 0
-
 def get_related_keywords_from_ad_api(keyword):
     """네이버 광고 API를 사용하여 연관검색어 추출 (네이버 공식 문서 기준)"""
     try:
-        # 키워드 도구 API 호출 (올바른 엔드포인트)
-        uri = '/keywordstool'
-        method = 'GET'
-        
-        headers = get_header(method, uri, API_KEY, SECRET_KEY, CUSTOMER_ID)
-        
-        if headers is None:
-            st.error("❌ API 헤더 생성 실패")
-            return None
-        
-        # 키워드 추천 요청 (네이버 공식 문서 기준)
-        params = {
-            'hintKeywords': keyword,
-            'showDetail': '1'
-        }
-        
-        # URL에 파라미터 추가
-        query_string = urllib.parse.urlencode(params)
-        full_url = f"{BASE_URL}{uri}?{query_string}"
-        
-        response = requests.get(
-            full_url,
-            headers=headers
-        )
-        
-        st.info(f"🔍 API 호출 상태: {response.status_code}")
-        st.info(f"🔍 요청 URL: {full_url}")
-        st.info(f"🔍 요청 헤더: {headers}")
-        st.info(f"🔍 응답 내용: {response.text[:500]}...")
-        
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 403:
+        # 월간 집계 데이터이므로 이미 조회한 키워드는 캐시에서 바로 반환 (재시도, 요청 합치기 포함)
+        return naver_api.get_keywordstool(keyword, api_key=API_KEY, secret_key=SECRET_KEY,
+                                          customer_id=CUSTOMER_ID)
+    except naver_api.NaverApiError as e:
+        st.info(f"🔍 API 호출 상태: {e.status}")
+        st.info(f"🔍 요청 URL: {e.url}")
+        if e.status == 403:
             st.warning("⚠️ 네이버 광고 API 서명 오류입니다.")
             st.info("API 키와 시크릿 키를 확인해주세요.")
-            return None
         else:
-            st.warning(f"⚠️ API 호출 실패: {response.status_code}")
-            st.warning(f"응답: {response.text}")
-            return None
-            
+            st.warning(f"⚠️ API 호출 실패: {e.status}")
+            st.warning(f"응답: {e.body}")
+        return None
     except Exception as e:
         st.error(f"❌ API 호출 중 오류: {str(e)}")
         return None
 
+@metrics.timed("page4.process")
 def process_ad_api_response(response_data):
     """네이버 광고 API 응답을 처리하여 데이터프레임으로 변환합니다."""
     keyword_list = response_data.get('keywordList', [])
     if not keyword_list:
         return pd.DataFrame()
 
-    processed_data = []
-    for item in keyword_list:
-        pc_qc_cnt = safe_int_conversion(item.get('monthlyPcQcCnt', 0))
-        mobile_qc_cnt = safe_int_conversion(item.get('monthlyMobileQcCnt', 0))
-        pc_click_cnt = safe_int_conversion(item.get('monthlyPcClickCnt', 0))
-        mobile_click_cnt = safe_int_conversion(item.get('monthlyMobileClickCnt', 0))
-
-        total_search = pc_qc_cnt + mobile_qc_cnt
-        total_clicks = pc_click_cnt + mobile_click_cnt
-        
-        pc_ctr = (pc_click_cnt / pc_qc_cnt * 100) if pc_qc_cnt > 0 else 0
-        mobile_ctr = (mobile_click_cnt / mobile_qc_cnt * 100) if mobile_qc_cnt > 0 else 0
-
-        processed_data.append({
-            '연관키워드': item.get('relKeyword', 'N/A'),
-            '월간검색수(PC)': pc_qc_cnt,
-            '월간검색수(모바일)': mobile_qc_cnt,
-            '월간 총 검색수': total_search,
-            '월평균클릭수(PC)': pc_click_cnt,
-            '월평균클릭수(모바일)': mobile_click_cnt,
-            '월평균 총 클릭수': total_clicks,
-            '월평균클릭률(PC)': f"{pc_ctr:.2f}%",
-            '월평균클릭률(모바일)': f"{mobile_ctr:.2f}%",
-            '경쟁정도': item.get('compIdx', 'N/A'),
-            '월평균노출광고수': item.get('plAvgDepth', 'N/A')
-        })
-    
-    df = pd.DataFrame(processed_data)
-    df = df.sort_values(by='월간 총 검색수', ascending=False).reset_index(drop=True)
+    stats = normalize.keyword_list_to_frame(keyword_list)
+    df = pd.DataFrame({
+        '연관키워드': stats['keyword'],
+        # 검색수가 10 미만인 키워드는 API 응답처럼 "< 10"으로 표시 (총 검색수에는 0으로 합산)
+        '월간검색수(PC)': normalize.format_numbers(stats['pc_search'], "{:,}", stats['pc_search_below_10']),
+        '월간검색수(모바일)': normalize.format_numbers(stats['mobile_search'], "{:,}",
+                                                 stats['mobile_search_below_10']),
+        '월간 총 검색수': stats['total_search'],
+        '월평균클릭수(PC)': stats['pc_click'],
+        '월평균클릭수(모바일)': stats['mobile_click'],
+        '월평균 총 클릭수': stats['total_click'],
+        '월평균클릭률(PC)': stats['pc_ctr'],
+        '월평균클릭률(모바일)': stats['mobile_ctr'],
+        '경쟁정도': stats['comp_idx'],
+        '경쟁정도(점수)': stats['comp_level'],
+        '월평균노출광고수': stats['avg_ads'],
+    })
+    df = df.sort_values(by='월간 총 검색수', ascending=False, kind="stable").reset_index(drop=True)
     return df
 
+@metrics.timed("page4.render")
 def display_ad_api_results(df, keyword):
     """네이버 광고 API 결과 표시"""
     if df.empty:
@@ -171,14 +95,29 @@ def display_ad_api_results(df, keyword):
         avg_clicks = df['월평균 총 클릭수'].mean()
         st.metric("🖱️ 평균 월간 클릭수", f"{avg_clicks:,.0f}")
     with col4:
-        # '경쟁정도'가 문자열일 수 있으므로 숫자만 필터링
-        numeric_comp = pd.to_numeric(df['경쟁정도'], errors='coerce').dropna()
-        avg_comp = numeric_comp.mean() if not numeric_comp.empty else 0
-        st.metric("🏆 평균 경쟁정도", f"{avg_comp:.1f}")
+        # 경쟁정도 낮음/중간/높음을 1/2/3 점수로 평균
+        avg_comp = df['경쟁정도(점수)'].mean()
+        st.metric("🏆 평균 경쟁정도", "-" if pd.isna(avg_comp) else f"{avg_comp:.1f} / 3")
 
     st.markdown("---")
     st.markdown(f"### 📊 '{keyword}' 연관검색어 상세 데이터")
-    st.dataframe(df, use_container_width=True)
+    # 숫자 서식은 표에서 보이는 셀에만 적용됨
+    count_format = st.column_config.NumberColumn(format="%d", help="10 미만(< 10)인 검색수는 0으로 합산됩니다.")
+    click_format = st.column_config.NumberColumn(format="%.0f")
+    ctr_format = st.column_config.NumberColumn(format="%.2f%%")
+    st.dataframe(
+        df.drop(columns=['경쟁정도(점수)']),
+        use_container_width=True,
+        column_config={
+            '월간 총 검색수': count_format,
+            '월평균클릭수(PC)': click_format,
+            '월평균클릭수(모바일)': click_format,
+            '월평균 총 클릭수': click_format,
+            '월평균클릭률(PC)': ctr_format,
+            '월평균클릭률(모바일)': ctr_format,
+            '월평균노출광고수': click_format,
+        },
+    )
 
     # 시각화
     st.markdown("---")
@@ -189,7 +128,7 @@ def display_ad_api_results(df, keyword):
         st.bar_chart(chart_data.set_index('연관키워드')['월간 총 검색수'])
     with col2:
         st.markdown("#### 🏆 경쟁 정도 (상위 15개)")
-        st.bar_chart(chart_data.set_index('연관키워드')['경쟁정도'])
+        st.bar_chart(chart_data.set_index('연관키워드')['경쟁정도(점수)'])
 
 def analyze_related_keywords(keyword):
     """연관검색어 분석 실행"""
@@ -234,4 +173,5 @@ def related_keywords_tab():
 
 # 메인 실행
 if __name__ == "__main__":
-    related_keywords_tab()
+    with tracing.rerun("page4"):
+        profiling.run("page4", related_keywords_tab)
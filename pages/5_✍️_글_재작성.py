@@ -2,6 +2,13 @@ import streamlit as st
 import requests
 import json
 import random
+import time
+
+import config
+import gemini_api
+import metrics
+import profiling
+import tracing
 
 # --- 페이지 설정 ---
 st.set_page_config(page_title="AI 카피라이터", page_icon="✍️", layout="wide")
@@ -35,13 +42,9 @@ def generate_html_content(text_content, theme):
 # --- 함수 정의 ---
 
 def get_available_models():
-    """사용 가능한 Gemini 모델 목록을 가져옵니다."""
+    """사용 가능한 Gemini 모델 목록을 가져옵니다. (프로세스 전체 캐시, 재실행마다 API를 호출하지 않음)"""
     try:
-        conn = requests.get(f"https://generativelanguage.googleapis.com/v1/models?key={API_KEY}")
-        conn.raise_for_status() # HTTP 오류 발생 시 예외 발생
-        models_data = conn.json()
-        # 'generateContent'를 지원하는 모델만 필터링
-        return [m['name'] for m in models_data.get('models', []) if 'generateContent' in m.get('supportedGenerationMethods', [])]
+        return gemini_api.list_models(API_KEY)
     except requests.exceptions.HTTPError as http_err:
         st.error(f"모델 목록 조회 실패 (HTTP Status: {http_err.response.status_code}): {http_err.response.text}")
         return []
@@ -52,8 +55,35 @@ def get_available_models():
         st.error(f"모델 목록 조회 중 오류 발생: {e}")
         return []
 
-def rewrite_text_with_gemini(original_text, mode, model_name):
-    """Gemini API 직접 호출 (requests 라이브러리 사용으로 변경)"""
+def stream_rewrite(prompt, mode, model_name):
+    """스트리밍으로 받은 글을 받는 대로 화면에 표시하고, 다 받으면 전체 글 반환"""
+    placeholder = st.empty()
+    placeholder.caption(f"`{model_name}` 모델이 글을 작성하고 있습니다...")
+
+    chunks = []
+    last_update = 0.0
+    for chunk in gemini_api.stream_generate_content(model_name, prompt, API_KEY):
+        chunks.append(chunk)
+        # 조각마다 다시 그리면 느려지므로 최소 간격을 두고 갱신
+        now = time.monotonic()
+        if now - last_update >= config.GEMINI_STREAM_UPDATE_INTERVAL:
+            last_update = now
+            partial = "".join(chunks)
+            if mode == "일반 글 모드":
+                placeholder.markdown(partial + " ▌")
+            else:
+                placeholder.code(partial, language="html")
+
+    # 다 받은 글은 아래 결과 영역에 표시
+    placeholder.empty()
+    content = "".join(chunks)
+    if not content:
+        st.error("생성된 글이 없습니다. 다른 모델로 다시 시도해주세요.")
+        return None
+    return content
+
+def rewrite_text_with_gemini(original_text, mode, model_name, stream=True):
+    """Gemini API 직접 호출 (stream이 True이면 생성되는 대로 표시)"""
     
     # 프롬프트 구성
     if mode == "일반 글 모드":
@@ -79,16 +109,22 @@ def rewrite_text_with_gemini(original_text, mode, model_name):
         **[재작성된 HTML 코드 (`<body>` 내부)]**
         """
     
-    url = f"https://generativelanguage.googleapis.com/v1/{model_name}:generateContent?key={API_KEY}"
+    url = f"{config.GEMINI_API_BASE_URL}/v1/{model_name}:generateContent?key={API_KEY}"
     headers = {'Content-Type': 'application/json'}
     payload = {"contents": [{"parts": [{"text": prompt}]}]}
 
     try:
+        if stream:
+            return stream_rewrite(prompt, mode, model_name)
+
         with st.spinner(f"`{model_name}` 모델을 사용하여 글을 재작성합니다..."):
-            # POST 요청 (120초 타임아웃)
-            response = requests.post(url, headers=headers, json=payload, timeout=120)
-            # HTTP 오류 발생 시 예외 처리
-            response.raise_for_status()
+            with metrics.api_call("gemini/generateContent", cacheable=False):
+                metrics.note_attempt()
+                # POST 요청 (120초 타임아웃)
+                response = requests.post(url, headers=headers, json=payload, timeout=120)
+                metrics.note_bytes(len(response.content))
+                # HTTP 오류 발생 시 예외 처리
+                response.raise_for_status()
 
         response_json = response.json()
         return response_json['candidates'][0]['content']['parts'][0]['text']
@@ -114,52 +150,61 @@ def rewrite_text_with_gemini(original_text, mode, model_name):
 
 # --- UI 구성 ---
 
-st.markdown('<h1 style="text-align: center; color: #4A90E2;">✍️ AI 카피라이터</h1>', unsafe_allow_html=True)
-st.markdown("---")
-
-available_models = get_available_models()
-
-if not available_models:
-    st.error("사용 가능한 모델을 찾을 수 없습니다. API 키를 확인해주세요.")
-else:
-    # --- 입력 섹션 ---
-    col1, col2 = st.columns(2)
-    with col1:
-        st.subheader("1. 원본 글 입력")
-        original_text = st.text_area("재작성할 글을 여기에 붙여넣어 주세요.", height=400)
-
-    with col2:
-        st.subheader("2. 재작성 옵션 선택")
-        selected_model = st.selectbox("사용할 AI 모델 선택", available_models)
-        mode = st.radio("결과물 형태 선택", ("일반 글 모드", "HTML 코드 모드"))
-
-    if st.button("🚀 지금 글 재작성하기", type="primary", use_container_width=True):
-        if original_text:
-            rewritten_content = rewrite_text_with_gemini(original_text, mode, selected_model)
-            if rewritten_content:
-                st.session_state.rewritten_content = rewritten_content
-                st.session_state.mode = mode
-        else:
-            st.warning("⚠️ 재작성할 원본 글을 입력해주세요.")
-
-# --- 결과 출력 ---
-if 'rewritten_content' in st.session_state:
+def rewrite_page():
+    """AI 카피라이터 화면"""
+    st.markdown('<h1 style="text-align: center; color: #4A90E2;">✍️ AI 카피라이터</h1>', unsafe_allow_html=True)
     st.markdown("---")
-    st.subheader("✨ 재작성 결과")
-
-    content = st.session_state.rewritten_content
-    output_mode = st.session_state.mode
     
-    if output_mode == "일반 글 모드":
-        st.text_area("결과물", content, height=500)
-    else: # HTML 코드 모드
-        theme = random.choice(THEMES)
-        final_html = generate_html_content(content, theme)
+    available_models = get_available_models()
+    
+    if not available_models:
+        st.error("사용 가능한 모델을 찾을 수 없습니다. API 키를 확인해주세요.")
+    else:
+        # --- 입력 섹션 ---
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("1. 원본 글 입력")
+            original_text = st.text_area("재작성할 글을 여기에 붙여넣어 주세요.", height=400)
+    
+        with col2:
+            st.subheader("2. 재작성 옵션 선택")
+            selected_model = st.selectbox("사용할 AI 모델 선택", available_models)
+            mode = st.radio("결과물 형태 선택", ("일반 글 모드", "HTML 코드 모드"))
+            stream = st.checkbox("작성되는 대로 보기 (스트리밍)", value=True,
+                                 help="끄면 글이 모두 작성된 뒤에 한 번에 표시합니다")
+    
+        if st.button("🚀 지금 글 재작성하기", type="primary", use_container_width=True):
+            if original_text:
+                rewritten_content = rewrite_text_with_gemini(original_text, mode, selected_model, stream)
+                if rewritten_content:
+                    st.session_state.rewritten_content = rewritten_content
+                    st.session_state.mode = mode
+            else:
+                st.warning("⚠️ 재작성할 원본 글을 입력해주세요.")
+    
+    # --- 결과 출력 ---
+    if 'rewritten_content' in st.session_state:
+        st.markdown("---")
+        st.subheader("✨ 재작성 결과")
+    
+        content = st.session_state.rewritten_content
+        output_mode = st.session_state.mode
+    
+        if output_mode == "일반 글 모드":
+            st.text_area("결과물", content, height=500)
+        else: # HTML 코드 모드
+            theme = random.choice(THEMES)
+            final_html = generate_html_content(content, theme)
         
-        st.markdown("#### 미리보기")
-        st.markdown(final_html, unsafe_allow_html=True)
+            st.markdown("#### 미리보기")
+            st.markdown(final_html, unsafe_allow_html=True)
         
-        st.markdown("---")
+            st.markdown("---")
         
-        st.markdown("#### HTML 코드")
-        st.code(final_html, language="html")
+            st.markdown("#### HTML 코드")
+            st.code(final_html, language="html")
+
+# 메인 실행
+if __name__ == "__main__":
+    with tracing.rerun("page5"):
+        profiling.run("page5", rewrite_page)
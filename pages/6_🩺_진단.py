@@ -0,0 +1,122 @@
+"""
+진단 페이지
+API 엔드포인트와 처리 단계별 지연 시간(p50/p95/p99), 응답 크기, 캐시 적중률,
+요청 합치기·재시도·오류 수와 오늘 남은 API 호출 한도를 보여주는 기능
+"""
+
+import streamlit as st
+from datetime import datetime
+import pandas as pd
+
+import config
+import metrics
+import naver_api
+import profiling
+import rate_limit
+import resilience
+import tracing
+from cache import shop_cache
+
+BREAKER_LABELS = {"closed": "🟢 정상", "open": "🔴 차단", "half_open": "🟡 시험 중"}
+
+
+def summary_frame(kind):
+    """metrics.summary() 결과를 표시용 데이터프레임으로 변환"""
+    rows = metrics.summary(kind)
+    if not rows:
+        return None
+
+    df = pd.DataFrame(rows)
+    display_df = pd.DataFrame({
+        '이름': df['name'],
+        '횟수': df['count'],
+        'p50(ms)': df['p50_ms'].round(1),
+        'p95(ms)': df['p95_ms'].round(1),
+        'p99(ms)': df['p99_ms'].round(1),
+    })
+    if kind == metrics.ENDPOINT:
+        display_df['평균 응답(KB)'] = df['avg_kb'].map(lambda value: "-" if pd.isna(value) else f"{value:.1f}")
+        display_df['캐시 적중률'] = df['hit_rate'].map(lambda value: "-" if pd.isna(value) else f"{value:.0%}")
+        display_df['요청 합침'] = df['coalesced']
+        display_df['재시도'] = df['retries']
+    display_df['오류'] = df['errors']
+    display_df['마지막 기록'] = df['last_seen'].map(lambda value: datetime.fromtimestamp(value).strftime("%H:%M:%S"))
+    return display_df
+
+
+def display_quota():
+    """API별 오늘 남은 호출 한도, 실제 요청 수, 회로 차단기 상태"""
+    calls = naver_api.call_counts()
+    coalesced = naver_api.coalesced_counts()
+    credentials = {"search": ("쇼핑 검색 API", config.CLIENT_ID),
+                   "searchad": ("검색광고 API", str(config.CUSTOMER_ID))}
+
+    cols = st.columns(len(credentials))
+    for col, (api, (label, credential)) in zip(cols, credentials.items()):
+        with col:
+            remaining = rate_limit.remaining_quota(api, credential)
+            st.metric(f"{label} 오늘 남은 호출", "무제한" if remaining is None else f"{remaining:,}회")
+            breaker = resilience.BREAKERS[api].state
+            st.caption(f"요청 {calls.get(api, 0):,}회 · 합침 {coalesced.get(api, 0):,}회 · "
+                       f"회로 차단기 {BREAKER_LABELS.get(breaker, breaker)}")
+
+
+def display_cache():
+    """쇼핑 검색 응답 캐시 적중률"""
+    stats = shop_cache.stats()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("캐시 적중률", f"{stats['hit_rate']:.0%}")
+    with col2:
+        st.metric("메모리 적중", f"{stats['memory_hits']:,}")
+    with col3:
+        st.metric("디스크 적중", f"{stats['disk_hits']:,}")
+    with col4:
+        st.metric("캐시 실패", f"{stats['misses']:,}")
+
+
+def diagnostics_page():
+    """진단 화면"""
+    st.markdown("### 🩺 진단")
+    st.markdown("최근 API 호출과 처리 단계의 소요 시간을 확인합니다. (모든 사용자 세션 합계)")
+
+    if not config.METRICS_ENABLED:
+        st.warning("⚠️ 계측이 꺼져 있습니다. 환경 변수 NAVER_METRICS=1로 켜면 기록이 시작됩니다.")
+
+    col1, col2, _ = st.columns([1, 1, 4])
+    with col1:
+        if st.button("🔄 새로고침", use_container_width=True):
+            st.rerun()
+    with col2:
+        if st.button("🗑️ 기록 초기화", use_container_width=True):
+            metrics.reset()
+            st.success("계측 기록을 초기화했습니다.")
+
+    try:
+        st.markdown("#### 📡 API 한도")
+        display_quota()
+
+        st.markdown("#### 💾 응답 캐시")
+        display_cache()
+
+        st.markdown(f"#### 🌐 API 엔드포인트 (최근 {config.METRICS_WINDOW:,}회 기준)")
+        endpoint_df = summary_frame(metrics.ENDPOINT)
+        if endpoint_df is None:
+            st.info("아직 기록된 API 호출이 없습니다.")
+        else:
+            st.dataframe(endpoint_df, use_container_width=True, hide_index=True)
+
+        st.markdown("#### ⚙️ 처리 단계")
+        stage_df = summary_frame(metrics.STAGE)
+        if stage_df is None:
+            st.info("아직 기록된 처리 단계가 없습니다.")
+        else:
+            st.dataframe(stage_df, use_container_width=True, hide_index=True)
+    except Exception as e:
+        st.error(f"진단 정보 조회 중 오류 발생: {e}")
+
+
+# 메인 실행
+if __name__ == "__main__":
+    with tracing.rerun("page6"):
+        profiling.run("page6", diagnostics_page)
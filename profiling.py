@@ -0,0 +1,164 @@
+"""
+재실행 1회 프로파일링 (관리자 전용)
+사이드바의 버튼으로 켜 두면 다음 재실행 1회를 cProfile로 감싸고, 함수별 누적 시간 상위
+config.PROFILE_TOP_N개 요약과 프로파일 파일(.prof, pstats/snakeviz로 열 수 있음)을
+세션에 보관해 사이드바에서 보여 주고 내려받을 수 있게 합니다.
+
+관리자는 config.ADMIN_USERS에 있는 로그인 사용자입니다. 관리자가 아니거나 켜지 않은
+재실행은 run()이 func를 그대로 호출하므로 추가 비용이 없습니다.
+
+cProfile은 스크립트 스레드만 기록하므로, 순위 확인의 작업자 스레드에서 보낸 API 요청은
+결과를 기다린 시간(Future.result, Queue.get)으로 나타납니다.
+
+사용 예 (app.py, pages/*):
+    if __name__ == "__main__":
+        profiling.run("app", main)
+"""
+
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+import streamlit as st
+
+import config
+
+# 세션 상태 키: 다음 재실행 프로파일링 예약 여부 / 마지막 프로파일 결과
+ARMED_KEY = "profile_next_rerun"
+RESULT_KEY = "profile_result"
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def is_admin() -> bool:
+    """현재 세션이 관리자로 로그인했는지"""
+    return bool(st.session_state.get("authenticated")) and st.session_state.get("username") in config.ADMIN_USERS
+
+
+def _function_label(key) -> str:
+    """pstats 함수 키 (파일, 줄, 함수명)를 읽기 쉬운 이름으로"""
+    filename, line, name = key
+    if filename == "~":
+        # 내장 함수 (예: <built-in method time.sleep>)
+        return name
+    if filename.startswith(_ROOT):
+        filename = os.path.relpath(filename, _ROOT)
+    else:
+        filename = os.path.basename(filename)
+    return f"{filename}:{line}({name})"
+
+
+def top_functions(stats: pstats.Stats, limit: int, sort: str = "cumulative") -> List[Dict]:
+    """
+    상위 함수 목록
+
+    Args:
+        stats: 프로파일 통계
+        limit: 반환할 함수 수
+        sort: cumulative(하위 호출 포함 시간) 또는 tottime(함수 자체 시간)
+
+    Returns:
+        [{function, calls, tottime_ms, cumtime_ms}]
+    """
+    index = 3 if sort == "cumulative" else 2
+    ranked = sorted(stats.stats.items(), key=lambda entry: entry[1][index], reverse=True)[:limit]
+    return [{
+        "function": _function_label(key),
+        "calls": total_calls,
+        "tottime_ms": tottime * 1000,
+        "cumtime_ms": cumtime * 1000,
+    } for key, (_, total_calls, tottime, cumtime, _) in ranked]
+
+
+def build_result(profiler: cProfile.Profile, page: str, seconds: float) -> Dict:
+    """프로파일러 결과를 세션에 보관할 형태로 변환"""
+    buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buffer)
+    stats.sort_stats("cumulative").print_stats(config.PROFILE_TOP_N)
+    return {
+        "page": page,
+        "at": datetime.now().strftime("%Y%m%d_%H%M%S"),
+        "seconds": seconds,
+        # pstats.Stats.dump_stats()와 같은 형식
+        "prof": marshal.dumps(stats.stats),
+        "text": buffer.getvalue(),
+        "top": top_functions(stats, config.PROFILE_TOP_N),
+    }
+
+
+def render_controls(result: Optional[Dict]):
+    """사이드바 프로파일링 버튼과 마지막 결과"""
+    st.markdown("#### 🔬 프로파일링")
+    if st.session_state.get(ARMED_KEY):
+        st.caption("다음 재실행을 프로파일링합니다. 느린 동작을 실행해 주세요.")
+        if st.button("취소", key="profile_cancel"):
+            st.session_state[ARMED_KEY] = False
+            st.rerun()
+    elif st.button("다음 재실행 프로파일링", key="profile_arm", use_container_width=True):
+        st.session_state[ARMED_KEY] = True
+        st.rerun()
+
+    if not result:
+        return
+
+    st.caption(f"{result['page']} · {result['at']} · {result['seconds']:.2f}초")
+    top = pd.DataFrame(result["top"])
+    if not top.empty:
+        st.dataframe(pd.DataFrame({
+            '함수': top['function'],
+            '호출': top['calls'],
+            '누적(ms)': top['cumtime_ms'].round(1),
+            '자체(ms)': top['tottime_ms'].round(1),
+        }), use_container_width=True, hide_index=True)
+
+    name = f"profile_{result['page']}_{result['at']}"
+    st.download_button("📥 프로파일 (.prof)", result["prof"], file_name=f"{name}.prof",
+                       mime="application/octet-stream", key="profile_download_prof")
+    st.download_button("📥 상위 함수 요약 (.txt)", result["text"].encode("utf-8"), file_name=f"{name}.txt",
+                       mime="text/plain", key="profile_download_text")
+
+
+def run(page: str, func: Callable[[], None]):
+    """
+    페이지 재실행 1회 실행 (예약된 경우 프로파일링)
+
+    Args:
+        page: 결과에 표시할 페이지 이름
+        func: 페이지 전체를 그리는 함수 (app.main 등)
+    """
+    if not is_admin():
+        return func()
+
+    panel = st.sidebar.container()
+    if not st.session_state.get(ARMED_KEY):
+        with panel:
+            render_controls(st.session_state.get(RESULT_KEY))
+        return func()
+
+    st.session_state[ARMED_KEY] = False
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Python 3.12부터는 프로세스에서 프로파일러 하나만 켤 수 있음 (다른 세션이 프로파일링 중)
+        with panel:
+            st.warning("다른 세션이 프로파일링 중입니다. 잠시 후 다시 시도해 주세요.")
+            render_controls(st.session_state.get(RESULT_KEY))
+        return func()
+
+    began = time.perf_counter()
+    try:
+        func()
+    finally:
+        # st.rerun(), st.stop()으로 끝난 재실행도 그때까지의 결과를 보관
+        profiler.disable()
+        st.session_state[RESULT_KEY] = build_result(profiler, page, time.perf_counter() - began)
+
+    with panel:
+        render_controls(st.session_state[RESULT_KEY])
@@ -0,0 +1,170 @@
+"""
+순위 확인 배치 실행 (명령줄)
+(키워드, 판매처) 목록 CSV를 읽어 네이버 쇼핑 순위를 확인하고 결과를 Parquet 파일로 저장합니다.
+Streamlit 없이 실행되므로 cron 등 예약 작업에서 사용할 수 있습니다.
+결과는 순위 기록 저장소(rank_history)에도 실행 1회당 파일 1개로 추가됩니다.
+
+사용법:
+    python rank_cli.py pairs.csv -o ranks.parquet --workers 4
+    python rank_cli.py pairs.csv --no-history   # 순위 기록에 추가하지 않음
+
+입력 CSV 형식 (첫 줄 헤더는 keyword,mall 또는 키워드,판매처):
+    keyword,mall
+    무선키보드,OO스토어
+    무선키보드,XX마켓
+"""
+
+import argparse
+import csv
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import pandas as pd
+
+import config
+import naver_api
+import rank_history
+import rank_scan
+from cache import shop_cache
+
+KEYWORD_HEADERS = {"keyword", "키워드", "검색어"}
+MALL_HEADERS = {"mall", "mall_name", "판매처", "판매처명"}
+
+
+def read_pairs(path: str) -> Dict[str, List[str]]:
+    """
+    CSV에서 (키워드, 판매처) 쌍을 읽어 키워드별 판매처 목록으로 묶음
+
+    같은 키워드의 판매처는 한 번의 검색으로 함께 확인하기 위해 묶습니다.
+    """
+    pairs: Dict[str, List[str]] = {}
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for line_num, row in enumerate(csv.reader(f), 1):
+            if len(row) < 2:
+                continue
+
+            keyword, mall_name = row[0].strip(), row[1].strip()
+            if line_num == 1 and keyword.lower() in KEYWORD_HEADERS and mall_name.lower() in MALL_HEADERS:
+                continue
+            if not keyword or not mall_name:
+                continue
+
+            malls = pairs.setdefault(keyword, [])
+            if mall_name not in malls:
+                malls.append(mall_name)
+
+    return pairs
+
+
+def scan_keyword(keyword: str, mall_names: List[str]) -> Dict:
+    """키워드 하나의 판매처별 순위 확인 (작업 스레드에서 실행)"""
+    stats = {}
+    began = time.perf_counter()
+    products = rank_scan.find_best_products_by_mall(keyword, mall_names, prefetch=config.RANK_SCAN_PREFETCH,
+                                                    stats=stats)
+    return {"products": products, "stats": stats, "elapsed": time.perf_counter() - began}
+
+
+def run(pairs: Dict[str, List[str]], workers: int) -> pd.DataFrame:
+    """모든 키워드를 제한된 동시 실행 수로 검색하고 결과 행 생성"""
+    rows = []
+    checked_at = datetime.now(timezone.utc)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(scan_keyword, keyword, malls): keyword for keyword, malls in pairs.items()}
+
+        for done, future in enumerate(as_completed(futures), 1):
+            keyword = futures[future]
+            try:
+                outcome = future.result()
+                error = None
+                products = outcome["products"]
+                detail = f"{outcome['stats'].get('fetched', 0)}페이지, {outcome['elapsed']:.1f}초"
+            except Exception as e:
+                error = str(e)
+                products = {mall_name: None for mall_name in pairs[keyword]}
+                detail = f"오류: {error}"
+
+            found = sum(1 for product in products.values() if product)
+            print(f"[{done}/{len(pairs)}] {keyword}: {found}/{len(products)} 판매처 발견 ({detail})",
+                  file=sys.stderr)
+
+            for mall_name, product in products.items():
+                rows.append({
+                    "checked_at": checked_at,
+                    "keyword": keyword,
+                    "mall": mall_name,
+                    "rank": product.rank if product else None,
+                    "title": product.title if product else None,
+                    "productId": product.product_id if product else None,
+                    "price": product.price if product else None,
+                    "mall_name": product.mall_name if product else None,
+                    "link": product.link if product else None,
+                    "error": error,
+                })
+
+    df = pd.DataFrame(rows, columns=["checked_at", "keyword", "mall", "rank", "title", "productId", "price",
+                                     "mall_name", "link", "error"])
+    df["rank"] = df["rank"].astype("Int64")
+    df["price"] = df["price"].astype("Int64")
+    return df
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="네이버 쇼핑 순위 배치 확인")
+    parser.add_argument("input", help="(키워드, 판매처) 목록 CSV 파일")
+    parser.add_argument("-o", "--output", default=None,
+                        help="결과 Parquet 파일 경로 (기본: ranks_YYYYMMDD_HHMMSS.parquet)")
+    parser.add_argument("-w", "--workers", type=int, default=config.RANK_KEYWORD_WORKERS,
+                        help=f"동시에 검색할 키워드 수 (기본: {config.RANK_KEYWORD_WORKERS})")
+    parser.add_argument("--no-history", action="store_true",
+                        help="결과를 순위 기록 저장소에 추가하지 않음")
+    args = parser.parse_args()
+
+    pairs = read_pairs(args.input)
+    if not pairs:
+        print("입력 파일에 (키워드, 판매처) 쌍이 없습니다.", file=sys.stderr)
+        return 1
+
+    output = args.output or datetime.now().strftime("ranks_%Y%m%d_%H%M%S.parquet")
+    pair_count = sum(len(malls) for malls in pairs.values())
+    print(f"키워드 {len(pairs)}개, (키워드, 판매처) 쌍 {pair_count}개 검색 시작 (동시 {args.workers}개)",
+          file=sys.stderr)
+
+    calls_before = naver_api.call_counts()["search"]
+    coalesced_before = naver_api.coalesced_counts()["search"]
+    cache_before = shop_cache.stats()
+    began = time.perf_counter()
+
+    df = run(pairs, args.workers)
+
+    elapsed = time.perf_counter() - began
+    api_calls = naver_api.call_counts()["search"] - calls_before
+    coalesced = naver_api.coalesced_counts()["search"] - coalesced_before
+    cache_after = shop_cache.stats()
+    cache_hits = (cache_after["memory_hits"] + cache_after["disk_hits"]
+                  - cache_before["memory_hits"] - cache_before["disk_hits"])
+
+    df.to_parquet(output, index=False)
+    if not args.no_history:
+        # 오류로 확인하지 못한 쌍은 순위 밖(None)으로 오인되지 않도록 제외
+        history_path = rank_history.append(df[df["error"].isna()])
+
+    found = int(df["rank"].notna().sum())
+    errors = int(df["error"].notna().sum())
+    print(f"완료: {elapsed:.1f}초, {len(pairs) / elapsed if elapsed else 0:.2f} 키워드/초", file=sys.stderr)
+    print(f"API 호출 {api_calls}회, 캐시 적중 {cache_hits}회, 중복 요청 합침 {coalesced}회, "
+          f"찾음 {found} / 못 찾음 {len(df) - found - errors} / 오류 {errors}", file=sys.stderr)
+    print(f"결과 저장: {output}", file=sys.stderr)
+    if not args.no_history and history_path:
+        print(f"순위 기록 추가: {history_path}", file=sys.stderr)
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+순위 기록 저장소
+순위 확인 결과를 날짜별 폴더에 Parquet 파일로 추가 저장하고,
+(키워드, 판매처)별 최신·직전 순위 요약을 따로 유지하여 순위 변화를 빠르게 조회합니다.
+
+저장 구조:
+    data/rank_history/date=2025-01-31/run-103015-1a2b3c4d.parquet  (실행 1회당 파일 1개)
+    data/rank_history/latest.parquet                                 (최신·직전 순위 요약)
+"""
+
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+import config
+import file_lock
+
+HISTORY_DIR = os.path.join(config.DATA_DIR, "rank_history")
+SNAPSHOT_PATH = os.path.join(HISTORY_DIR, "latest.parquet")
+
+HISTORY_COLUMNS = ["checked_at", "keyword", "mall", "rank", "productId", "price"]
+SNAPSHOT_COLUMNS = ["keyword", "mall", "rank", "productId", "price", "checked_at",
+                    "prev_rank", "prev_checked_at"]
+
+_lock = threading.Lock()
+_snapshot_cache: Dict[str, object] = {"mtime": None, "df": None}
+
+
+def _normalize(records) -> pd.DataFrame:
+    """기록 목록을 저장 스키마에 맞는 데이터프레임으로 변환"""
+    df = pd.DataFrame(records)
+    for column in HISTORY_COLUMNS:
+        if column not in df.columns:
+            df[column] = None
+
+    df = df[HISTORY_COLUMNS].copy()
+    df["checked_at"] = pd.to_datetime(df["checked_at"], utc=True)
+    df["keyword"] = df["keyword"].astype(str)
+    df["mall"] = df["mall"].astype(str)
+    df["rank"] = pd.to_numeric(df["rank"], errors="coerce").astype("Int64")
+    df["price"] = pd.to_numeric(df["price"], errors="coerce").astype("Int64")
+    df["productId"] = df["productId"].astype("string")
+    return df
+
+
+def make_record(checked_at: datetime, keyword: str, mall_name: str, product) -> Dict:
+    """순위 확인 결과(rank_scan.ProductRecord 또는 None)를 기록 항목으로 변환"""
+    return {
+        "checked_at": checked_at,
+        "keyword": keyword,
+        "mall": mall_name,
+        "rank": product.rank if product else None,
+        "productId": product.product_id if product else None,
+        "price": product.price if product else None,
+    }
+
+
+def _read_snapshot(force: bool = False) -> pd.DataFrame:
+    """최신·직전 순위 요약 읽기 (파일이 바뀌지 않았으면 메모리 사본 사용, force면 항상 파일에서)"""
+    try:
+        mtime = os.path.getmtime(SNAPSHOT_PATH)
+    except OSError:
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+
+    if force or _snapshot_cache["mtime"] != mtime:
+        _snapshot_cache["df"] = pd.read_parquet(SNAPSHOT_PATH)
+        _snapshot_cache["mtime"] = mtime
+    return _snapshot_cache["df"]
+
+
+def _update_snapshot(batch: pd.DataFrame):
+    """
+    새 기록으로 요약 갱신: 기존 최신 순위는 직전 순위로 이동
+
+    SNAPSHOT_PATH 파일 잠금 안에서 호출해야 합니다. 다른 프로세스(배치 CLI)가 방금 바꾼 요약을
+    수정 시각 해상도 때문에 놓치지 않도록 메모리 사본 대신 파일을 다시 읽습니다.
+    """
+    snapshot = _read_snapshot(force=True)
+    latest = batch.sort_values("checked_at").drop_duplicates(["keyword", "mall"], keep="last")
+
+    previous = snapshot[["keyword", "mall", "rank", "checked_at"]].rename(
+        columns={"rank": "prev_rank", "checked_at": "prev_checked_at"}
+    )
+    updated = latest.merge(previous, on=["keyword", "mall"], how="left")
+
+    batch_keys = pd.MultiIndex.from_frame(latest[["keyword", "mall"]])
+    unchanged = snapshot[~pd.MultiIndex.from_frame(snapshot[["keyword", "mall"]]).isin(batch_keys)]
+
+    frames = [frame for frame in (unchanged, updated[SNAPSHOT_COLUMNS]) if not frame.empty]
+    result = pd.concat(frames, ignore_index=True) if frames else updated[SNAPSHOT_COLUMNS]
+    result["rank"] = result["rank"].astype("Int64")
+    result["prev_rank"] = result["prev_rank"].astype("Int64")
+    result["prev_checked_at"] = pd.to_datetime(result["prev_checked_at"], utc=True)
+
+    tmp_path = f"{SNAPSHOT_PATH}.{os.getpid()}.tmp"
+    result.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, SNAPSHOT_PATH)
+
+    # 파일 수정 시각 해상도가 낮아도 방금 쓴 요약을 바로 사용하도록 메모리 사본 갱신
+    _snapshot_cache["df"] = result
+    _snapshot_cache["mtime"] = os.path.getmtime(SNAPSHOT_PATH)
+
+
+def append(records) -> Optional[str]:
+    """
+    순위 확인 결과를 한 번에 추가 저장
+
+    호출 1회당 Parquet 파일 1개를 쓰므로 배치 실행 결과는 모아서 한 번에 전달하세요.
+
+    Args:
+        records: checked_at, keyword, mall, rank, productId, price 필드를 가진
+                 딕셔너리 목록 또는 데이터프레임 (순위를 못 찾았으면 rank는 None)
+
+    Returns:
+        저장한 파일 경로 (기록이 없으면 None)
+    """
+    batch = _normalize(records)
+    if batch.empty:
+        return None
+
+    now = datetime.now(timezone.utc)
+    day_dir = os.path.join(HISTORY_DIR, f"date={now.strftime('%Y-%m-%d')}")
+    path = os.path.join(day_dir, f"run-{now.strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet")
+
+    # 요약은 읽기 -> 합치기 -> 바꾸기 사이에 다른 프로세스가 끼어들면 그 기록이 사라지므로 파일 잠금
+    with _lock, file_lock.locked(SNAPSHOT_PATH):
+        os.makedirs(day_dir, exist_ok=True)
+        batch.to_parquet(path, index=False)
+        _update_snapshot(batch)
+
+    return path
+
+
+def latest_ranks(pairs: Optional[List[Tuple[str, str]]] = None) -> pd.DataFrame:
+    """
+    (키워드, 판매처)별 최신 순위와 직전 순위 조회
+
+    기록 전체를 읽지 않고 요약 파일만 사용합니다.
+
+    Args:
+        pairs: 조회할 (키워드, 판매처) 목록, 없으면 전체
+
+    Returns:
+        SNAPSHOT_COLUMNS 컬럼의 데이터프레임
+    """
+    snapshot = _read_snapshot()
+    if pairs is None or snapshot.empty:
+        return snapshot
+
+    wanted = pd.MultiIndex.from_tuples(pairs, names=["keyword", "mall"])
+    return snapshot[pd.MultiIndex.from_frame(snapshot[["keyword", "mall"]]).isin(wanted)]
+
+
+def last_rank_lookup(pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[int]]:
+    """(키워드, 판매처)별 마지막으로 기록된 순위 (기록이 없는 쌍은 제외, 순위 밖이면 None)"""
+    df = latest_ranks(pairs)
+    return {
+        (row.keyword, row.mall): (None if pd.isna(row.rank) else int(row.rank))
+        for row in df.itertuples(index=False)
+    }
+
+
+def format_rank_change(previous: Optional[int], current: Optional[int], has_previous: bool = True) -> str:
+    """
+    순위 변화 표시 문자열 (순위 숫자가 작아지면 상승)
+
+    Returns:
+        "▲3", "▼2", "-", "NEW"(새로 진입), "OUT"(순위 밖으로 이탈), ""(이전 기록 없음)
+    """
+    if not has_previous:
+        return ""
+    if previous is None and current is None:
+        return "-"
+    if previous is None:
+        return "NEW"
+    if current is None:
+        return "OUT"
+    if current < previous:
+        return f"▲{previous - current}"
+    if current > previous:
+        return f"▼{current - previous}"
+    return "-"
@@ -0,0 +1,451 @@
+"""
+순위 검색 로직 (UI 없음)
+네이버 쇼핑 검색 결과 1~1000위를 조회하여 판매처의 최상위 상품을 찾습니다.
+
+순위는 start가 커질수록 낮아지므로 처음 찾은 상품이 곧 최상위 상품입니다.
+첫 페이지 응답의 total로 실제 존재하는 페이지만 계획하고, 상품을 찾으면
+나머지 페이지는 요청하지 않습니다.
+
+scan_* 제너레이터는 페이지를 처리할 때마다 중간 결과(ScanProgress)를 반환하므로
+화면에서는 검색이 끝나기 전에 진행 상황과 찾은 순위를 바로 표시할 수 있습니다.
+"""
+
+import queue
+import re
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import config
+import metrics
+import naver_api
+import tracing
+
+# 쇼핑 검색 API의 한 페이지 크기와 조회 가능한 최대 순위
+PAGE_SIZE = 100
+MAX_RANK = 1000
+
+# 프로세스 전체에서 동시에 진행할 수 있는 쇼핑 API 요청 수 상한
+_shop_request_slots = threading.BoundedSemaphore(config.RANK_MAX_INFLIGHT)
+
+
+def plan_pages(total: int, max_rank: int = MAX_RANK, page_size: int = PAGE_SIZE) -> List[int]:
+    """
+    검색 결과 수(total)를 넘지 않는 페이지 시작 위치 목록
+
+    Args:
+        total: 첫 페이지 응답의 전체 검색 결과 수
+        max_rank: 조회할 최대 순위
+        page_size: 페이지당 상품 수
+
+    Returns:
+        시작 위치 목록 (예: total=250 -> [1, 101, 201])
+    """
+    last = min(max(int(total), 1), max_rank)
+    return list(range(1, last + 1, page_size))
+
+
+def fetch_shop_page(keyword: str, start: int) -> Dict:
+    """
+    네이버 쇼핑 검색 결과 한 페이지(100개) 조회
+
+    Args:
+        keyword: 검색 키워드
+        start: 검색 시작 위치 (1, 101, 201, ...)
+
+    Returns:
+        API 응답 딕셔너리
+    """
+    # 동시 요청 수가 상한을 넘지 않도록 슬롯을 확보한 뒤 호출
+    with _shop_request_slots:
+        return naver_api.search_shop(keyword, display=PAGE_SIZE, start=start)
+
+
+def iter_pages(keyword: str, concurrent: bool = False, prefetch: bool = False,
+               on_page: Optional[Callable[[int, int], None]] = None,
+               stats: Optional[Dict] = None) -> Iterator[Tuple[int, Dict]]:
+    """
+    검색 결과 페이지를 순위 순서대로 반환하는 제너레이터
+
+    첫 페이지를 먼저 조회해 total로 남은 페이지를 계획합니다. 호출한 쪽에서
+    반복을 멈추면(break 또는 close) 아직 시작하지 않은 요청은 취소됩니다.
+
+    동시 조회(concurrent)는 첫 페이지를 기다리지 않고 1~1000위 페이지를 한꺼번에 요청한 뒤,
+    첫 페이지의 total을 넘는 페이지는 아직 시작하지 않았으면 취소하고 이미 받았으면 버립니다.
+    키워드당 대기 시간이 왕복 1회에 가까워지는 대신, 결과가 1000개 미만인 키워드는
+    total 밖의 페이지 요청만큼 일일 호출 수를 더 씁니다 (stats의 fetched에 포함).
+
+    Args:
+        keyword: 검색 키워드
+        concurrent: True이면 모든 페이지를 작업자 풀에서 한꺼번에 조회
+        prefetch: True이면 현재 페이지를 처리하는 동안 다음 페이지를 미리 조회
+        on_page: 페이지를 받을 때마다 (받은 페이지 수, 계획된 페이지 수)로 호출되는 콜백
+        stats: 전달하면 planned(계획), fetched(실제 API 요청) 페이지 수를 기록
+
+    Yields:
+        (시작 위치, API 응답 딕셔너리)
+    """
+    if stats is None:
+        stats = {}
+    if concurrent:
+        yield from _iter_pages_speculative(keyword, on_page, stats)
+        return
+
+    stats["planned"] = 1
+    stats["fetched"] = 1
+
+    first = fetch_shop_page(keyword, 1)
+    remaining = plan_pages(first.get("total", 0))[1:] if first.get("items") else []
+    stats["planned"] = 1 + len(remaining)
+
+    if on_page:
+        on_page(1, stats["planned"])
+    yield 1, first
+
+    if not remaining:
+        return
+
+    workers = 1 if prefetch else 0
+
+    if workers == 0:
+        for page_num, start in enumerate(remaining, 2):
+            stats["fetched"] += 1
+            page = fetch_shop_page(keyword, start)
+            if on_page:
+                on_page(page_num, stats["planned"])
+            yield start, page
+        return
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures: List[Future] = []
+    try:
+        # 한 페이지씩 앞서 요청
+        # 작업자 스레드의 API 호출 스팬이 현재 스팬(탭) 아래에 기록되도록 컨텍스트를 이어 줌
+        futures = [executor.submit(tracing.bind(fetch_shop_page), keyword, remaining[0])]
+
+        for index, start in enumerate(remaining):
+            page = futures[index].result()
+
+            next_index = index + 1
+            if next_index < len(remaining):
+                futures.append(executor.submit(tracing.bind(fetch_shop_page), keyword, remaining[next_index]))
+
+            if on_page:
+                on_page(index + 2, stats["planned"])
+            yield start, page
+    finally:
+        # 취소하지 못한(이미 전송된) 요청만 실제 API 호출로 집계
+        for future in futures:
+            if not future.cancel():
+                stats["fetched"] += 1
+        executor.shutdown(wait=False)
+
+
+def _iter_pages_speculative(keyword: str, on_page: Optional[Callable[[int, int], None]],
+                            stats: Dict) -> Iterator[Tuple[int, Dict]]:
+    """iter_pages의 동시 조회: total을 모르는 채로 모든 페이지를 요청하고 total 밖의 페이지는 버림"""
+    starts = plan_pages(MAX_RANK)
+    stats["planned"] = len(starts)
+    stats["fetched"] = 0
+
+    workers = max(1, min(config.RANK_SCAN_WORKERS, config.RANK_MAX_INFLIGHT, len(starts)))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures: List[Future] = []
+    try:
+        futures = [executor.submit(tracing.bind(fetch_shop_page), keyword, start) for start in starts]
+
+        first = futures[0].result()
+        planned = plan_pages(first.get("total", 0)) if first.get("items") else starts[:1]
+        stats["planned"] = len(planned)
+        for future in futures[len(planned):]:
+            future.cancel()
+
+        for index, start in enumerate(planned):
+            page = futures[index].result()
+            if on_page:
+                on_page(index + 1, stats["planned"])
+            yield start, page
+    finally:
+        # 취소하지 못한(이미 전송된) 요청만 실제 API 호출로 집계
+        for future in futures:
+            if not future.cancel():
+                stats["fetched"] += 1
+        executor.shutdown(wait=False)
+
+
+class ProductRecord:
+    """
+    순위 검색 결과 상품
+
+    상품마다 딕셔너리를 만들지 않도록 __slots__로 필드를 고정하고,
+    반복되는 판매처명은 sys.intern으로 공유하며 가격은 정수로 저장합니다.
+    """
+
+    __slots__ = ("rank", "title", "price", "link", "mall_name", "product_id")
+
+    def __init__(self, rank: int, title: str, price: Optional[int], link: str, mall_name: str,
+                 product_id: Optional[str]):
+        self.rank = rank
+        self.title = title
+        self.price = price
+        self.link = link
+        self.mall_name = mall_name
+        self.product_id = product_id
+
+    @classmethod
+    def from_item(cls, rank: int, item: Dict) -> "ProductRecord":
+        """API 상품 항목을 순위 결과로 변환 (태그 제거, 가격이 숫자가 아니면 None)"""
+        lprice = item.get("lprice") or ""
+        return cls(
+            rank,
+            re.sub(r"<.*?>", "", item.get("title", "")),
+            int(lprice) if lprice.isdigit() else None,
+            item.get("link", ""),
+            sys.intern(item.get("mallName", "")),
+            item.get("productId") or None,
+        )
+
+    def to_dict(self) -> Dict:
+        """API 필드명(mallName, productId)을 사용하는 딕셔너리로 변환"""
+        return {
+            "rank": self.rank,
+            "title": self.title,
+            "price": self.price,
+            "link": self.link,
+            "mallName": self.mall_name,
+            "productId": self.product_id,
+        }
+
+    def __repr__(self) -> str:
+        return f"ProductRecord(rank={self.rank}, mall_name={self.mall_name!r}, price={self.price})"
+
+
+class ScanProgress:
+    """
+    순위 검색 중간 결과 (페이지를 처리할 때마다 새로 만든 스냅샷)
+
+    Attributes:
+        pages_done: 처리한 페이지 수
+        pages_planned: 첫 페이지의 total로 계획한 페이지 수
+        pages_skipped: 상품을 찾아 요청하지 않은 페이지 수 (검색이 끝난 뒤에만 확정)
+        best: 지금까지 찾은 최상위 상품 (판매처 여러 개를 검색하면 {판매처명: 상품 또는 None})
+        finished: 검색 종료 여부
+    """
+
+    __slots__ = ("pages_done", "pages_planned", "pages_skipped", "best", "finished")
+
+    def __init__(self, pages_done: int, pages_planned: int, best, finished: bool = False,
+                 pages_skipped: int = 0):
+        self.pages_done = pages_done
+        self.pages_planned = pages_planned
+        self.pages_skipped = pages_skipped
+        self.best = best
+        self.finished = finished
+
+    def __repr__(self) -> str:
+        return (f"ScanProgress(pages={self.pages_done}/{self.pages_planned}, skipped={self.pages_skipped}, "
+                f"finished={self.finished})")
+
+
+def _finished(pages_done: int, stats: Dict, best) -> ScanProgress:
+    """검색 종료 결과 (요청하지 않은 페이지 수는 실제 API 요청 수 기준)"""
+    return ScanProgress(pages_done, stats["planned"], best, finished=True,
+                        pages_skipped=max(stats["planned"] - stats["fetched"], 0))
+
+
+def scan_best_product(keyword: str, mall_name: str, concurrent: bool = False, prefetch: bool = False,
+                      on_page: Optional[Callable[[int, int], None]] = None,
+                      stats: Optional[Dict] = None) -> Iterator[ScanProgress]:
+    """
+    판매처의 최상위 상품을 검색하며 페이지마다 중간 결과를 반환하는 제너레이터
+
+    상품을 찾으면 그 페이지를 처리한 즉시 마지막 결과(finished=True)를 반환하고
+    남은 페이지는 요청하지 않습니다.
+
+    Args:
+        keyword: 검색 키워드
+        mall_name: 판매처명 (상품 판매처명에 포함되면 일치)
+        concurrent: True이면 남은 페이지를 병렬로 조회
+        prefetch: True이면 다음 페이지를 미리 조회
+        on_page: 페이지 조회 진행 시 (받은 페이지 수, 계획된 페이지 수)로 호출되는 콜백
+        stats: 전달하면 planned, fetched 페이지 수를 기록
+
+    Yields:
+        ScanProgress (best는 최상위 상품 또는 None, API 오류는 예외로 전달)
+    """
+    if stats is None:
+        stats = {}
+    pages = iter_pages(keyword, concurrent=concurrent, prefetch=prefetch, on_page=on_page, stats=stats)
+    pages_done = 0
+    best = None
+
+    try:
+        for start, result in pages:
+            pages_done += 1
+            with metrics.stage("rank.match"):
+                tracing.annotate(keyword=keyword, start=start)
+                for idx, item in enumerate(result.get("items", []), start=1):
+                    if item.get("mallName") and mall_name in item["mallName"]:
+                        # 순위 순서대로 확인하므로 처음 찾은 상품이 최상위
+                        best = ProductRecord.from_item(start + idx - 1, item)
+                        break
+            if best is not None:
+                break
+            yield ScanProgress(pages_done, stats["planned"], None)
+    finally:
+        pages.close()
+
+    yield _finished(pages_done, stats, best)
+
+
+def find_best_product(keyword: str, mall_name: str, concurrent: bool = False,
+                      on_page: Optional[Callable[[int, int], None]] = None,
+                      prefetch: bool = False, stats: Optional[Dict] = None) -> Optional[ProductRecord]:
+    """
+    키워드 검색 결과 1~1000위에서 판매처의 최상위 상품 검색
+
+    Args:
+        keyword: 검색 키워드
+        mall_name: 판매처명 (상품 판매처명에 포함되면 일치)
+        concurrent: True이면 남은 페이지를 병렬로 조회
+        on_page: 페이지 조회 진행 시 (받은 페이지 수, 계획된 페이지 수)로 호출되는 콜백
+        prefetch: True이면 다음 페이지를 미리 조회
+        stats: 전달하면 planned, fetched 페이지 수를 기록
+
+    Returns:
+        최상위 순위 상품 또는 None (API 오류는 예외로 전달)
+    """
+    progress = None
+    for progress in scan_best_product(keyword, mall_name, concurrent=concurrent, prefetch=prefetch,
+                                      on_page=on_page, stats=stats):
+        pass
+    return progress.best
+
+
+def index_new_malls(start: int, items: List[Dict], seen_malls: set) -> Dict[str, Tuple[int, Dict]]:
+    """
+    페이지에 처음 등장한 판매처명별 최상위 상품 색인
+
+    Args:
+        start: 페이지 시작 위치
+        items: 페이지 상품 목록
+        seen_malls: 이전 페이지까지 등장한 판매처명 (이 함수가 갱신함)
+
+    Returns:
+        {판매처명: (순위, 상품 항목)} (순위 순서)
+    """
+    new_malls = {}
+    for idx, item in enumerate(items, start=1):
+        name = item.get("mallName")
+        if name and name not in seen_malls and name not in new_malls:
+            new_malls[name] = (start + idx - 1, item)
+
+    seen_malls.update(new_malls)
+    return new_malls
+
+
+def scan_best_products_by_mall(keyword: str, mall_names: List[str], concurrent: bool = False,
+                               prefetch: bool = False,
+                               on_page: Optional[Callable[[int, int], None]] = None,
+                               stats: Optional[Dict] = None) -> Iterator[ScanProgress]:
+    """
+    검색 결과를 한 번만 조회하여 여러 판매처의 최상위 상품을 검색하며 페이지마다 중간 결과를 반환
+
+    상품마다 모든 판매처명을 비교하지 않고, 페이지마다 새로 등장한 판매처명만
+    색인해 비교합니다. 모든 판매처를 찾으면 남은 페이지는 조회하지 않습니다.
+
+    Args:
+        keyword: 검색 키워드
+        mall_names: 판매처명 목록 (상품 판매처명에 포함되면 일치)
+
+    Yields:
+        ScanProgress (best는 지금까지 찾은 {판매처명: 최상위 순위 상품 또는 None}의 사본)
+    """
+    if stats is None:
+        stats = {}
+    best = {mall_name: None for mall_name in mall_names}
+    unresolved = list(best)
+    seen_malls = set()
+    pages_done = 0
+
+    pages = iter_pages(keyword, concurrent=concurrent, prefetch=prefetch, on_page=on_page, stats=stats)
+
+    try:
+        for start, result in pages:
+            pages_done += 1
+            with metrics.stage("rank.match"):
+                tracing.annotate(keyword=keyword, start=start)
+                new_malls = index_new_malls(start, result.get("items", []), seen_malls)
+
+                for name, (rank, item) in new_malls.items():
+                    matched = [mall_name for mall_name in unresolved if mall_name in name]
+                    for mall_name in matched:
+                        best[mall_name] = ProductRecord.from_item(rank, item)
+                        unresolved.remove(mall_name)
+
+            if not unresolved:
+                break
+            yield ScanProgress(pages_done, stats["planned"], dict(best))
+    finally:
+        pages.close()
+
+    yield _finished(pages_done, stats, best)
+
+
+def find_best_products_by_mall(keyword: str, mall_names: List[str], concurrent: bool = False,
+                               on_page: Optional[Callable[[int, int], None]] = None,
+                               prefetch: bool = False,
+                               stats: Optional[Dict] = None) -> Dict[str, Optional[ProductRecord]]:
+    """
+    검색 결과를 한 번만 조회하여 여러 판매처의 최상위 상품을 동시에 검색
+
+    Args:
+        keyword: 검색 키워드
+        mall_names: 판매처명 목록 (상품 판매처명에 포함되면 일치)
+
+    Returns:
+        {판매처명: 최상위 순위 상품 또는 None}
+    """
+    progress = None
+    for progress in scan_best_products_by_mall(keyword, mall_names, concurrent=concurrent, prefetch=prefetch,
+                                               on_page=on_page, stats=stats):
+        pass
+    return progress.best
+
+
+def stream_scans(scans: Dict[Hashable, Callable[[], Iterator[ScanProgress]]],
+                 workers: int) -> Iterator[Tuple[Hashable, Optional[ScanProgress], Optional[Exception]]]:
+    """
+    여러 검색을 작업자 스레드에서 실행하고 중간 결과를 도착 순서대로 반환
+
+    작업자 스레드는 결과를 큐에 넣기만 하므로, 화면 갱신은 이 제너레이터를
+    반복하는 호출 스레드에서 처리할 수 있습니다.
+
+    Args:
+        scans: {키: 인자 없이 호출하면 scan_* 제너레이터를 반환하는 함수}
+        workers: 동시에 실행할 검색 수
+
+    Yields:
+        (키, ScanProgress, None) 또는 검색이 실패하면 (키, None, 예외)
+        키마다 마지막 항목은 finished=True인 결과 또는 예외
+    """
+    events: "queue.Queue" = queue.Queue()
+
+    def run(key, scan):
+        try:
+            for progress in scan():
+                events.put((key, progress, None))
+        except Exception as e:
+            events.put((key, None, e))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(scans) or 1))) as executor:
+        for key, scan in scans.items():
+            executor.submit(tracing.bind(run), key, scan)
+
+        remaining = len(scans)
+        while remaining:
+            key, progress, error = events.get()
+            if error is not None or progress.finished:
+                remaining -= 1
+            yield key, progress, error
@@ -0,0 +1,228 @@
+"""
+API 호출 속도 제한 및 일일 한도 관리
+토큰 버킷으로 초당 호출 수를 제한하고, 인증 정보별 일일 호출 수를
+디스크에 기록하여 앱을 재시작해도 남은 한도를 유지합니다.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+import config
+import file_lock
+
+# 네이버 API 일일 한도는 한국 시간 자정에 초기화됨
+KST = timezone(timedelta(hours=9))
+
+# 기록 파일에 남겨둘 최근 일수
+LEDGER_KEEP_DAYS = 7
+
+
+class QuotaExceededError(Exception):
+    """일일 호출 한도를 모두 사용했을 때 발생하는 예외"""
+
+
+class TokenBucket:
+    """초당 rate개의 토큰을 채우는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        토큰을 얻을 때까지 대기
+
+        Args:
+            tokens: 필요한 토큰 수
+            timeout: 최대 대기 시간(초), None이면 무제한 대기
+
+        Returns:
+            토큰을 얻었으면 True, 시간 초과면 False
+        """
+        if self.rate <= 0:
+            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class DailyLedger:
+    """
+    인증 정보별 일일 호출 수 기록
+
+    호출할 때마다 파일을 쓰지 않고 메모리에 쌓아 두었다가 flush_interval초마다
+    디스크 값에 더해 저장합니다. 여러 프로세스(Streamlit 앱, 배치 CLI)가 같은
+    파일을 써도 파일 잠금 안에서 읽고 증가분만 더해 쓰므로 호출 수가 덮어써지지 않습니다.
+    (다른 프로세스의 호출 수는 저장할 때마다 다시 읽어 반영)
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._counts = self._load()
+        self._pending: Dict[str, Dict[str, int]] = {}
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def today() -> str:
+        return datetime.now(KST).strftime("%Y-%m-%d")
+
+    def _load(self) -> Dict[str, Dict[str, int]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def used(self, key: str) -> int:
+        """오늘 사용한 호출 수"""
+        day = self.today()
+        with self._lock:
+            return self._counts.get(day, {}).get(key, 0) + self._pending.get(day, {}).get(key, 0)
+
+    def record(self, key: str, count: int = 1):
+        """호출 수 기록 (음수면 기록 취소)"""
+        day = self.today()
+        with self._lock:
+            self._add_locked(day, key, count)
+
+    def reserve(self, key: str, limit: int) -> bool:
+        """
+        오늘 사용한 호출 수가 limit 미만이면 1회를 기록 (확인과 기록을 한 잠금 안에서 처리)
+
+        Args:
+            limit: 일일 한도 (0 이하면 한도 없음)
+
+        Returns:
+            기록했으면 True, 한도를 모두 사용했으면 False
+        """
+        day = self.today()
+        with self._lock:
+            used = self._counts.get(day, {}).get(key, 0) + self._pending.get(day, {}).get(key, 0)
+            if 0 < limit <= used:
+                return False
+            self._add_locked(day, key, 1)
+            return True
+
+    def _add_locked(self, day: str, key: str, count: int):
+        day_pending = self._pending.setdefault(day, {})
+        day_pending[key] = day_pending.get(key, 0) + count
+
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush_locked()
+
+    def flush(self):
+        """쌓인 호출 수를 디스크에 저장"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+
+        # 읽기부터 바꾸기까지 다른 프로세스가 끼어들면 그 프로세스의 증가분이 사라지므로 파일 잠금
+        with file_lock.locked(self.path):
+            counts = self._load()
+            for day, day_pending in self._pending.items():
+                day_counts = counts.setdefault(day, {})
+                for key, count in day_pending.items():
+                    day_counts[key] = day_counts.get(key, 0) + count
+
+            # 오래된 날짜 정리
+            for day in sorted(counts)[:-LEDGER_KEEP_DAYS]:
+                del counts[day]
+
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(counts, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+        self._counts = counts
+        self._pending = {}
+
+
+class ApiLimiter:
+    """API 종류별 속도 제한과 일일 한도를 함께 적용"""
+
+    def __init__(self, name: str, rate_per_sec: float, daily_quota: int, ledger: DailyLedger):
+        self.name = name
+        self.daily_quota = daily_quota
+        self.ledger = ledger
+        self.bucket = TokenBucket(rate_per_sec)
+
+    def _key(self, credential: str) -> str:
+        # 인증 정보 원문 대신 해시를 기록
+        digest = hashlib.sha256(credential.encode("utf-8")).hexdigest()[:12]
+        return f"{self.name}:{digest}"
+
+    def remaining(self, credential: str) -> Optional[int]:
+        """오늘 남은 호출 수 (한도가 없으면 None)"""
+        if self.daily_quota <= 0:
+            return None
+        return max(0, self.daily_quota - self.ledger.used(self._key(credential)))
+
+    def acquire(self, credential: str, timeout: Optional[float] = None):
+        """
+        남은 한도 확인과 호출 수 기록을 한 번에 처리한 뒤 호출 토큰 획득 (필요하면 대기)
+        (여러 스레드가 동시에 마지막 1회를 확인하고 함께 호출하지 않도록)
+
+        Raises:
+            QuotaExceededError: 일일 한도를 모두 사용했거나 대기 시간이 초과된 경우
+        """
+        key = self._key(credential)
+        if not self.ledger.reserve(key, self.daily_quota):
+            raise QuotaExceededError(
+                f"오늘의 {self.name} API 호출 한도({self.daily_quota:,}회)를 모두 사용했습니다."
+            )
+
+        if not self.bucket.acquire(timeout=timeout):
+            # 호출하지 않으므로 기록한 1회를 되돌림
+            self.ledger.record(key, -1)
+            raise QuotaExceededError(f"{self.name} API 호출 대기 시간이 초과되었습니다.")
+
+
+_ledger = DailyLedger(os.path.join(config.DATA_DIR, "api_ledger.json"))
+atexit.register(_ledger.flush)
+
+# 프로세스 전체에서 공유하는 API별 제한기
+LIMITERS = {
+    "search": ApiLimiter("search", config.SEARCH_API_RATE_PER_SEC, config.SEARCH_API_DAILY_QUOTA, _ledger),
+    "searchad": ApiLimiter("searchad", config.SEARCHAD_API_RATE_PER_SEC, config.SEARCHAD_API_DAILY_QUOTA, _ledger),
+}
+
+
+def acquire(api: str, credential: str, timeout: Optional[float] = None):
+    """API 호출 전 토큰 획득 (search: 쇼핑 검색 API, searchad: 검색광고 API)"""
+    LIMITERS[api].acquire(credential, timeout=timeout)
+
+
+def remaining_quota(api: str, credential: str) -> Optional[int]:
+    """오늘 남은 호출 수 (한도가 없으면 None)"""
+    return LIMITERS[api].remaining(credential)
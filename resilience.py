@@ -0,0 +1,232 @@
+"""
+API 호출 재시도 및 회로 차단기
+일시적인 오류(429, 5xx, 연결·타임아웃 오류)는 지수 백오프와 지터로 다시 시도하고,
+응답의 Retry-After가 있으면 그 시간만큼 기다립니다.
+
+API(엔드포인트)별 회로 차단기는 연속 실패가 기준을 넘으면 일정 시간 동안 요청을
+보내지 않고 바로 CircuitOpenError를 발생시켜, 장애 중인 API를 계속 호출하지 않습니다.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, TypeVar
+
+import urllib3
+
+import config
+
+T = TypeVar("T")
+
+# 다시 시도할 HTTP 상태 코드 (요청 과다, 서버 오류)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """회로 차단기가 열려 있어 요청을 보내지 않았을 때 발생하는 예외"""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f"{endpoint} API 오류가 계속되어 {retry_in:.0f}초 동안 호출을 중단합니다.")
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Retry-After 헤더 값을 대기 시간(초)으로 변환
+
+    Args:
+        value: 초 단위 숫자 또는 HTTP 날짜 문자열
+
+    Returns:
+        대기 시간(초, 0 이상) 또는 None (값이 없거나 해석할 수 없음)
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+def is_retryable(error: Exception) -> bool:
+    """다시 시도하면 성공할 수 있는 오류인지 확인 (상태 코드가 있으면 RETRYABLE_STATUSES 기준)"""
+    status = getattr(error, "status", None)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    return isinstance(error, (urllib3.exceptions.HTTPError, ConnectionError, TimeoutError))
+
+
+class RetryPolicy:
+    """지수 백오프(전체 지터) 재시도 정책"""
+
+    def __init__(self, retries: int = config.RETRY_ATTEMPTS, base_delay: float = config.RETRY_BASE_DELAY,
+                 max_delay: float = config.RETRY_MAX_DELAY, max_retry_after: float = config.RETRY_AFTER_MAX):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        attempt번째 재시도 전 대기 시간(초)
+
+        Retry-After가 있으면 그 시간을 따르고, 없으면 0~min(max_delay, base_delay*2^attempt)
+        사이의 임의 시간(여러 스레드가 동시에 다시 요청하지 않도록)을 사용합니다.
+
+        Returns:
+            대기 시간 또는 None (Retry-After가 max_retry_after보다 길어 다시 시도하지 않음)
+        """
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 회로 차단기 (스레드 안전)
+
+    닫힘: 요청 허용 / 열림: reset_timeout초 동안 요청 차단 /
+    반열림: 시험 요청 1개만 허용하고, 성공하면 닫힘, 실패하면 다시 열림
+    """
+
+    def __init__(self, name: str, failure_threshold: int = config.CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = config.CIRCUIT_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """failure_threshold가 0 이하이면 사용 안 함"""
+        return self.failure_threshold > 0
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (closed, open, half_open), 사용하지 않는 차단기는 항상 closed"""
+        if not self.enabled:
+            return "closed"
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return "open"
+            return "half_open"
+
+    def before_call(self):
+        """
+        요청 전 확인 (차단 중이면 예외)
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 반열림 상태에서 다른 시험 요청이 진행 중인 경우
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if self._opened_at is None:
+                return
+
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.reset_timeout or self._trial_running:
+                raise CircuitOpenError(self.name, max(self.reset_timeout - elapsed, 0.0))
+            self._trial_running = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def release(self):
+        """요청을 보내지 못한 경우(로컬 오류) 실패 집계 없이 시험 요청 자리만 반환"""
+        with self._lock:
+            self._trial_running = False
+
+    def reset(self):
+        """상태 초기화 (닫힘)"""
+        self.record_success()
+
+
+# 프로세스 전체에서 공유하는 API별 회로 차단기 (rate_limit.LIMITERS와 같은 이름)
+BREAKERS: Dict[str, CircuitBreaker] = {
+    "search": CircuitBreaker("search"),
+    "searchad": CircuitBreaker("searchad"),
+}
+
+DEFAULT_POLICY = RetryPolicy()
+
+
+def call(endpoint: str, func: Callable[[], T], policy: Optional[RetryPolicy] = None,
+         sleep: Callable[[float], None] = time.sleep) -> T:
+    """
+    회로 차단기와 재시도 정책을 적용하여 func 호출
+
+    func는 요청 1회를 보내는 함수로, 재시도할 때마다 다시 호출되므로 속도 제한 토큰 획득과
+    인증 헤더(서명 타임스탬프) 생성도 func 안에서 처리해야 합니다.
+
+    Args:
+        endpoint: 회로 차단기 이름 (search, searchad)
+        func: 요청 함수 (실패 시 예외 발생, 상태 코드는 예외의 status 속성)
+        policy: 재시도 정책 (없으면 설정값 기준 기본 정책)
+
+    Returns:
+        func의 반환값
+
+    Raises:
+        CircuitOpenError: 회로가 열려 있는 경우
+        func의 예외: 다시 시도할 수 없는 오류이거나 재시도를 모두 사용한 경우
+    """
+    policy = policy or DEFAULT_POLICY
+    breaker = BREAKERS[endpoint]
+    attempt = 0
+
+    while True:
+        breaker.before_call()
+        try:
+            result = func()
+        except Exception as e:
+            if not is_retryable(e):
+                if getattr(e, "status", None) is not None:
+                    # 4xx 등은 API가 정상적으로 응답한 것이므로 장애로 집계하지 않음
+                    breaker.record_success()
+                else:
+                    # 호출 한도 초과 등 요청 전 로컬 오류
+                    breaker.release()
+                raise
+
+            breaker.record_failure()
+            wait = policy.delay(attempt, getattr(e, "retry_after", None)) if attempt < policy.retries else None
+            if wait is None or breaker.state == "open":
+                # 재시도를 모두 썼거나 이번 실패로 회로가 열리면 실제 오류를 그대로 전달
+                raise
+
+            sleep(wait)
+            attempt += 1
+            continue
+
+        breaker.record_success()
+        return result
@@ -0,0 +1,83 @@
+"""
+세션 결과 저장소
+조회한 결과 데이터프레임을 세션(st.session_state)에 조회어별로 보관합니다.
+
+필터·정렬·페이지 위젯을 바꾸면 스크립트가 다시 실행되면서 조회 버튼 값이 False가 되므로,
+결과를 여기에 두고 다시 그리면 API를 다시 호출하지 않고 같은 결과를 계속 사용할 수 있습니다.
+새로 조회하려면 새로고침(refresh)으로 명시적으로 다시 가져옵니다.
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import pandas as pd
+import streamlit as st
+
+STATE_KEY = "result_store"
+
+# 탭(저장소 이름)별로 보관할 최대 조회어 수 (오래된 것부터 삭제)
+MAX_QUERIES = 5
+
+
+def _namespace(name: str) -> Dict:
+    """저장소 이름별 공간 ({"active": 조회어, "entries": OrderedDict})"""
+    store = st.session_state.setdefault(STATE_KEY, {})
+    return store.setdefault(name, {"active": None, "entries": OrderedDict()})
+
+
+def get(name: str, query: str) -> Optional[Dict]:
+    """
+    저장된 결과를 조회하고 현재 결과로 선택
+
+    Returns:
+        {"query", "frame", "fetched_at"} 또는 None (저장된 결과 없음)
+    """
+    space = _namespace(name)
+    entry = space["entries"].get(query)
+    if entry is not None:
+        space["entries"].move_to_end(query)
+        space["active"] = query
+    return entry
+
+
+def put(name: str, query: str, frame: pd.DataFrame) -> Dict:
+    """조회 결과를 저장하고 현재 결과로 선택"""
+    space = _namespace(name)
+    entry = {"query": query, "frame": frame, "fetched_at": datetime.now(timezone.utc)}
+    space["entries"][query] = entry
+    space["entries"].move_to_end(query)
+    space["active"] = query
+
+    while len(space["entries"]) > MAX_QUERIES:
+        space["entries"].popitem(last=False)
+    return entry
+
+
+def current(name: str) -> Optional[Dict]:
+    """마지막으로 조회(선택)한 결과"""
+    space = _namespace(name)
+    if space["active"] is None:
+        return None
+    return space["entries"].get(space["active"])
+
+
+def clear(name: Optional[str] = None):
+    """저장된 결과 삭제 (이름이 없으면 전체)"""
+    store = st.session_state.get(STATE_KEY, {})
+    if name is None:
+        store.clear()
+    else:
+        store.pop(name, None)
+
+
+def age_text(fetched_at: datetime, now: Optional[datetime] = None) -> str:
+    """조회 후 지난 시간 표시 문자열 ("방금 전", "5분 전", "2시간 전")"""
+    seconds = int(((now or datetime.now(timezone.utc)) - fetched_at).total_seconds())
+    if seconds < 60:
+        return "방금 전"
+    if seconds < 3600:
+        return f"{seconds // 60}분 전"
+    if seconds < 86400:
+        return f"{seconds // 3600}시간 전"
+    return f"{seconds // 86400}일 전"
@@ -0,0 +1,82 @@
+"""
+동일 요청 합치기 (single-flight)
+같은 요청이 이미 진행 중이면 새로 보내지 않고 진행 중인 요청의 결과를 함께 기다립니다.
+
+여러 Streamlit 세션(스크립트 스레드)이 같은 인기 키워드를 동시에 조회하면
+캐시에 결과가 저장되기 전이라 똑같은 API 요청이 여러 번 나가는데,
+먼저 시작한 호출(리더) 하나만 API를 호출하고 나머지는 그 결과나 예외를 그대로 받습니다.
+결과 객체는 모든 호출자가 공유하므로 호출한 쪽에서 수정하면 안 됩니다.
+"""
+
+import threading
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """진행 중인 요청 1개 (리더가 끝나면 event 설정)"""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """키별 진행 중 요청 합치기 (스레드 안전)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        key에 해당하는 요청이 진행 중이면 그 결과를 기다리고, 없으면 func 호출
+
+        Args:
+            key: 요청을 구분하는 키 (같은 키는 같은 결과를 돌려주는 요청이어야 함)
+            func: 실제 요청 함수
+
+        Returns:
+            func의 반환값 (합쳐진 호출은 리더와 같은 객체)
+
+        Raises:
+            func의 예외: 합쳐진 호출도 리더와 같은 예외를 받음
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["calls"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # 결과를 채운 뒤 키를 지워야 이후 호출이 끝난 요청을 기다리지 않음
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """실제 호출(리더) 수와 진행 중인 요청에 합쳐진 호출 수"""
+        with self._lock:
+            return dict(self._stats)
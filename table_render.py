@@ -0,0 +1,101 @@
+"""
+HTML 표 렌더링
+데이터프레임 컬럼 단위로 셀 HTML을 만들고 마지막에 한 번만 이어 붙입니다.
+
+행마다 f-string을 만들어 문자열에 더하던 방식(iterrows + +=)은 행 수가 늘수록
+느려지므로, 컬럼 전체를 Arrow 문자열 연산으로 이스케이프하고 태그로 감쌉니다.
+CSS 클래스와 표 머리글은 호출하는 쪽의 기존 HTML을 그대로 사용합니다.
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import metrics
+import tracing
+
+# HTML 특수 문자 치환 (& 를 가장 먼저 치환해야 이중 이스케이프되지 않음)
+_ESCAPES = [("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;")]
+
+ColumnValues = Union[pd.Series, Sequence, pa.Array]
+
+
+def _to_strings(values: ColumnValues) -> pa.Array:
+    """컬럼 값을 Arrow 문자열 배열로 변환 (결측값은 빈 문자열)"""
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        array = values
+    else:
+        array = pa.array(pd.Series(values, copy=False).astype("string[pyarrow]"))
+
+    if array.type != pa.string():
+        array = pc.cast(array, pa.string())
+    return pc.fill_null(array, "")
+
+
+def escape_html(values: ColumnValues) -> pa.Array:
+    """컬럼 전체의 HTML 특수 문자 이스케이프"""
+    array = _to_strings(values)
+    for char, entity in _ESCAPES:
+        array = pc.replace_substring(array, char, entity)
+    return array
+
+
+def elements(values: ColumnValues, tag: str = "td", css_class: Optional[Union[str, ColumnValues]] = None,
+             style: Optional[str] = None, escape: bool = True) -> pa.Array:
+    """
+    컬럼 값을 HTML 요소로 감싼 배열 생성
+
+    Args:
+        values: 셀 내용
+        tag: 태그 이름 (td, span 등)
+        css_class: 모든 행에 같은 클래스(문자열) 또는 행별 클래스 컬럼
+        style: 모든 행에 적용할 style 속성
+        escape: False이면 values를 이미 만든 HTML로 간주하여 이스케이프하지 않음
+
+    Returns:
+        행별 "<tag ...>내용</tag>" 문자열 배열
+    """
+    text = escape_html(values) if escape else _to_strings(values)
+    style_attr = f' style="{style}"' if style else ""
+
+    if css_class is None:
+        open_tag = f"<{tag}{style_attr}>"
+    elif isinstance(css_class, str):
+        open_tag = f'<{tag} class="{css_class}"{style_attr}>'
+    else:
+        open_tag = pc.binary_join_element_wise(f'<{tag} class="', escape_html(css_class), f'"{style_attr}>', "")
+
+    return pc.binary_join_element_wise(open_tag, text, f"</{tag}>", "")
+
+
+def links(urls: ColumnValues, label: str, css_class: Optional[str] = None) -> pa.Array:
+    """URL 컬럼을 새 창으로 여는 링크(<a>) 배열로 변환"""
+    class_attr = f' class="{css_class}"' if css_class else ""
+    return pc.binary_join_element_wise('<a href="', escape_html(urls),
+                                       f'" target="_blank"{class_attr}>{label}</a>', "")
+
+
+@metrics.timed("render.table")
+def render_rows(cells: List[pa.Array]) -> str:
+    """
+    셀 배열들을 행(<tr>)으로 묶어 하나의 HTML 문자열로 연결
+
+    Args:
+        cells: elements()로 만든 컬럼별 셀 배열 (길이가 모두 같아야 함)
+    """
+    if not cells or len(cells[0]) == 0:
+        return ""
+
+    tracing.annotate(rows=len(cells[0]))
+    rows = pc.binary_join_element_wise("<tr>", *cells, "</tr>", "")
+    # 모든 행을 리스트 하나로 묶어 Arrow 안에서 한 번에 연결
+    table = pa.ListArray.from_arrays(pa.array([0, len(rows)], pa.int32()), rows)
+    return pc.binary_join(table, "\n")[0].as_py()
+
+
+def format_number(values: ColumnValues, suffix: str = "", missing: str = "-") -> pa.Array:
+    """정수 컬럼을 천 단위 구분 기호가 있는 문자열 배열로 변환 (결측값은 missing)"""
+    numbers = pd.Series(values, copy=False).astype("Int64").tolist()
+    return pa.array([missing if number is pd.NA else f"{number:,}{suffix}" for number in numbers], pa.string())
@@ -0,0 +1,165 @@
+"""
+재실행(rerun) 단위 스팬 추적
+Streamlit은 상호작용마다 스크립트 전체를 다시 실행하므로, 재실행 1회를 루트 스팬으로 두고
+탭 → API 호출(fetch) → 파싱 → 렌더링 단계를 중첩된 스팬으로 기록합니다.
+
+스팬은 끝날 때 JSON 한 줄로 로컬 파일(config.TRACE_FILE)에 추가되며, 파일이
+config.TRACE_MAX_BYTES를 넘으면 .1, .2, ... 로 돌려 씁니다.
+metrics.api_call()/stage()로 계측한 구간은 자동으로 스팬이 되고,
+annotate()로 현재 스팬에 키워드, 시작 위치, 항목 수 같은 속성을 붙입니다.
+
+NAVER_TRACE=1일 때만 기록하며, 꺼져 있으면 span()은 아무 일도 하지 않는 공용 객체를 반환합니다.
+
+기록 형식 (한 줄에 스팬 1개):
+    {"trace": 재실행 ID, "span": 스팬 ID, "parent": 상위 스팬 ID, "name": 이름,
+     "start": 시작 시각(epoch 초), "ms": 소요 시간, "attrs": {...}, "error": 예외 이름 또는 null}
+"""
+
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+import config
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("tracing_span", default=None)
+
+_logger: Optional[logging.Logger] = None
+_logger_lock = threading.Lock()
+
+
+def _get_logger() -> logging.Logger:
+    """스팬 기록용 로거 (처음 사용할 때 순환 파일 핸들러 연결)"""
+    global _logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                os.makedirs(os.path.dirname(config.TRACE_FILE) or ".", exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    config.TRACE_FILE, maxBytes=config.TRACE_MAX_BYTES,
+                    backupCount=config.TRACE_BACKUPS, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                logger = logging.getLogger("naver.trace")
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+                logger.addHandler(handler)
+                _logger = logger
+    return _logger
+
+
+class Span:
+    """기록 중인 스팬 1개 (with 문으로 사용)"""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "attrs", "_start", "_began", "_token")
+
+    def __init__(self, name: str, attrs: Dict):
+        parent = _current_span.get()
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex[:16]
+        self.span_id = uuid.uuid4().hex[:8]
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.attrs = attrs
+        self._start = 0.0
+        self._began = 0.0
+        self._token = None
+
+    def set(self, **attrs):
+        """속성 추가"""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self._start = time.time()
+        self._began = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        elapsed = time.perf_counter() - self._began
+        _current_span.reset(self._token)
+        # st.rerun(), st.stop()은 BaseException으로 흐름을 바꾸는 것이므로 오류로 보지 않음
+        error = exc_type.__name__ if exc_type is not None and issubclass(exc_type, Exception) else None
+        try:
+            _get_logger().info(json.dumps({
+                "trace": self.trace_id,
+                "span": self.span_id,
+                "parent": self.parent_id,
+                "name": self.name,
+                "start": round(self._start, 6),
+                "ms": round(elapsed * 1000, 3),
+                "attrs": self.attrs,
+                "error": error,
+            }, ensure_ascii=False, default=str))
+        except Exception:
+            # 추적 기록 실패가 화면 처리를 막지 않도록 무시
+            pass
+        return False
+
+
+class _NoopSpan:
+    """추적이 꺼져 있을 때 사용하는 공용 스팬"""
+
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name: str, **attrs):
+    """
+    스팬 생성 (with 문으로 사용, 현재 스팬이 있으면 그 하위 스팬)
+
+    Args:
+        name: 스팬 이름 (예: rerun, tab.rank, search/shop.json)
+        **attrs: 스팬 속성 (JSON으로 바꿀 수 있는 값)
+    """
+    if not config.TRACE_ENABLED:
+        return _NOOP
+    return Span(name, attrs)
+
+
+def annotate(**attrs):
+    """현재 스팬에 속성 추가 (스팬이 없거나 추적이 꺼져 있으면 무시)"""
+    current = _current_span.get()
+    if current is not None:
+        current.attrs.update(attrs)
+
+
+def bind(func: Callable) -> Callable:
+    """
+    현재 스팬을 작업자 스레드로 이어 주는 래퍼 (executor.submit(tracing.bind(func), ...))
+
+    스레드 풀의 작업은 제출한 스레드의 컨텍스트를 물려받지 않으므로,
+    제출 시점의 컨텍스트에서 func를 실행해 API 호출 스팬이 상위 스팬 아래에 기록되게 합니다.
+    """
+    if _current_span.get() is None:
+        return func
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(func, *args, **kwargs)
+
+
+def rerun(page: str):
+    """Streamlit 재실행 1회의 루트 스팬 (페이지 이름과 세션 ID 기록)"""
+    if not config.TRACE_ENABLED:
+        return _NOOP
+    session = None
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        session = ctx.session_id if ctx else None
+    except Exception:
+        pass
+    return Span("rerun", {"page": page, "session": session})